@@ -3,4 +3,16 @@ from .elements import *
 from .inputs import *
 from .actions import *
 from .containers import *
-from .adaptive_card import *
\ No newline at end of file
+from .adaptive_card import *
+from .templating import *
+from .lazy import *
+from .bulk import *
+from .query import *
+from .patch import *
+from .caching import *
+from .validation import *
+from .downgrade import *
+from .hosts import *
+from .pagination import *
+from .minify import *
+from .compression import *
\ No newline at end of file
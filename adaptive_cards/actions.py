@@ -7,6 +7,8 @@ from .adaptive_card import AdaptiveCard
 
 
 class MSTeams(MaterialMapping):
+    __slots__ = ()
+
     def __init__(self, __type: str, **kwargs):
         super().__init__(type=__type, **kwargs)
 
@@ -27,6 +29,8 @@ class MSTeams(MaterialMapping):
         return MSTeams("signin", value=url)
 
 class ActionData(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             msteams: Optional[MSTeams]=None,
@@ -39,7 +43,7 @@ class AssociatedInputs(Enum):
     AUTO = "auto"
     NONE = "none"
 
-class ActionSubmit(AdaptiveCardAction):
+class ActionSubmit(AdaptiveCardAction, material_type=MaterialType.ACTION_SUBMIT):
     def __init__(
             self, 
             title: str, 
@@ -73,7 +77,7 @@ class ActionSubmit(AdaptiveCardAction):
     def empty() -> ActionSubmit:
         return ActionSubmit(title="")
     
-class ActionOpenUrl(AdaptiveCardAction):
+class ActionOpenUrl(AdaptiveCardAction, material_type=MaterialType.ACTION_OPEN_URL):
     def __init__(
             self, 
             title: str, 
@@ -103,7 +107,9 @@ class ActionOpenUrl(AdaptiveCardAction):
     def empty() -> ActionOpenUrl:
         return ActionOpenUrl(title="", url="")
 
-class ActionShowCard(AdaptiveCardAction):
+class ActionShowCard(AdaptiveCardAction, material_type=MaterialType.ACTION_SHOW_CARD):
+    child_fields = ("card", "fallback")
+
     def __init__(
             self, 
             title: str, 
@@ -138,7 +144,7 @@ class TargetFreezing(Enum):
     VISIBILITY = True
     INVISIBIITY = False
 
-class TargetElement(AdaptiveCardMaterial):
+class TargetElement(AdaptiveCardMaterial, material_type=MaterialType.TARGET_ELEMENT):
     def __init__(self, __id: str, freeze: TargetFreezing=TargetFreezing.NONE):
 
         super().__init__(
@@ -151,7 +157,9 @@ class TargetElement(AdaptiveCardMaterial):
     def empty() -> TargetElement:
         return TargetElement("")
 
-class ActionToggleVisibility(AdaptiveCardAction):
+class ActionToggleVisibility(AdaptiveCardAction, material_type=MaterialType.ACTION_TOGGLE_VISIBILITY):
+    child_fields = ("targetElements", "fallback")
+
     def __init__(
             self, 
             title: str, 
@@ -183,7 +191,7 @@ class ActionToggleVisibility(AdaptiveCardAction):
     def empty() -> ActionToggleVisibility:
         return ActionToggleVisibility(title="", target_element_ids=[])
 
-class ActionExecute(AdaptiveCardAction):
+class ActionExecute(AdaptiveCardAction, material_type=MaterialType.ACTION_EXECUTE):
     def __init__(
             self, 
             title: str, 
@@ -220,6 +228,8 @@ class ActionExecute(AdaptiveCardAction):
         return ActionExecute(title="")
 
 class ActionSetLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False,
@@ -234,7 +244,9 @@ class ActionSetLayout(MaterialMapping):
             height=height if height else None
         )
 
-class ActionSet(AdaptiveCardMaterial):
+class ActionSet(AdaptiveCardMaterial, material_type=MaterialType.ACTION_SET):
+    child_fields = ("actions", "fallback")
+
     def __init__(
             self,
             actions: List[AdaptiveCardAction]=[],
@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from .material import *
 
 
 class AdaptiveCardLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             minimum_height: Optional[Pixels]=None,
@@ -17,7 +19,10 @@ class AdaptiveCardLayout(MaterialMapping):
             rtl=present_right_to_left
         )
 
-class AdaptiveCard(AdaptiveCardMaterial):
+class AdaptiveCard(AdaptiveCardMaterial, material_type=MaterialType.ADAPTIVE_CARD):
+    child_fields = ("body", "actions", "selectAction")
+    __ids: Optional[dict[str, list[AdaptiveCardMaterial | dict]]] = None
+
     def __init__(
             self,
             body: List[AdaptiveCardMaterial]=[],
@@ -46,6 +51,72 @@ class AdaptiveCard(AdaptiveCardMaterial):
         if schema:
             self.update(**{"$schema": schema})
     
+    def __index(self) -> dict[str, list[AdaptiveCardMaterial | dict]]:
+        if self.__ids is None:
+            self.__ids = dict()
+            self.__duplicates: set[str] = set()
+            self.__toggles: list[AdaptiveCardMaterial | dict] = []
+            self._subtree_changed([], [(node, node.get("id")) for node in self.walk()])
+        
+        return self.__ids
+    
+    def _watching(self) -> bool:
+        return self.__ids is not None
+    
+    def _subtree_changed(self, __removed: list[tuple[AdaptiveCardMaterial | dict, Optional[str]]], __added: list[tuple[AdaptiveCardMaterial | dict, Optional[str]]]):
+        for node, identifier in __removed:
+            nodes = self.__ids.get(identifier, ())
+            for index, entry in enumerate(nodes):
+                if entry is node:
+                    del nodes[index]
+                    break
+            
+            if len(nodes) < 2:
+                self.__duplicates.discard(identifier)
+            if not nodes:
+                self.__ids.pop(identifier, None)
+            
+            if node.get("type") == MaterialType.ACTION_TOGGLE_VISIBILITY.value:
+                for index, entry in enumerate(self.__toggles):
+                    if entry is node:
+                        del self.__toggles[index]
+                        break
+        
+        for node, identifier in __added:
+            if identifier is not None:
+                nodes = self.__ids.setdefault(identifier, [])
+                nodes.append(node)
+
+                if len(nodes) > 1:
+                    self.__duplicates.add(identifier)
+            
+            if node.get("type") == MaterialType.ACTION_TOGGLE_VISIBILITY.value:
+                self.__toggles.append(node)
+    
+    def find_by_id(self, __id: str) -> Optional[AdaptiveCardMaterial | dict]:
+        nodes = self.__index().get(__id)
+        return nodes[0] if nodes else None
+    
+    def find_all_by_id(self, __id: str) -> List[AdaptiveCardMaterial | dict]:
+        return list(self.__index().get(__id, ()))
+    
+    @property
+    def duplicate_ids(self) -> set[str]:
+        self.__index()
+        return set(self.__duplicates)
+    
+    @property
+    def dangling_targets(self) -> List[str]:
+        index = self.__index()
+        dangling = dict()
+        for toggle in self.__toggles:
+            for target in toggle.get("targetElements") or ():
+                target: Any = target if isinstance(target, str) else target.get("elementId")
+                if target not in index:
+                    dangling[target] = None
+        
+        return list(dangling)
+    
     @staticmethod
     def empty() -> AdaptiveCard:
         return AdaptiveCard()
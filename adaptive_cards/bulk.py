@@ -0,0 +1,98 @@
+from __future__ import annotations
+from typing import List, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from argparse import ArgumentParser
+import os
+import sys
+
+from .material import *
+from .adaptive_card import AdaptiveCard
+from .validation import CardValidator
+
+
+class CardError(NamedTuple):
+    offset: int
+    message: str
+
+class BulkReport(NamedTuple):
+    cards: int
+    errors: List[CardError]
+
+    @property
+    def valid(self) -> int:
+        return self.cards - len(self.errors)
+
+def _chunks(__size: int, __count: int) -> List[tuple[int, int]]:
+    step = max(1, -(-__size // __count))
+    return [(start, min(start + step, __size)) for start in range(0, __size, step)]
+
+def _process(__path: str, __start: int, __end: int, __validate: bool=False) -> BulkReport:
+    cards = 0
+    errors = []
+    validator = CardValidator() if __validate else None
+
+    with open(__path, "rb") as file:
+        if __start:
+            file.seek(__start - 1)
+            if file.read(1) != b"\n":
+                file.readline()
+
+        position = file.tell()
+        while position < __end:
+            line = file.readline()
+            if not line:
+                break
+
+            offset = position
+            position += len(line)
+
+            if not line.strip():
+                continue
+
+            cards += 1
+            try:
+                card = AdaptiveCard.from_json(line)
+            except Exception as error:
+                errors.append(CardError(offset, f"{error.__class__.__name__}: {error}"))
+                continue
+
+            if validator is not None:
+                problems = validator.validate(card)
+                if problems:
+                    errors.append(CardError(offset, "; ".join([f"{problem.pointer or '/'}: {problem.message}" for problem in problems])))
+
+    return BulkReport(cards, errors)
+
+def validate_jsonl(__path: str, workers: Optional[int]=None, chunk_size: int=1 << 23, schema: bool=False) -> BulkReport:
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(__path)
+    chunks = _chunks(size, max(workers * 4, -(-size // chunk_size)))
+
+    if workers == 1:
+        reports = [_process(__path, start, end, schema) for start, end in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(_process, [__path] * len(chunks), *zip(*chunks), [schema] * len(chunks)))
+
+    return BulkReport(
+        sum(report.cards for report in reports),
+        [error for report in reports for error in report.errors]
+    )
+
+def main(__arguments: Optional[List[str]]=None) -> int:
+    parser = ArgumentParser(prog="python -m adaptive_cards", description="Parse and hydrate every card of a JSONL file.")
+    parser.add_argument("path", help="JSONL file with one card per line")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=1 << 23, help="maximum bytes per chunk handed to a worker")
+    parser.add_argument("--schema", action="store_true", help="also validate every card against the schema of its version")
+    arguments = parser.parse_args(__arguments)
+
+    report = validate_jsonl(arguments.path, workers=arguments.workers, chunk_size=arguments.chunk_size, schema=arguments.schema)
+
+    for error in sorted(report.errors):
+        print(f"{arguments.path}@{error.offset}: {error.message}")
+
+    print(f"{report.cards} cards, {report.valid} valid, {len(report.errors)} with errors", file=sys.stderr)
+    return 1 if report.errors else 0
+
+__all__ = ['CardError', 'BulkReport', 'validate_jsonl']
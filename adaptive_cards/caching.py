@@ -0,0 +1,189 @@
+from __future__ import annotations
+from typing import Any, FrozenSet, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import blake2b
+from json import dumps, loads
+import os
+import time
+
+from .templating import CardTemplate
+from .downgrade import downgrade
+from .hosts import HostProfile
+
+
+class RenderCacheBackend(ABC):
+    @abstractmethod
+    def get(self, __key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, __key: str, __value: bytes):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+class MemoryCacheBackend(RenderCacheBackend):
+    def __init__(self, maxsize: int=1024, ttl: Optional[float]=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, __key: str) -> Optional[bytes]:
+        entry = self.__entries.get(__key)
+        if entry is None:
+            return None
+
+        if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self.__entries[__key]
+            return None
+
+        self.__entries.move_to_end(__key)
+        return entry[1]
+
+    def set(self, __key: str, __value: bytes):
+        self.__entries[__key] = (time.monotonic(), __value)
+        self.__entries.move_to_end(__key)
+
+        while len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+
+    def clear(self):
+        self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+class DiskCacheBackend(RenderCacheBackend):
+    def __init__(self, directory: str, maxsize: Optional[int]=None, ttl: Optional[float]=None):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__entries: Optional[OrderedDict[str, None]] = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __path(self, __key: str) -> str:
+        return os.path.join(self.directory, __key + ".json")
+
+    def __index(self) -> OrderedDict[str, None]:
+        if self.__entries is None:
+            files = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    files.append((entry.stat().st_mtime, entry.name[:-5]))
+
+            self.__entries = OrderedDict((key, None) for mtime, key in sorted(files))
+
+        return self.__entries
+
+    def __remove(self, __key: str):
+        self.__index().pop(__key, None)
+        try:
+            os.remove(self.__path(__key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, __key: str) -> Optional[bytes]:
+        path = self.__path(__key)
+        try:
+            if self.ttl is not None and time.time() - os.stat(path).st_mtime > self.ttl:
+                self.__remove(__key)
+                return None
+
+            with open(path, "rb") as file:
+                value = file.read()
+        except FileNotFoundError:
+            self.__index().pop(__key, None)
+            return None
+
+        if __key in self.__index():
+            self.__index().move_to_end(__key)
+
+        return value
+
+    def set(self, __key: str, __value: bytes):
+        path = self.__path(__key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary, "wb") as file:
+            file.write(__value)
+        os.replace(temporary, path)
+
+        entries = self.__index()
+        entries[__key] = None
+        entries.move_to_end(__key)
+
+        while self.maxsize is not None and len(entries) > self.maxsize:
+            self.__remove(next(iter(entries)))
+
+    def clear(self):
+        for key in list(self.__index()):
+            self.__remove(key)
+
+    def __len__(self) -> int:
+        return len(self.__index())
+
+_HOSTS = {profile.name.lower(): profile for profile in (HostProfile.TEAMS, HostProfile.OUTLOOK, HostProfile.WEBEX, HostProfile.GENERIC)}
+
+def _target(__host: Optional[HostProfile | str], __version: Optional[str | float]) -> tuple[Optional[str], FrozenSet[str]]:
+    if isinstance(__host, str):
+        profile = _HOSTS.get(__host.lower())
+        if profile is None:
+            raise KeyError(f"Unknown host '{__host}'. Expected a 'HostProfile' or one of: {', '.join(_HOSTS)}.")
+        __host = profile
+
+    if __host is not None and not isinstance(__host, HostProfile):
+        raise TypeError(f"Expected a 'HostProfile', got '{__host.__class__.__name__}'.")
+
+    version = __version if __version is not None else __host.version if __host is not None else None
+    return (str(version) if version is not None else None), (__host.exclude_types if __host is not None else frozenset())
+
+class RenderCache:
+    def __init__(self, backend: Optional[RenderCacheBackend]=None):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(__template: CardTemplate, __data: Any, host: Optional[HostProfile | str]=None, version: Optional[str | float]=None) -> str:
+        version, excluded = _target(host, version)
+        hasher = blake2b(__template.etag.encode(), digest_size=20)
+        hasher.update(dumps(__data, sort_keys=True, separators=(",", ":")).encode())
+        hasher.update(dumps([version, sorted(excluded)]).encode())
+        return hasher.hexdigest()
+
+    def render(self, __template: CardTemplate, __data: Any, host: Optional[HostProfile | str]=None, version: Optional[str | float]=None) -> bytes:
+        key = self.key(__template, __data, host, version)
+        value = self.backend.get(key)
+
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        rendered = __template.render(__data)
+        target, excluded = _target(host, version)
+
+        if target is not None:
+            rendered = dumps(downgrade(loads(rendered), target, excluded))
+
+        value = rendered.encode()
+        self.backend.set(key, value)
+        return value
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+__all__ = ['RenderCacheBackend', 'MemoryCacheBackend', 'DiskCacheBackend', 'RenderCache']
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from typing import Iterable, NamedTuple
+from collections import Counter
+from json import dumps, loads
+import re
+import zlib
+
+from .material import *
+
+
+class CardDictionary(NamedTuple):
+    version: int
+    data: bytes
+
+_FRAGMENT = re.compile(rb'(?:\{|\[|, )?"(?:[^"\\]|\\.)*": (?:"(?:[^"\\]|\\.)*"|true|false|null|-?\d+(?:\.\d+)?|\{|\[)')
+_WINDOW = 32768
+
+_SEGMENTS = (
+    ', "max": 15, "min": 0{"width": 1, "rows": [, "card": {, "pages": [, "facts": [, "cells": [, "images": [',
+    ', "loop": true, "id": "name", "id": "date", "choices": [, "title": "OK", "timer": 5000, "id": "start"',
+    ', "id": "hours", "id": "agree"{"type": "Table", "title": "Log", "id": "choice", "bleed": false',
+    '{"type": "Column", "width": "auto", "title": "View", "title": "Send", "size": "Small", "size": "Large"',
+    ', "label": "Name", "label": "Date", "id": "details", "id": "comment"{"type": "FactSet", "version": "1.6"',
+    ', "verb": "reject", "label": "Start", "label": "Hours", "isSubtle": true, "initialPage": 0{"type": "TableRow"',
+    '{"type": "ImageSet"{"type": "Carousel", "verb": "approve", "valueOn": "true", "title": "Reject"',
+    ', "style": "Person", "spacing": "None"{"type": "TableCell"{"type": "Container"{"type": "ColumnSet"',
+    ', "title": "I agree", "title": "Details", "title": "Comment", "title": "Approve", "isVisible": false',
+    '{"type": "Input.Time"{"type": "Input.Date", "valueOff": "false", "targetElements": [, "style": "emphasis"',
+    ', "label": "Category", "isMultiline": true, "isMultiline": false"type": "AdaptiveCard"{"type": "Input.Toggle"',
+    '{"type": "Input.Number"{"type": "CarouselPage"{"type": "Action.OpenUrl"{"type": "Action.Execute"',
+    '{"type": "Input.ChoiceSet"{"type": "Action.ShowCard", "firstRowAsHeaders": true, "placeholder": "Your name"',
+    ', "columns": [{"type": "Image", "placeholder": "Add a comment", "data": {{"type": "Action.ToggleVisibility"',
+    ', "size": "Medium"{"type": "Input.Text", "items": [, "actions": [, "body": [{"type": "Action.Submit"',
+    ', "wrap": true, "associatedInputs": "auto", "version": "1.5", "weight": "Bolder"{"type": "TextBlock"',
+    ', "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"{"type": "AdaptiveCard"'
+)
+
+CardDictionary.DEFAULT = CardDictionary(1, "".join(_SEGMENTS).encode())
+
+def _encode(__card: AdaptiveCardMaterial | dict) -> bytes:
+    if isinstance(__card, AdaptiveCardMaterial):
+        return __card.to_bytes()
+
+    if isinstance(__card, dict):
+        return dumps(__card).encode()
+
+    raise TypeError(f"Cannot compress an object of type '{__card.__class__.__name__}'.")
+
+def train_dictionary(__cards: Iterable[AdaptiveCardMaterial | dict], __version: int, size: int=4096) -> CardDictionary:
+    if not 0 < __version < 256:
+        raise ValueError(f"Invalid dictionary version {__version}. Expected a number between 1 and 255.")
+
+    if not 0 < size <= _WINDOW:
+        raise ValueError(f"Invalid dictionary size {size}. Expected a number between 1 and {_WINDOW}.")
+
+    counts = Counter()
+    cards = 0
+    for card in __cards:
+        counts.update(set(_FRAGMENT.findall(_encode(card))))
+        cards += 1
+
+    threshold = max(2, cards // 100)
+    ranked = sorted([fragment for fragment, count in counts.items() if count >= threshold], key=lambda fragment: (-counts[fragment] * len(fragment), fragment))
+    chosen = []
+    used = 0
+
+    for fragment in ranked:
+        if used + len(fragment) > size:
+            continue
+
+        chosen.append(fragment)
+        used += len(fragment)
+
+    return CardDictionary(__version, b"".join(reversed(chosen)))
+
+def compress_card(__card: AdaptiveCardMaterial | dict, dictionary: CardDictionary=CardDictionary.DEFAULT, level: int=9) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary.data)
+    return bytes([dictionary.version]) + compressor.compress(_encode(__card)) + compressor.flush()
+
+def decompress_card(__payload: bytes, dictionaries: Iterable[CardDictionary]=()) -> dict:
+    if not __payload:
+        raise ValueError("Cannot decompress an empty payload.")
+
+    known = {dictionary.version: dictionary for dictionary in (CardDictionary.DEFAULT, *dictionaries)}
+    dictionary = known.get(__payload[0])
+
+    if dictionary is None:
+        raise KeyError(f"Unknown dictionary version {__payload[0]}. Pass the dictionary the payload was compressed with.")
+
+    decompressor = zlib.decompressobj(-15, zdict=dictionary.data)
+    return loads(decompressor.decompress(__payload[1:]) + decompressor.flush())
+
+__all__ = ['CardDictionary', 'train_dictionary', 'compress_card', 'decompress_card']
@@ -17,6 +17,8 @@ class ContainerTheme(Enum):
     WARNING = "warning"
 
 class ContainerStyle(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             theme: ContainerTheme=ContainerTheme.UNSET, 
@@ -25,6 +27,8 @@ class ContainerStyle(MaterialMapping):
         super().__init__(style=theme, bleed=bleed)
 
 class ContainerLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             separator: bool=False, 
@@ -45,7 +49,9 @@ class ContainerLayout(MaterialMapping):
             rtl=present_right_to_left or None
         )
 
-class Container(AdaptiveCardMaterial):
+class Container(AdaptiveCardMaterial, material_type=MaterialType.CONTAINER):
+    child_fields = ("items", "selectAction", "fallback")
+
     def __init__(
             self,
             items: List[AdaptiveCardMaterial]=[],
@@ -79,6 +85,8 @@ class ColumnWidth(Enum):
     STRETCH = "stretch"
 
 class ColumnLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -101,7 +109,9 @@ class ColumnLayout(MaterialMapping):
             rtl=present_right_to_left or None
         )
 
-class Column(AdaptiveCardMaterial):
+class Column(AdaptiveCardMaterial, material_type=MaterialType.COLUMN):
+    child_fields = ("items", "selectAction", "fallback")
+
     def __init__(
             self,
             items: List[AdaptiveCardMaterial]=[],
@@ -130,6 +140,8 @@ class Column(AdaptiveCardMaterial):
         return Column()
 
 class ColumnSetLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -146,7 +158,9 @@ class ColumnSetLayout(MaterialMapping):
             minHeight=minimum_height
         )
 
-class ColumnSet(AdaptiveCardMaterial):
+class ColumnSet(AdaptiveCardMaterial, material_type=MaterialType.COLUMN_SET):
+    child_fields = ("columns", "selectAction", "fallback")
+
     def __init__(
             self,
             columns: List[Column]=[],
@@ -173,6 +187,8 @@ class ColumnSet(AdaptiveCardMaterial):
         return ColumnSet()
 
 class FactSetLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -186,10 +202,14 @@ class FactSetLayout(MaterialMapping):
         )
 
 class Fact(MaterialMapping):
+    __slots__ = ()
+
     def __init__(self, title: str, value: str):
         super().__init__(title=title, value=value)
 
-class FactSet(AdaptiveCardMaterial):
+class FactSet(AdaptiveCardMaterial, material_type=MaterialType.FACT_SET):
+    child_fields = ("fallback",)
+
     def __init__(
             self,
             facts: List[Fact]=[],
@@ -212,6 +232,8 @@ class FactSet(AdaptiveCardMaterial):
         return FactSet()
 
 class ImageSetLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -226,7 +248,9 @@ class ImageSetLayout(MaterialMapping):
             height=height
         )
 
-class ImageSet(AdaptiveCardMaterial):
+class ImageSet(AdaptiveCardMaterial, material_type=MaterialType.IMAGE_SET):
+    child_fields = ("images", "fallback")
+
     def __init__(
             self,
             images: List[Image]=[],
@@ -251,6 +275,8 @@ class ImageSet(AdaptiveCardMaterial):
         return ImageSet()
 
 class TableLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -269,7 +295,9 @@ class TableLayout(MaterialMapping):
             verticalCellContentAlignment=vertical_cell_content_alignment
         )
 
-class TableCell(AdaptiveCardMaterial):
+class TableCell(AdaptiveCardMaterial, material_type=MaterialType.TABLE_CELL):
+    child_fields = ("items", "selectAction")
+
     def __init__(
             self,
             items: List[AdaptiveCardMaterial]=[],
@@ -297,7 +325,9 @@ class TableCell(AdaptiveCardMaterial):
     def empty() -> TableCell:
         return TableCell()
 
-class TableRow(AdaptiveCardMaterial):
+class TableRow(AdaptiveCardMaterial, material_type=MaterialType.TABLE_ROW):
+    child_fields = ("cells",)
+
     def __init__(
             self,
             cells: List[TableCell]=[],
@@ -322,6 +352,8 @@ class TableRow(AdaptiveCardMaterial):
         return TableRow()
 
 class GridStyle(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             theme: Optional[ContainerTheme]=None,
@@ -332,7 +364,9 @@ class GridStyle(MaterialMapping):
             showGridLines=lines
         )
 
-class Table(AdaptiveCardMaterial):
+class Table(AdaptiveCardMaterial, material_type=MaterialType.TABLE):
+    child_fields = ("rows", "fallback")
+
     def __init__(
             self,
             rows: List[TableRow]=[],
@@ -369,7 +403,9 @@ class Table(AdaptiveCardMaterial):
     def empty() -> Table:
         return Table()
 
-class CarouselPage(AdaptiveCardMaterial):
+class CarouselPage(AdaptiveCardMaterial, material_type=MaterialType.CAROUSEL_PAGE):
+    child_fields = ("items", "selectAction")
+
     def __init__(
             self,
             items: List[AdaptiveCardMaterial]=[],
@@ -397,7 +433,9 @@ class CarouselPage(AdaptiveCardMaterial):
     def empty() -> CarouselPage:
         return CarouselPage()
 
-class Carousel(AdaptiveCardMaterial):
+class Carousel(AdaptiveCardMaterial, material_type=MaterialType.CAROUSEL):
+    child_fields = ("pages", "fallback")
+
     def __init__(
             self,
             pages: List[CarouselPage]=[],
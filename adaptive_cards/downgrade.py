@@ -0,0 +1,214 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional
+from functools import lru_cache
+from collections import OrderedDict
+
+from .material import *
+from .validation import _SPECS, _text, _version
+
+
+_KEPT = ("id", "isVisible", "separator", "spacing", "height", "requires")
+
+def _table(__node: dict) -> dict:
+    columns = __node.get("columns") if isinstance(__node.get("columns"), list) else []
+    rows = [row for row in __node.get("rows") or [] if isinstance(row, dict)]
+    headers = __node.get("firstRowAsHeaders", __node.get("firstRowAsHeader", True))
+    lines = __node.get("showGridLines", True)
+    sets = []
+
+    for index, row in enumerate(rows):
+        cells = []
+        for position, cell in enumerate(row.get("cells") or []):
+            if not isinstance(cell, dict):
+                continue
+
+            column = {key: value for key, value in cell.items() if key != "type"}
+            column["type"] = MaterialType.COLUMN.value
+            column.setdefault("items", [])
+            if position < len(columns) and isinstance(columns[position], dict) and "width" in columns[position]:
+                column["width"] = columns[position]["width"]
+
+            if "verticalContentAlignment" not in column and "verticalCellContentAlignment" in row:
+                column["verticalContentAlignment"] = row["verticalCellContentAlignment"]
+
+            cells.append(column)
+
+        columns_set = {"type": MaterialType.COLUMN_SET.value, "columns": cells}
+        if "id" in row:
+            columns_set["id"] = row["id"]
+
+        if index and lines:
+            columns_set["separator"] = True
+
+        if row.get("style"):
+            columns_set["style"] = row["style"]
+        elif index == 0 and headers:
+            columns_set["style"] = "emphasis"
+
+        sets.append(columns_set)
+
+    container = {key: __node[key] for key in _KEPT if key in __node}
+    container.update(type=MaterialType.CONTAINER.value, items=sets)
+    return container
+
+def _carousel(__node: dict) -> Optional[dict]:
+    pages = [page for page in __node.get("pages") or [] if isinstance(page, dict)]
+    if not pages:
+        return None
+
+    container = {key: value for key, value in pages[0].items() if key != "type"}
+    container.update({key: __node[key] for key in _KEPT + ("minHeight", "backgroundImage", "verticalContentAlignment", "rtl") if key in __node})
+    container["type"] = MaterialType.CONTAINER.value
+    container.setdefault("items", [])
+    return container
+
+def _execute(__node: dict) -> dict:
+    action = {key: value for key, value in __node.items() if key not in ("type", "verb", "fallback")}
+    action["type"] = MaterialType.ACTION_SUBMIT.value
+
+    if "verb" in __node and isinstance(__node.get("data", {}), dict):
+        action["data"] = {"verb": __node["verb"], **__node.get("data", {})}
+
+    return action
+
+_REPLACEMENTS: dict[str, Callable[[dict], Optional[dict]]] = {
+    MaterialType.TABLE.value: _table,
+    MaterialType.CAROUSEL.value: _carousel,
+    MaterialType.ACTION_EXECUTE.value: _execute
+}
+
+@lru_cache(maxsize=32)
+def _rules(__version: tuple[int, int], __excluded: frozenset[str]=frozenset()) -> dict[str, dict[str, Optional[str]]]:
+    rules = dict()
+
+    for kind, (since, properties, required) in _SPECS.items():
+        if _version(since) > __version or kind in __excluded:
+            continue
+
+        rules[kind] = {
+            name: None if _version(spec_since) > __version else spec[0] if isinstance(spec[0], str) else "value"
+            for name, (spec, spec_since) in properties.items()
+        }
+
+    return rules
+
+_DROPPED = object()
+
+def _resolve(__node: Any, __rules: dict) -> tuple[Any, Optional[dict]]:
+    source = None
+    while isinstance(__node, dict) and __rules.get(__node.get("type")) is None:
+        fallback = __node.get("fallback")
+        if isinstance(fallback, dict):
+            __node = fallback
+            continue
+
+        replacement = _REPLACEMENTS.get(__node.get("type")) if fallback != "drop" else None
+        source = source if source is not None or replacement is None else __node
+        __node = replacement(__node) if replacement is not None else None
+
+    return __node, source
+
+def _downgrade_node(__node: Any, __version: tuple[int, int], __rules: dict, __replaced: Optional[dict[int, dict]]=None) -> Any:
+    root = [__node]
+    stack = [(root, 0)]
+    dropped = []
+
+    while stack:
+        container, slot = stack.pop()
+        node, source = _resolve(container[slot], __rules)
+
+        if node is None:
+            container[slot] = _DROPPED
+            dropped.append(container)
+            continue
+
+        if not isinstance(node, dict):
+            container[slot] = node
+            continue
+
+        kind = node.get("type")
+        rule = __rules[kind]
+        result = dict()
+        for key, value in node.items():
+            handling = rule.get(key, "value")
+
+            if handling is None:
+                continue
+
+            if handling in ("children", "targets") and isinstance(value, list):
+                value = list(value)
+                stack.extend([(value, index) for index in reversed(range(len(value)))])
+            elif handling in ("children", "fallback") and isinstance(value, dict):
+                stack.append((result, key))
+
+            result[key] = value
+
+        if kind == MaterialType.ADAPTIVE_CARD.value:
+            declared = _version(result.get("version"))
+            if declared is None or declared > __version:
+                result["version"] = _text(__version)
+
+        container[slot] = result
+        if __replaced is not None and source is not None:
+            __replaced[id(result)] = source
+
+    for container in dropped:
+        if isinstance(container, dict):
+            for key in [key for key, value in container.items() if value is _DROPPED]:
+                del container[key]
+        else:
+            container[:] = [item for item in container if item is not _DROPPED]
+
+    return None if root[0] is _DROPPED else root[0]
+
+def _materialize(__class: type[AdaptiveCardMaterial], __data: dict, __rules: dict) -> AdaptiveCardMaterial:
+    card = __class.from_json(__data)
+
+    for node in card.walk():
+        rule = __rules.get(node.type.value, {}) if isinstance(node, AdaptiveCardMaterial) else {}
+        unsupported = {key: None for key in node.__dict__ if rule.get(key, "value") is None}
+        if unsupported:
+            node.update(**unsupported)
+
+    return card
+
+_CACHE: OrderedDict[tuple[bytes, tuple[int, int], frozenset[str]], AdaptiveCardMaterial] = OrderedDict()
+_CACHE_SIZE = 256
+
+def _downgrade_material(__card: AdaptiveCardMaterial, __version: tuple[int, int], __excluded: frozenset[str]) -> AdaptiveCardMaterial:
+    key = (__card.content_hash, __version, __excluded)
+    result = _CACHE.get(key)
+
+    if result is None:
+        rules = _rules(__version, __excluded)
+        result = _CACHE[key] = _materialize(__card.__class__, _downgrade_node(__card.__dict__, __version, rules), rules)
+
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    
+    _CACHE.move_to_end(key)
+    return result
+
+def _arguments(__card: AdaptiveCardMaterial | dict, __version: str | float, __exclude_types: Iterable[MaterialType | str]) -> tuple[tuple[int, int], frozenset[str]]:
+    if not isinstance(__card, (AdaptiveCardMaterial, dict)):
+        raise TypeError(f"Cannot downgrade an object of type '{__card.__class__.__name__}'.")
+
+    version = _version(__version)
+    if version is None:
+        raise ValueError(f"Invalid version '{__version}'. Expected a version such as '1.5'.")
+
+    root = __card.__dict__ if isinstance(__card, AdaptiveCardMaterial) else __card
+    if root.get("type") != MaterialType.ADAPTIVE_CARD.value:
+        raise TypeError(f"Cannot downgrade a '{root.get('type')}'. Expected an 'AdaptiveCard'.")
+
+    return version, frozenset([kind.value if isinstance(kind, MaterialType) else MaterialType(kind).value for kind in __exclude_types])
+
+def downgrade(__card: AdaptiveCardMaterial | dict, __version: str | float, exclude_types: Iterable[MaterialType | str]=()) -> AdaptiveCardMaterial | dict:
+    version, excluded = _arguments(__card, __version, exclude_types)
+
+    if isinstance(__card, dict):
+        return _downgrade_node(__card, version, _rules(version, excluded))
+
+    return _downgrade_material(__card, version, excluded).clone(deep=True)
+
+__all__ = ['downgrade']
@@ -31,6 +31,8 @@ class FontWeight(Enum):
     BOLDER = "Bolder"
 
 class TextLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             separator: bool=False, 
@@ -48,6 +50,8 @@ class TextLayout(MaterialMapping):
         )
 
 class TextStyle(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             theme: TextTheme=TextTheme.UNSET,
@@ -66,7 +70,9 @@ class TextStyle(MaterialMapping):
             isSubtle=subtle or None
         )
 
-class TextBlock(AdaptiveCardMaterial):
+class TextBlock(AdaptiveCardMaterial, material_type=MaterialType.TEXT_BLOCK):
+    child_fields = ("fallback",)
+
     def __init__(
             self,
             __text: str,
@@ -99,6 +105,8 @@ class ImageSize(Enum):
     LARGE = "Large"
 
 class ImageLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -123,6 +131,8 @@ class ImageTheme(Enum):
     PERSON = "Person"
 
 class ImageStyle(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             theme: ImageTheme=ImageTheme.UNSET,
@@ -133,7 +143,9 @@ class ImageStyle(MaterialMapping):
             backgroundColor=background_color
         )
 
-class Image(AdaptiveCardMaterial):
+class Image(AdaptiveCardMaterial, material_type=MaterialType.IMAGE):
+    child_fields = ("selectAction", "fallback")
+
     def __init__(
             self,
             __url: str,
@@ -160,6 +172,8 @@ class Image(AdaptiveCardMaterial):
         return Image("")
 
 class MediaLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             separator: bool=False, 
@@ -186,6 +200,8 @@ class CaptionMimeType(Enum):
     DFXP = "application/ttaf+xml"
 
 class MediaSource(MaterialMapping):
+    __slots__ = ()
+
     def __init__(self, __url: str, mime_type: Optional[MediaMimeType | str]=None):
         
         super().__init__(
@@ -194,6 +210,8 @@ class MediaSource(MaterialMapping):
         )
 
 class MediaCaptions(MaterialMapping):
+    __slots__ = ()
+
     def __init__(self, __url: str, label: str, mime_type: Optional[CaptionMimeType | str]=None):
         
         super().__init__(
@@ -202,7 +220,9 @@ class MediaCaptions(MaterialMapping):
             mimeType=mime_type
         )
 
-class Media(AdaptiveCardMaterial):
+class Media(AdaptiveCardMaterial, material_type=MaterialType.MEDIA):
+    child_fields = ("fallback",)
+
     def __init__(
             self,
             sources: List[MediaSource]=[],
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from typing import Any, FrozenSet, List, NamedTuple, Optional
+from json import dumps, loads
+
+from .material import *
+from .adaptive_card import AdaptiveCard
+from .downgrade import _arguments, _downgrade_node, _materialize, _rules
+from .minify import _strip_material
+from .validation import CardValidator, ValidationError
+
+
+class HostProfile(NamedTuple):
+    name: str
+    version: str
+    max_size: Optional[int] = None
+    exclude_types: FrozenSet[str] = frozenset()
+
+HostProfile.TEAMS = HostProfile("Teams", "1.5", 28000)
+HostProfile.OUTLOOK = HostProfile("Outlook", "1.4", None, frozenset([MaterialType.MEDIA.value]))
+HostProfile.WEBEX = HostProfile("Webex", "1.3", 22000, frozenset([MaterialType.MEDIA.value]))
+HostProfile.GENERIC = HostProfile("Generic", "1.6")
+
+class FitResult(NamedTuple):
+    cards: List[AdaptiveCardMaterial]
+    sizes: List[int]
+    applied: List[str]
+    errors: List[ValidationError]
+
+    @property
+    def payloads(self) -> List[bytes]:
+        return [_compact(card.__dict__).encode() for card in self.cards]
+
+_DECORATIONS = (
+    "backgroundImage", "separator", "spacing", "horizontalAlignment", "verticalContentAlignment", "minHeight", "bleed",
+    "iconUrl", "tooltip", "color", "isSubtle", "fontType", "backgroundColor", "gridStyle"
+)
+_TEXT_LIMIT = 200
+_ELLIPSIS = "..."
+
+def _compact(__value: Any) -> str:
+    return dumps(__value, separators=(",", ":"))
+
+def _size(__value: Any) -> int:
+    return len(_compact(__value))
+
+def _sizeof(__value: Any) -> int:
+    return __value.compact_size if isinstance(__value, AdaptiveCardMaterial) else _size(__value)
+
+class _Fitter:
+    def __init__(self, __card: AdaptiveCardMaterial, __profile: HostProfile, __version: tuple[int, int], __replaced: list[tuple[AdaptiveCardMaterial, dict]]):
+        self.profile = __profile
+        self.version = __version
+        self.budget = __profile.max_size
+        self.card = __card
+        self.replaced = __replaced
+        self.size = __card.encoded_size
+        self.overflow: List[AdaptiveCardMaterial] = []
+        self.applied: List[str] = []
+
+    def fits(self) -> bool:
+        return self.size <= self.budget
+
+    def minify(self):
+        _strip_material(self.card, self.version)
+        self.size = self.card.compact_size
+
+    def decorations(self):
+        for node in self.card.walk():
+            if self.fits():
+                return
+
+            if isinstance(node, AdaptiveCardMaterial):
+                removed = {key: None for key in _DECORATIONS if key in node.__dict__}
+                if removed:
+                    size = node.compact_size
+                    node.update(**removed)
+                    self.size -= size - node.compact_size
+
+    def text(self):
+        blocks = [node for node in self.card.walk(MaterialType.TEXT_BLOCK) if isinstance(node, AdaptiveCardMaterial)]
+        blocks = [node for node in blocks if isinstance(node.get("text"), str) and len(node.get("text")) > _TEXT_LIMIT and "${" not in node.get("text")]
+
+        for node in sorted(blocks, key=lambda node: len(node.get("text")), reverse=True):
+            if self.fits():
+                return
+
+            text = node.get("text")
+            keep = max(_TEXT_LIMIT, len(text) - (self.size - self.budget) - len(_ELLIPSIS))
+            truncated = text[:keep].rstrip() + _ELLIPSIS
+            size = node.compact_size
+            node.update(text=truncated)
+            self.size += node.compact_size - size
+
+    def tables(self):
+        tables = [(node, "rows", node.get("firstRowAsHeaders", True)) for node in self.card.walk(MaterialType.TABLE) if isinstance(node, AdaptiveCardMaterial)]
+        tables += [(node, "items", source.get("firstRowAsHeaders", source.get("firstRowAsHeader", True))) for node, source in self.replaced if source.get("type") == MaterialType.TABLE.value]
+
+        for table, field, headers in sorted(tables, key=lambda table: table[0].compact_size, reverse=True):
+            if self.fits():
+                return
+
+            rows = [table._child(row) or row for row in table.get(field) or []]
+            header = rows[:1] if headers else []
+            first = len(header)
+            cut = len(rows)
+
+            while cut > first + 1 and not self.fits():
+                cut -= 1
+                self.size -= _sizeof(rows[cut]) + 1
+
+            if cut == len(rows):
+                continue
+
+            table.update(**{field: rows[:cut]})
+            self.split(table, field, header, rows[cut:])
+
+    def split(self, __table: AdaptiveCardMaterial, __field: str, __header: list, __rows: list):
+        skeleton = {key: value for key, value in __table.__dict__.items() if key not in (__field, "id")}
+        base = _size({"type": MaterialType.ADAPTIVE_CARD.value, "version": self.card.get("version"), "body": [{**skeleton, __field: []}]}) + sum([_sizeof(row) + 1 for row in __header])
+        pages = [[]]
+        size = base
+
+        for index, row in enumerate(__rows):
+            row_size = _sizeof(row) + 1
+            if base + row_size > self.budget:
+                raise ValueError(f"Row at index {index + len(__table.get(__field))} of the table needs {base + row_size} bytes on a card of its own, more than the budget of {self.budget} bytes for {self.profile.name}.")
+
+            if pages[-1] and size + row_size > self.budget:
+                pages.append([])
+                size = base
+
+            pages[-1].append(row)
+            size += row_size
+
+        for page in pages:
+            data = {
+                "type": MaterialType.ADAPTIVE_CARD.value,
+                "version": self.card.get("version"),
+                "body": [{**skeleton, __field: [loads(_compact(row.__dict__ if isinstance(row, AdaptiveCardMaterial) else row)) for row in __header + page]}]
+            }
+            card = self.card.__class__.from_json(data)
+            _strip_material(card, self.version)
+            self.overflow.append(card)
+
+def fit(__card: AdaptiveCardMaterial | dict, __profile: HostProfile) -> FitResult:
+    if not isinstance(__card, (AdaptiveCardMaterial, dict)):
+        raise TypeError(f"Cannot fit an object of type '{__card.__class__.__name__}'.")
+
+    if not isinstance(__profile, HostProfile):
+        raise TypeError(f"Expected a 'HostProfile', got '{__profile.__class__.__name__}'.")
+
+    version, excluded = _arguments(__card, __profile.version, __profile.exclude_types)
+    rules = _rules(version, excluded)
+    replaced = {}
+    data = _downgrade_node(__card.__dict__ if isinstance(__card, AdaptiveCardMaterial) else __card, version, rules, replaced)
+    card = _materialize(AdaptiveCard, data, rules)
+    errors = CardValidator(__profile.version, __profile.exclude_types).validate(card)
+
+    if __profile.max_size is None:
+        return FitResult([card], [card.compact_size], [], errors)
+
+    replaced = [(node, replaced[id(plain)]) for plain, node in zip(iter_elements(data), card.walk()) if id(plain) in replaced and isinstance(node, AdaptiveCardMaterial)]
+    fitter = _Fitter(card, __profile, version, replaced)
+    for name, strategy in (("minify", fitter.minify), ("decorations", fitter.decorations), ("text", fitter.text), ("tables", fitter.tables)):
+        if fitter.fits():
+            break
+
+        fitter.applied.append(name)
+        strategy()
+
+    if "minify" not in fitter.applied:
+        fitter.minify()
+
+    if not fitter.fits():
+        raise ValueError(f"Cannot fit the card into {__profile.max_size} bytes for {__profile.name}. It still needs {fitter.size} bytes.")
+
+    sizes = [fitter.size] + [card.compact_size for card in fitter.overflow]
+    if max(sizes) > __profile.max_size:
+        raise ValueError(f"Cannot fit the overflow card {sizes.index(max(sizes))} into {__profile.max_size} bytes for {__profile.name}. It needs {max(sizes)} bytes.")
+
+    return FitResult([card] + fitter.overflow, sizes, fitter.applied, errors)
+
+__all__ = ['HostProfile', 'FitResult', 'fit']
@@ -8,6 +8,8 @@ from .material import *
 
 
 class InputValidation(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             required: bool=False,
@@ -20,6 +22,8 @@ class InputValidation(MaterialMapping):
         super().__init__(isRequired=required, errorMessage=error_message)
 
 class InputLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             separator: bool=False, 
@@ -33,6 +37,8 @@ class InputLayout(MaterialMapping):
         )
 
 class AdaptiveCardInput(AdaptiveCardMaterial, ABC):
+    child_fields = ("fallback",)
+
     def __init__(
             self,
             __type: InputType,
@@ -62,31 +68,6 @@ class AdaptiveCardInput(AdaptiveCardMaterial, ABC):
     @abstractmethod
     def empty() -> AdaptiveCardInput:
         pass
-    
-    @classmethod
-    def from_dict(cls, __data: dict) -> AdaptiveCardInput:
-        __data = __data.copy()
-        input_type = __data.pop("type", None)
-        input_type = InputType._value2member_map_.get(input_type)
-
-        if input_type is None:
-            raise TypeError(f"Invalid input type.")
-        
-        if cls.__name__=='AdaptiveCardInput':
-            subclasses = [sub.empty() for sub in AdaptiveCardInput.__subclasses__()]
-            __map = {sub.type.value: sub for sub in subclasses}
-
-            __map[input_type.value].update(**__data)
-
-            return __map[input_type.value]
-        
-        component = cls.empty()
-        
-        if component.type.value != input_type.value:
-            raise TypeError(f"Mismatching types. Cannot create an instance of '{component.__class__.__name__}' from a dictionary with its property 'type' being '{input_type.value}'. Expected type was '{component.type.value}'.")
-        
-        component.update(**__data)
-        return component
 
 class ChoiceSetMode(Enum):
     UNSET = None
@@ -95,13 +76,15 @@ class ChoiceSetMode(Enum):
     FILTERED = "filtered"
 
 class InputChoice(MaterialMapping):
+    __slots__ = ()
+
     def __init__(self, title: str, value: Optional[str]=None):
         super().__init__(
             title=title, 
             value=value or title
         )
 
-class InputChoiceSet(AdaptiveCardInput):
+class InputChoiceSet(AdaptiveCardInput, material_type=MaterialType.INPUT_CHOICE_SET):
     def __init__(
             self,
             id: str,
@@ -138,9 +121,11 @@ class InputChoiceSet(AdaptiveCardInput):
     
     @staticmethod
     def empty() -> InputChoiceSet:
-        return InputChoiceSet(id="", label="", choices=[])
+        return InputChoiceSet(id="", choices=[])
 
 class InputTextValidation(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             required: bool=False,
@@ -165,7 +150,9 @@ class InputTextMode(Enum):
     EMAIL = "Email"
     PASSWORD = "Password"
 
-class InputText(AdaptiveCardInput):
+class InputText(AdaptiveCardInput, material_type=MaterialType.INPUT_TEXT):
+    child_fields = ("inlineAction", "fallback")
+
     def __init__(
             self,
             id: str,
@@ -197,9 +184,9 @@ class InputText(AdaptiveCardInput):
     
     @staticmethod
     def empty() -> InputText:
-        return InputText(id="", label="")
+        return InputText(id="")
     
-class InputNumber(AdaptiveCardInput):
+class InputNumber(AdaptiveCardInput, material_type=MaterialType.INPUT_NUMBER):
     def __init__(
             self,
             id: str,
@@ -227,9 +214,9 @@ class InputNumber(AdaptiveCardInput):
     
     @staticmethod
     def empty() -> InputNumber:
-        return InputNumber(id="", label="")
+        return InputNumber(id="")
 
-class InputDate(AdaptiveCardInput):
+class InputDate(AdaptiveCardInput, material_type=MaterialType.INPUT_DATE):
     def __init__(
             self,
             id: str,
@@ -257,9 +244,9 @@ class InputDate(AdaptiveCardInput):
     
     @staticmethod
     def empty() -> InputDate:
-        return InputDate(id="", label="")
+        return InputDate(id="")
 
-class InputTime(AdaptiveCardInput):
+class InputTime(AdaptiveCardInput, material_type=MaterialType.INPUT_TIME):
     def __init__(
             self,
             id: str,
@@ -287,9 +274,9 @@ class InputTime(AdaptiveCardInput):
 
     @staticmethod
     def empty() -> InputTime:
-        return InputTime(id="", label="")
+        return InputTime(id="")
     
-class InputToggle(AdaptiveCardInput):
+class InputToggle(AdaptiveCardInput, material_type=MaterialType.INPUT_TOGGLE):
     def __init__(
             self,
             id: str,
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import Any, Optional
+from collections.abc import Mapping, Sequence
+from json import dumps, loads
+
+from .material import *
+
+
+_UNSET = object()
+
+def _wrap(__raw: Any) -> Any:
+    if isinstance(__raw, dict) and AdaptiveCardMaterial.resolve(__raw.get("type")):
+        return LazyMaterial(__raw)
+
+    if isinstance(__raw, list):
+        return LazyList(__raw)
+
+    return __raw
+
+class LazyMaterial(Mapping):
+    def __init__(self, __data: dict, __source: Optional[str]=None):
+        self.__data = __data
+        self.__source = __source
+        self.__cache = dict()
+
+    @staticmethod
+    def from_json(__json: str | bytes | dict) -> LazyMaterial:
+        if isinstance(__json, dict):
+            return LazyMaterial(__json)
+
+        if isinstance(__json, (bytes, bytearray)):
+            __json = __json.decode()
+
+        data = loads(__json)
+        if not isinstance(data, dict):
+            raise TypeError(f"Cannot lazily load a JSON document of type '{data.__class__.__name__}'.")
+
+        return LazyMaterial(data, __json)
+
+    @property
+    def type(self) -> MaterialType:
+        return MaterialType(self.__data["type"])
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.__data.get("id")
+
+    def __getitem__(self, __key: str) -> Any:
+        value = self.__cache.get(__key, _UNSET)
+
+        if value is _UNSET:
+            value = self.__cache[__key] = _wrap(self.__data[__key])
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __iter__(self):
+        for key in self.__data:
+            yield key
+
+    @property
+    def __dict__(self) -> dict:
+        return self.__data
+
+    def materialize(self) -> AdaptiveCardMaterial:
+        return AdaptiveCardMaterial.from_json(self.__data)
+
+    def __str__(self) -> str:
+        return dumps(self.__data) if self.__source is None else self.__source
+
+class LazyList(Sequence):
+    def __init__(self, __items: list):
+        self.__items = __items
+        self.__cache = [_UNSET] * len(__items)
+
+    def __getitem__(self, __index: int | slice) -> Any:
+        if isinstance(__index, slice):
+            return [self[index] for index in range(*__index.indices(len(self.__items)))]
+
+        value = self.__cache[__index]
+
+        if value is _UNSET:
+            value = self.__cache[__index] = _wrap(self.__items[__index])
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __str__(self) -> str:
+        return dumps(self.__items)
+
+__all__ = ['LazyMaterial', 'LazyList']
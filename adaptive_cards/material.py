@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Optional, Any, Iterable, overload
+from typing import Optional, Any, Callable, Iterable, Iterator, overload
 from abc import ABC, abstractmethod
+from inspect import isabstract
+from collections import OrderedDict
 from collections.abc import Mapping
-from json import dumps
+from io import TextIOBase
+from json import dumps, loads
+from hashlib import blake2b
+from weakref import ref
 from enum import Enum
 
 
@@ -112,6 +117,8 @@ class ActionRole(Enum):
     MENU_ITEM = "MenuItem"
 
 class Material:
+    __slots__ = ()
+
     def __init__(self):
         self.ensure_abstraction(Material)
 
@@ -124,7 +131,11 @@ class Material:
         if isinstance(__value, (Enum, MaterialDynamic)):
             return __value.value
 
-        if isinstance(__value, (AdaptiveCardMaterial, MaterialMapping)):
+        if isinstance(__value, MaterialMapping):
+            __value._freeze()
+            return __value._MaterialMapping__data
+
+        if isinstance(__value, AdaptiveCardMaterial):
             return __value.__dict__
 
         if isinstance(__value, (list, tuple)):
@@ -132,41 +143,111 @@ class Material:
         
         return __value
 
+class InternPool:
+    shared: InternPool
+
+    def __init__(self, maxsize: int=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[tuple, Material] = OrderedDict()
+    
+    def get(self, __class: type[Material], *args, **kwargs) -> Material:
+        names = tuple(sorted(kwargs))
+        values = tuple(map(kwargs.__getitem__, names))
+        key = (__class, args, tuple(map(type, args)), names, values, tuple(map(type, values)))
+
+        try:
+            instance = self.__entries.get(key)
+        except TypeError:
+            return __class(*args, **kwargs)
+
+        if instance is not None:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return instance
+        
+        self.misses += 1
+        instance = self.__entries[key] = __class(*args, **kwargs)
+
+        while len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+        
+        return instance
+    
+    def clear(self):
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+InternPool.shared = InternPool()
+
 class MaterialDynamic(Material):
+    __slots__ = ("__value",)
+
     def __init__(self, __value: Any):
         self.ensure_abstraction(MaterialDynamic)
         self.__value = __value
 
+    @classmethod
+    def intern(cls, *args, **kwargs) -> MaterialDynamic:
+        return InternPool.shared.get(cls, *args, **kwargs)
+
     @property
     def value(self) -> Any:
         return self.__value
+    
+    def __eq__(self, __other: Any) -> bool:
+        return __other.__class__ is self.__class__ and __other.__value == self.__value
+    
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.__value))
 
     def __str__(self) -> str:
         return str(self.__value)
 
 class Weight(MaterialDynamic):
+    __slots__ = ()
+
     def __init__(self, __value: int):
         super().__init__(__value)
 
 class Seconds(MaterialDynamic):
+    __slots__ = ()
+
     def __init__(self, __value: int):
         super().__init__(__value)
 
 class Pixels(MaterialDynamic):
+    __slots__ = ()
+
     def __init__(self, __value: int):
         super().__init__(f"{__value}px")
    
 class MaterialMapping(Material, Mapping):
+    __slots__ = ("__data", "__json", "__frozen")
+
     def __init__(self, **kwargs):
 
         self.ensure_abstraction(MaterialMapping)
 
         self.__data = dict()
+        self.__json: Optional[str] = None
+        self.__frozen = False
         for key in kwargs:
             value = self.read(kwargs[key])
             if value is not None:
                 self.__data[key] = value
     
+    @classmethod
+    def intern(cls, *args, **kwargs) -> MaterialMapping:
+        instance = InternPool.shared.get(cls, *args, **kwargs)
+        instance._freeze()
+        return instance
+    
     @property   
     def __dict__(self):
         return self.__data
@@ -181,10 +262,33 @@ class MaterialMapping(Material, Mapping):
         for key in self.__data:
             yield key
     
+    def _freeze(self):
+        self.__frozen = True
+
+    def __ensure_mutable(self):
+        if self.__frozen:
+            raise TypeError(f"Cannot change a '{self.__class__.__name__}' object that is already part of a material or mapping. Call using() and when() before placing it.")
+
+    def using(self, __data) -> MaterialMapping:
+        self.__ensure_mutable()
+        self.__data["$data"] = __data
+        self.__json = None
+        return self
+
+    def when(self, __condition: str) -> MaterialMapping:
+        self.__ensure_mutable()
+        self.__data["$when"] = __condition
+        self.__json = None
+        return self
+    
     def __str__(self) -> str:
-        return dumps(self.__data)
+        if self.__json is None:
+            self.__json = dumps(self.__data)
+        return self.__json
 
 class MaterialLayout(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self, 
             separator: bool=False, 
@@ -196,7 +300,19 @@ class MaterialLayout(MaterialMapping):
             spacing=spacing
         )
 
+class _Share(ref):
+    __slots__ = ()
+
 class AdaptiveCardMaterial(Material, ABC): 
+    __registry: dict[str, type[AdaptiveCardMaterial]] = dict()
+    child_fields: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, material_type: Optional[MaterialType]=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if material_type is not None:
+            AdaptiveCardMaterial.__registry[material_type.value] = cls
+
     def __init__(
             self, 
             __type: MaterialType,
@@ -207,6 +323,13 @@ class AdaptiveCardMaterial(Material, ABC):
         self.ensure_abstraction(AdaptiveCardMaterial)
 
         self.__data: dict[str, Any] = dict(type=__type.value)
+        self.__json: Optional[str] = None
+        self.__bytes: Optional[bytes] = None
+        self.__hash: Optional[bytes] = None
+        self.__size: Optional[tuple[int, int]] = None
+        self.__parents: list[ref[AdaptiveCardMaterial]] = []
+        self.__children: dict[int, AdaptiveCardMaterial] = dict()
+        self.__repeated = False
 
         if "type" in kwargs:
             del kwargs["type"]
@@ -217,10 +340,15 @@ class AdaptiveCardMaterial(Material, ABC):
         if not visible:
             self.__data["isVisible"] = False
 
+        adopted = dict()
         for key in kwargs:
             value = self.read(kwargs[key])
             if value is not None:
                 self.__data[key] = value
+                self.__collect(kwargs[key], adopted)
+        
+        if adopted:
+            self.__relink(adopted)
     
     @property
     def type(self) -> MaterialType:
@@ -248,51 +376,678 @@ class AdaptiveCardMaterial(Material, ABC):
         if "type" in kwargs:
             raise KeyError(f"You cannot change the attribute type of any '{self.__class__.__name__}' object.")
         
+        self.__ensure_exclusive()
+        
+        size = self.__size
+        watchers = self.__watchers()
+        if watchers:
+            previous = [self.__data.get(key) for key in kwargs]
+            previous_children = self.__children
+            previous_id = self.__data.get("id")
+
+        adopted = dict()
+        structural = False
         for key in kwargs:
             value = self.read(kwargs[key])
+            structural = structural or isinstance(self.__data.get(key), (dict, list)) or isinstance(value, (dict, list))
 
             if value is None:
                 if key in self.__data:
                     del self.__data[key]
             else:
                 self.__data[key] = value
+                self.__collect(kwargs[key], adopted)
+        
+        if structural:
+            self.__relink(adopted)
+        
+        if watchers:
+            current = [self.__data.get(key) for key in kwargs]
+            removed, added = self.__difference(previous, current, previous_children)
+
+            if "id" in kwargs and previous_id != self.__data.get("id"):
+                removed.append((self, previous_id))
+                added.append((self, self.__data.get("id")))
+            
+            for watcher in watchers:
+                watcher._subtree_changed(removed, added)
+        
+        self.__changed(size)
     
     def using(self, __data) -> AdaptiveCardMaterial:
+        self.__ensure_exclusive()
+        size = self.__size
         self.__data["$data"] = __data
+        self.__changed(size)
         return self
 
     def when(self, __condition: str) -> AdaptiveCardMaterial:
+        self.__ensure_exclusive()
+        size = self.__size
         self.__data["$when"] = __condition
+        self.__changed(size)
         return self
     
+    @staticmethod
+    def __collect(__value: Any, __adopted: dict[int, AdaptiveCardMaterial]):
+        if isinstance(__value, AdaptiveCardMaterial):
+            __adopted[id(__value.__data)] = __value
+        elif isinstance(__value, (list, tuple)):
+            for item in __value:
+                if isinstance(item, AdaptiveCardMaterial):
+                    __adopted[id(item.__data)] = item
+    
+    def __relink(self, __adopted: dict[int, AdaptiveCardMaterial], __shared: Optional[dict[int, AdaptiveCardMaterial]]=None):
+        children = dict()
+        occurrences = 0
+        for value in self.__data.values():
+            for item in value if isinstance(value, list) else (value,):
+                if not isinstance(item, dict):
+                    continue
+
+                child = __adopted.get(id(item)) or self.__children.get(id(item))
+                if child is not None and child.__data is item:
+                    children[id(item)] = child
+                    occurrences += 1
+        
+        for key, child in self.__children.items():
+            if children.get(key) is not child:
+                child.__parents = [parent for parent in child.__parents if parent() is not self]
+        
+        for key, child in children.items():
+            if self.__children.get(key) is not child:
+                child.__attach(self, __shared is not None and __shared.get(key) is child)
+        
+        self.__children = children
+        self.__repeated = occurrences > len(children)
+    
+    def __watchers(self) -> list[AdaptiveCardMaterial]:
+        watchers = []
+        stack = [self]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+            if node._watching():
+                watchers.append(node)
+            
+            for parent in node.__parents:
+                parent = parent()
+                if parent is not None:
+                    stack.append(parent)
+        
+        return watchers
+    
+    def __difference(self, __previous: list, __current: list, __children: dict[int, AdaptiveCardMaterial]) -> tuple[list, list]:
+        previous = [item for value in __previous for item in (value if isinstance(value, list) else (value,)) if isinstance(item, dict)]
+        current = [item for value in __current for item in (value if isinstance(value, list) else (value,)) if isinstance(item, dict)]
+        kept = {id(item) for item in previous} & {id(item) for item in current}
+
+        removed = [(node, node.get("id")) for node in self.__descend([item for item in previous if id(item) not in kept], __children)]
+        added = [(node, node.get("id")) for node in self.__descend([item for item in current if id(item) not in kept], self.__children)]
+        return removed, added
+    
+    @staticmethod
+    def __descend(
+            __values: Iterable[Any],
+            __children: dict[int, AdaptiveCardMaterial],
+            __types: Optional[set[str]]=None,
+            __prune: Optional[Callable[[AdaptiveCardMaterial | dict], bool]]=None,
+            __depths: bool=False
+        ) -> Iterator[AdaptiveCardMaterial | dict]:
+        registry = AdaptiveCardMaterial.__registry
+        stack = [(value, __children, 0) for value in reversed(list(__values))]
+        while stack:
+            value, children, depth = stack.pop()
+            if isinstance(value, list):
+                stack.extend([(item, children, depth) for item in reversed(value)])
+                continue
+            
+            if not isinstance(value, dict):
+                continue
+
+            node = children.get(id(value)) if children else None
+            if node is not None and node.__data is value:
+                material, children = node.__class__, node.__children
+            else:
+                node, material, children = value, registry.get(value.get("type")), None
+                if material is None:
+                    continue
+            
+            if __depths:
+                yield node, value, depth
+            elif __types is None or value["type"] in __types:
+                yield node
+            
+            if __prune is not None and __prune(node):
+                continue
+
+            depth += 1
+            for field in reversed(material.child_fields):
+                child = value.get(field)
+                if isinstance(child, list):
+                    stack.extend([(item, children, depth) for item in reversed(child)])
+                elif child is not None:
+                    stack.append((child, children, depth))
+    
+    def walk(self, *types: MaterialType | str, prune: Optional[Callable[[AdaptiveCardMaterial | dict], bool]]=None) -> Iterator[AdaptiveCardMaterial | dict]:
+        return iter_elements(self, *types, prune=prune)
+    
+    @staticmethod
+    def _elements(
+            __root: AdaptiveCardMaterial | dict,
+            __types: Optional[set[str]]=None,
+            __prune: Optional[Callable[[AdaptiveCardMaterial | dict], bool]]=None,
+            __depths: bool=False
+        ) -> Iterator[AdaptiveCardMaterial | dict]:
+        if isinstance(__root, AdaptiveCardMaterial):
+            return AdaptiveCardMaterial.__descend([__root.__data], {id(__root.__data): __root}, __types, __prune, __depths)
+        
+        return AdaptiveCardMaterial.__descend([__root], {}, __types, __prune, __depths)
+    
+    def _watching(self) -> bool:
+        return False
+    
+    def _subtree_changed(self, __removed: list[tuple[AdaptiveCardMaterial | dict, Optional[str]]], __added: list[tuple[AdaptiveCardMaterial | dict, Optional[str]]]):
+        pass
+    
+    def __fragment(self, __value: Any) -> str:
+        child = self.__children.get(id(__value))
+        if child is not None and child.__data is __value:
+            return child.__json
+        
+        return dumps(__value)
+    
+    def __attach(self, __parent: AdaptiveCardMaterial, __shared: bool=False):
+        parents = self.__parents
+        if len(parents) >= 8 and not len(parents) & (len(parents) - 1):
+            parents[:] = [parent for parent in parents if parent() is not None]
+
+        parents.append((_Share if __shared else ref)(__parent))
+
+    def __is_shared(self) -> bool:
+        live = [parent for parent in self.__parents if parent() is not None]
+        return len(live) > 1 and any(parent.__class__ is _Share for parent in live)
+
+    def __ensure_exclusive(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__is_shared():
+                raise TypeError(f"Cannot change a '{self.__class__.__name__}' object that is shared between clones of a card. Use evolve() to change it instead.")
+            
+            for parent in node.__parents:
+                parent = parent()
+                if parent is not None:
+                    stack.append(parent)
+    
+    def __copy(self) -> AdaptiveCardMaterial:
+        clone = self.__class__.__new__(self.__class__)
+        clone.__data = dict(self.__data)
+        clone.__json = self.__json
+        clone.__bytes = self.__bytes
+        clone.__hash = self.__hash
+        clone.__size = self.__size
+        clone.__parents = []
+        clone.__children = dict(self.__children)
+        clone.__repeated = self.__repeated
+
+        for child in clone.__children.values():
+            child.__attach(clone, True)
+        
+        return clone
+    
+    def __deep_copy(self) -> AdaptiveCardMaterial:
+        order = []
+        stack = [self]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if id(node) not in seen:
+                seen.add(id(node))
+                order.append(node)
+                stack.extend(node.__children.values())
+
+        copies = dict()
+        for node in reversed(order):
+            children = node.__children
+            data = dict()
+            for key, value in node.__data.items():
+                if isinstance(value, list):
+                    value = [copies[id(children[id(item)])].__data if id(item) in children and children[id(item)].__data is item else item for item in value]
+                elif id(value) in children and children[id(value)].__data is value:
+                    value = copies[id(children[id(value)])].__data
+                data[key] = value
+
+            copy = node.__class__.__new__(node.__class__)
+            copy.__data = data
+            copy.__json = node.__json
+            copy.__bytes = node.__bytes
+            copy.__hash = node.__hash
+            copy.__size = node.__size
+            copy.__parents = []
+            copy.__children = {id(copies[id(child)].__data): copies[id(child)] for child in children.values()}
+            copy.__repeated = node.__repeated
+
+            for child in copy.__children.values():
+                child.__attach(copy)
+
+            copies[id(node)] = copy
+
+        return copies[id(self)]
+
+    def clone(self, deep: bool=False) -> AdaptiveCardMaterial:
+        return self.__deep_copy() if deep else self.__copy()
+    
+    def _derive(self, **changes) -> AdaptiveCardMaterial:
+        derived = self.__class__.__new__(self.__class__)
+        derived.__data = dict(self.__data)
+        derived.__json = None
+        derived.__bytes = None
+        derived.__hash = None
+        derived.__size = None
+        derived.__parents = []
+        derived.__children = dict()
+        derived.__repeated = False
+
+        adopted = dict(self.__children)
+        for key, value in changes.items():
+            data = self.read(value)
+            if data is None:
+                derived.__data.pop(key, None)
+            else:
+                derived.__data[key] = data
+                self.__collect(value, adopted)
+        
+        derived.__relink(adopted, self.__children)
+        return derived
+    
+    def evolve(self, __path: str | Iterable[str | int], **changes) -> AdaptiveCardMaterial:
+        if isinstance(__path, str):
+            __path = [key.replace("~1", "/").replace("~0", "~") for key in __path.split("/")[1:]] if __path else []
+        
+        root = node = self.__copy()
+        keys = list(__path)
+
+        while keys:
+            key = keys.pop(0)
+            value = node.__data.get(key) if isinstance(key, str) else None
+            container, slot = node.__data, key
+
+            if isinstance(value, list) and keys:
+                index = int(keys.pop(0))
+                container = node.__data[key] = list(value)
+                value, slot = value[index], index
+
+            child = node.__children.get(id(value))
+            if child is None or child.__data is not value:
+                raise KeyError(f"Path segment '{key}' does not lead to a material inside '{node.__class__.__name__}'.")
+            
+            copy = child.__copy()
+            container[slot] = copy.__data
+
+            if not any(item is value for item in (container if isinstance(container, list) else container.values())):
+                del node.__children[id(value)]
+                child.__parents = [parent for parent in child.__parents if parent() is not node]
+            
+            node.__children[id(copy.__data)] = copy
+            copy.__attach(node)
+            node = copy
+        
+        node.update(**changes)
+        return root
+    
+    def invalidate(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.__json = None
+            node.__bytes = None
+            node.__hash = None
+            node.__size = None
+
+            for parent in node.__parents:
+                parent = parent()
+                if parent is not None:
+                    stack.append(parent)
+    
+    def __changed(self, __previous: Optional[tuple[int, int]]):
+        if __previous is None:
+            self.invalidate()
+            return
+        
+        self.__json = None
+        self.__size = None
+        current = self.__sizes()
+        stack = [(self, (current[0] - __previous[0], current[1] - __previous[1]))]
+        while stack:
+            node, delta = stack.pop()
+            node.__json = None
+            node.__bytes = None
+            node.__hash = None
+
+            if node is not self:
+                if delta is None or node.__size is None or node.__repeated:
+                    node.__size = delta = None
+                else:
+                    node.__size = (node.__size[0] + delta[0], node.__size[1] + delta[1])
+
+            for parent in node.__parents:
+                parent = parent()
+                if parent is not None:
+                    stack.append((parent, delta))
+    
+    def __pending(self, __done: Callable[[AdaptiveCardMaterial], bool]) -> list[AdaptiveCardMaterial]:
+        order = []
+        seen = set()
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+            stack.append((node, True))
+            stack.extend([(child, False) for child in node.__children.values() if not __done(child)])
+        
+        return order
+    
+    @staticmethod
+    def digest(__value: Any, __lookup: Optional[Callable[[Any], Optional[bytes]]]=None) -> bytes:
+        if not isinstance(__value, (dict, list)):
+            return blake2b(dumps(__value).encode(), digest_size=16).digest()
+        
+        digests = dict()
+
+        def nested(value: Any) -> bytes:
+            return digests[id(value)] if isinstance(value, (dict, list)) else blake2b(dumps(value).encode(), digest_size=16).digest()
+
+        stack = [(__value, False)]
+        while stack:
+            value, expanded = stack.pop()
+            if id(value) in digests:
+                continue
+
+            if not expanded:
+                known = __lookup(value) if __lookup is not None and value is not __value else None
+                if known is not None:
+                    digests[id(value)] = known
+                else:
+                    stack.append((value, True))
+                    stack.extend([(item, False) for item in (value.values() if isinstance(value, dict) else value) if isinstance(item, (dict, list))])
+                continue
+
+            if isinstance(value, dict):
+                hasher = blake2b(b"{", digest_size=16)
+                for pair in sorted([blake2b(dumps(key).encode() + nested(item), digest_size=16).digest() for key, item in value.items()]):
+                    hasher.update(pair)
+            else:
+                hasher = blake2b(b"[", digest_size=16)
+                for item in value:
+                    hasher.update(nested(item))
+            
+            digests[id(value)] = hasher.digest()
+        
+        return digests[id(__value)]
+    
+    def _child(self, __value: Any) -> Optional[AdaptiveCardMaterial]:
+        child = self.__children.get(id(__value))
+        return child if child is not None and child.__data is __value else None
+    
+    def __child_hash(self, __value: Any) -> Optional[bytes]:
+        child = self._child(__value)
+        return child.content_hash if child is not None else None
+    
+    @property
+    def content_hash(self) -> bytes:
+        if self.__hash is None:
+            for node in self.__pending(lambda node: node.__hash is not None):
+                node.__hash = AdaptiveCardMaterial.digest(node.__data, node.__child_hash)
+        
+        return self.__hash
+    
+    @property
+    def etag(self) -> str:
+        return '"' + self.content_hash.hex() + '"'
+    
+    def __eq__(self, __other: Any) -> bool:
+        if not isinstance(__other, AdaptiveCardMaterial):
+            return NotImplemented
+        
+        return self is __other or self.content_hash == __other.content_hash
+    
+    def __hash__(self) -> int:
+        return int.from_bytes(self.content_hash[:8], "little")
+    
+    def __measure(self, __value: Any) -> tuple[int, int]:
+        child = self._child(__value) if isinstance(__value, dict) else None
+        if child is not None:
+            return child.__size
+        
+        if isinstance(__value, list) and self.__children:
+            sizes = [self.__measure(item) if isinstance(item, dict) else (len(dumps(item)), len(dumps(item, separators=(",", ":")))) for item in __value]
+            separators = max(len(sizes) - 1, 0)
+            return sum([size[0] for size in sizes]) + 2 + 2 * separators, sum([size[1] for size in sizes]) + 2 + separators
+        
+        return len(dumps(__value)), len(dumps(__value, separators=(",", ":")))
+    
+    def __sizes(self) -> tuple[int, int]:
+        if self.__size is None and not self.__children:
+            self.__size = (len(self.__json) if self.__json is not None else len(dumps(self.__data)), len(dumps(self.__data, separators=(",", ":"))))
+        
+        elif self.__size is None:
+            for node in self.__pending(lambda node: node.__size is not None):
+                pairs = [(len(dumps(key)), node.__measure(value)) for key, value in node.__data.items()]
+                separators = max(len(pairs) - 1, 0)
+                node.__size = (
+                    sum([length + 2 + size[0] for length, size in pairs]) + 2 + 2 * separators,
+                    sum([length + 1 + size[1] for length, size in pairs]) + 2 + separators
+                )
+        
+        return self.__size
+    
+    @property
+    def encoded_size(self) -> int:
+        return self.__sizes()[0]
+    
+    @property
+    def compact_size(self) -> int:
+        return self.__sizes()[1]
+    
+    def size_breakdown(self, compact: bool=False, prune: Optional[Callable[[AdaptiveCardMaterial], bool]]=None) -> list[tuple[str, AdaptiveCardMaterial, int]]:
+        breakdown = []
+        stack = [("", self)]
+        while stack:
+            pointer, node = stack.pop()
+            breakdown.append((pointer, node, node.__sizes()[1 if compact else 0]))
+
+            if prune is not None and prune(node):
+                continue
+
+            nested = []
+            for key, value in node.__data.items():
+                key = key.replace("~", "~0").replace("/", "~1")
+                for index, item in (enumerate(value) if isinstance(value, list) else ((None, value),)):
+                    child = node._child(item) if isinstance(item, dict) else None
+                    if child is not None:
+                        nested.append((f"{pointer}/{key}" if index is None else f"{pointer}/{key}/{index}", child))
+            
+            stack.extend(reversed(nested))
+        
+        return breakdown
+    
+    def to_json(self) -> str:
+        if self.__json is None and not self.__children:
+            self.__json = dumps(self.__data)
+
+        elif self.__json is None:
+            for node in self.__pending(lambda node: node.__json is not None):
+                members = []
+                for key, value in node.__data.items():
+                    if isinstance(value, list):
+                        value = "[" + ", ".join([node.__fragment(item) for item in value]) + "]"
+                    else:
+                        value = node.__fragment(value)
+                    members.append(dumps(key) + ": " + value)
+                
+                node.__json = "{" + ", ".join(members) + "}"
+        
+        return self.__json
+    
+    def to_bytes(self) -> bytes:
+        if self.__bytes is None:
+            self.__bytes = self.to_json().encode()
+        return self.__bytes
+    
+    def iter_json(self, chunk_size: int=65536) -> Iterator[str]:
+        if self.__json is not None:
+            yield self.__json
+            return
+
+        buffer = []
+        buffered = 0
+        frames = [(iter([("", self.__data)]), "", self)]
+
+        while frames:
+            members, closing, owner = frames[-1]
+
+            for prefix, value in members:
+                child = owner.__children.get(id(value))
+                if child is not None and child.__data is value:
+                    owner = child
+
+                    if child.__json is not None:
+                        chunk = prefix + child.__json
+                        value = None
+                
+                if isinstance(value, dict) and any(isinstance(item, (dict, list)) for item in value.values()):
+                    chunk = prefix + "{"
+                    frames.append((((("" if index==0 else ", ") + dumps(key) + ": ", item) for index, (key, item) in enumerate(value.items())), "}", owner))
+                elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+                    chunk = prefix + "["
+                    frames.append((((("" if index==0 else ", "), item) for index, item in enumerate(value)), "]", owner))
+                elif value is not None or child is None:
+                    chunk = prefix + dumps(value)
+
+                buffer.append(chunk)
+                buffered += len(chunk)
+                break
+            else:
+                frames.pop()
+                buffer.append(closing)
+                buffered += len(closing)
+            
+            if buffered >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+        
+        if buffer:
+            yield "".join(buffer)
+    
+    def write_to(self, __fp: Any, chunk_size: int=65536) -> int:
+        encode = not isinstance(__fp, TextIOBase)
+        write = __fp.sendall if hasattr(__fp, "sendall") else __fp.write
+
+        written = 0
+        for chunk in self.iter_json(chunk_size):
+            if encode:
+                chunk = chunk.encode()
+            write(chunk)
+            written += len(chunk)
+        
+        return written
+    
     @staticmethod
     @abstractmethod
     def empty() -> AdaptiveCardMaterial:
         pass
     
+    @staticmethod
+    def resolve(__type: MaterialType | str) -> Optional[type[AdaptiveCardMaterial]]:
+        if isinstance(__type, MaterialType):
+            __type = __type.value
+        
+        return AdaptiveCardMaterial.__registry.get(__type)
+    
+    @classmethod
+    def __material_for(cls, data_type: Any) -> type[AdaptiveCardMaterial]:
+        material = AdaptiveCardMaterial.resolve(data_type) if isinstance(data_type, (str, MaterialType)) else None
+
+        if material is None and (data_type is not None or isabstract(cls)):
+            raise TypeError(f"Invalid type '{data_type}' for '{cls.__name__}'.")
+        
+        if material is not None and not issubclass(material, cls):
+            if isabstract(cls):
+                raise TypeError(f"Mismatching types. Cannot create an instance of '{cls.__name__}' from a dictionary with its property 'type' being '{data_type}'.")
+            
+            raise TypeError(f"Mismatching types. Cannot create an instance of '{cls.__name__}' from a dictionary with its property 'type' being '{data_type}'. Expected type was '{cls.empty().type.value}'.")
+        
+        return material or cls
+    
     @classmethod
     def from_dict(cls, __data: dict) -> AdaptiveCardMaterial:
+        __data = __data.copy()
+        component = cls.__material_for(__data.pop("type", None)).empty()
+        component.update(**__data)
+        return component
+    
+    @classmethod
+    def __load(cls, __data: dict) -> AdaptiveCardMaterial:
         __data = __data.copy()
         data_type = __data.pop("type", None)
-        data_type: MaterialType = MaterialType._value2member_map_.get(data_type)
-        
-        if cls.__name__=="AdaptiveCardMaterial":
-            subclasses = [sub.empty() for sub in AdaptiveCardMaterial.__subclasses__()]
-            subclasses = [sub for sub in subclasses if sub]
-
-            __map = {sub.type.value: sub for sub in subclasses}
+        material = cls.__material_for(data_type)
 
-            __map[data_type.value].update(**__data)
+        component = material.__new__(material)
+        AdaptiveCardMaterial.__init__(component, MaterialType(data_type) if data_type is not None else material.empty().type)
+        component.update(**__data)
+        return component
+    
+    @classmethod
+    def from_json(cls, __json: str | bytes | dict) -> AdaptiveCardMaterial:
+        data = loads(__json) if isinstance(__json, (str, bytes, bytearray)) else __json
 
-            return __map[data_type.value]
+        if not isinstance(data, dict):
+            raise TypeError(f"Cannot create an instance of '{cls.__name__}' from a JSON document of type '{data.__class__.__name__}'.")
         
-        component = cls.empty()
+        order = []
+        stack = [data]
+        seen = {id(data)}
+
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            material = AdaptiveCardMaterial.resolve(node.get("type")) or cls
+
+            for field in material.child_fields:
+                value = node.get(field)
+                for item in value if isinstance(value, list) else (value,):
+                    if isinstance(item, dict) and id(item) not in seen and AdaptiveCardMaterial.resolve(item.get("type")):
+                        seen.add(id(item))
+                        stack.append(item)
         
-        if data_type and component.type.value != data_type.value:
-            raise TypeError(f"Mismatching types. Cannot create an instance of '{component.__class__.__name__}' from a dictionary with its property 'type' being '{data_type.value}'. Expected type was '{component.type.value}'.")
+        built = dict()
+        for node in reversed(order):
+            fields = dict(node)
+            material = AdaptiveCardMaterial.resolve(node.get("type")) or cls
+
+            for field in material.child_fields:
+                value = fields.get(field)
+                if isinstance(value, dict):
+                    fields[field] = built.get(id(value), value)
+                elif isinstance(value, list):
+                    fields[field] = [built.get(id(item), item) if isinstance(item, dict) else item for item in value]
+            
+            built[id(node)] = (cls if node is data else AdaptiveCardMaterial).__load(fields)
         
-        component.update(**__data)
-        return component
+        return built[id(data)]
 
     @staticmethod
     def ensure_iterable_typing(__iterable: Optional[Iterable[object]], *__types: type[Any]):
@@ -315,12 +1070,19 @@ class AdaptiveCardMaterial(Material, ABC):
         return self.__data
     
     def __str__(self) -> str:
-        return dumps(self.__data)
+        return self.to_json()
     
     def __iter__(self):
         for key in self.__data:
             yield key
 
+def iter_elements(__root: AdaptiveCardMaterial | dict, *types: MaterialType | str, prune: Optional[Callable[[AdaptiveCardMaterial | dict], bool]]=None) -> Iterator[AdaptiveCardMaterial | dict]:
+    if not isinstance(__root, (AdaptiveCardMaterial, dict)):
+        raise TypeError(f"Cannot walk an object of type '{__root.__class__.__name__}'.")
+
+    wanted = {kind.value if isinstance(kind, MaterialType) else MaterialType(kind).value for kind in types} if types else None
+    return AdaptiveCardMaterial._elements(__root, wanted, prune)
+
 class BackgroundFillMode(Enum):
     UNSET = None
     COVER = "Cover"
@@ -329,6 +1091,8 @@ class BackgroundFillMode(Enum):
     REPEAT_VERTICALLY = "RepeatVertically"
 
 class BackgroundImage(MaterialMapping):
+    __slots__ = ()
+
     def __init__(
             self,
             __url: str,
@@ -350,6 +1114,8 @@ class BackgroundImage(MaterialMapping):
         super().__init__(backgroundImage=data)
 
 class AdaptiveCardAction(AdaptiveCardMaterial):
+    child_fields = ("fallback",)
+
     def __init__(
             self, 
             __type: ActionType,
@@ -382,32 +1148,6 @@ class AdaptiveCardAction(AdaptiveCardMaterial):
     @abstractmethod
     def empty() -> AdaptiveCardAction:
         pass
-    
-    @classmethod
-    def from_dict(cls, __data: dict) -> AdaptiveCardAction:
-        __data = __data.copy()
-        action_type = __data.pop("type", None)
-        action_type = ActionType._value2member_map_.get(action_type)
-        
-        if action_type is None:
-            raise TypeError(f"Invalid action type.")
-        
-        if cls.__name__=='AdaptiveCardAction':
-            subclasses = [sub.empty() for sub in AdaptiveCardAction.__subclasses__()]
-            
-            __map = {sub.type.value: sub for sub in subclasses}
-
-            __map[action_type.value].update(**__data)
-
-            return __map[action_type.value]
-        
-        component = cls.empty()
-        
-        if component.type.value != action_type.value:
-            raise TypeError(f"Mismatching types. Cannot create an instance of '{component.__class__.__name__}' from a dictionary with its property 'type' being '{action_type.value}'. Expected type was '{component.type.value}'.")
-        
-        component.update(**__data)
-        return component
 
 __all__ = [
     'MaterialType',
@@ -423,6 +1163,7 @@ __all__ = [
     'ActionMode',
     'ActionRole',
     'Material',
+    'InternPool',
     'MaterialDynamic',
     'Weight',
     'Seconds',
@@ -430,6 +1171,7 @@ __all__ = [
     'MaterialMapping',
     'MaterialLayout',
     'AdaptiveCardMaterial',
+    'iter_elements',
     'BackgroundFillMode',
     'BackgroundImage',
     'AdaptiveCardAction'
@@ -0,0 +1,152 @@
+from __future__ import annotations
+from typing import Any, Optional
+from functools import lru_cache
+from json import JSONEncoder, dumps
+
+from .material import *
+from .validation import _ELEMENTS, _LATEST, _SPECS, _text, _version
+
+
+_ELEMENT = {"separator": False, "spacing": "default", "isVisible": True, "height": "auto"}
+_CONTAINER = {**_ELEMENT, "bleed": False}
+_INPUT = {**_ELEMENT, "isRequired": False}
+_ACTION = {"isEnabled": True, "mode": "primary", "style": "default"}
+
+_DEFAULTS: dict[str, dict[str, Any]] = {
+    **{kind: _ELEMENT for kind in _ELEMENTS},
+    "Container": _CONTAINER,
+    "Column": _CONTAINER,
+    "ColumnSet": _CONTAINER,
+    "TableCell": _CONTAINER,
+    "CarouselPage": _CONTAINER,
+    "TableRow": _ELEMENT,
+    "TextBlock": {**_ELEMENT, "wrap": False, "isSubtle": False, "color": "default", "fontType": "default", "size": "default", "weight": "default"},
+    "Image": {**_ELEMENT, "size": "auto", "style": "default"},
+    "ImageSet": {**_ELEMENT, "imageSize": "medium"},
+    "Table": {**_ELEMENT, "firstRowAsHeaders": True, "showGridLines": True},
+    "Carousel": {**_ELEMENT, "initialPage": 0, "loop": True},
+    "Input.Text": {**_INPUT, "isMultiline": False, "style": "text"},
+    "Input.Number": _INPUT,
+    "Input.Date": _INPUT,
+    "Input.Time": _INPUT,
+    "Input.ChoiceSet": {**_INPUT, "isMultiSelect": False, "style": "compact"},
+    "Input.Toggle": {**_INPUT, "valueOn": "true", "valueOff": "false"},
+    "Action.OpenUrl": _ACTION,
+    "Action.ShowCard": _ACTION,
+    "Action.ToggleVisibility": _ACTION,
+    "Action.Submit": {**_ACTION, "associatedInputs": "auto"},
+    "Action.Execute": {**_ACTION, "associatedInputs": "auto"}
+}
+
+def _default(__value: Any, __default: Any) -> bool:
+    if __value.__class__ is not __default.__class__:
+        return False
+
+    return __value.lower() == __default.lower() if isinstance(__value, str) else __value == __default
+
+@lru_cache(maxsize=None)
+def _defaults(__kind: str, __version: tuple[int, int]) -> dict[str, Any]:
+    spec = _SPECS.get(__kind)
+    if spec is None:
+        return {}
+
+    properties = spec[1]
+    return {name: value for name, value in _DEFAULTS.get(__kind, {}).items() if name in properties and _version(properties[name][1]) <= __version}
+
+def _redundant(__node: dict, __version: tuple[int, int]) -> list[str]:
+    kind = __node.get("type")
+    defaults = _defaults(kind, __version) if isinstance(kind, str) else {}
+    return [key for key, default in defaults.items() if key in __node and _default(__node[key], default)]
+
+def _strip_material(__card: AdaptiveCardMaterial, __version: tuple[int, int]):
+    for node in __card.walk():
+        if isinstance(node, AdaptiveCardMaterial):
+            redundant = _redundant(node.__dict__, __version)
+            if redundant:
+                node.update(**{key: None for key in redundant})
+
+_COMPACT = JSONEncoder(separators=(",", ":")).encode
+_DEPTH = 200
+
+def _strip(__value: Any, __version: tuple[int, int]) -> tuple[Any, int]:
+    root = [__value]
+    stack = [(root, 0, 0)]
+    deepest = 0
+
+    while stack:
+        container, slot, depth = stack.pop()
+        value = container[slot]
+        deepest = max(deepest, depth)
+
+        if isinstance(value, list):
+            value = container[slot] = list(value)
+            stack.extend([(value, index, depth + 1) for index in range(len(value))])
+            continue
+
+        kind = value.get("type") if isinstance(value, dict) else None
+        material = AdaptiveCardMaterial.resolve(kind) if isinstance(kind, str) else None
+        if material is None:
+            continue
+
+        redundant = _redundant(value, __version)
+        value = container[slot] = {key: item for key, item in value.items() if key not in redundant}
+        stack.extend([(value, key, depth + 1) for key in material.child_fields if key in value])
+
+    return root[0], deepest
+
+def _encode(__value: Any) -> str:
+    parts = []
+    stack = [(__value,)]
+
+    while stack:
+        value = stack.pop()
+        if value.__class__ is str:
+            parts.append(value)
+            continue
+
+        value = value[0]
+        if isinstance(value, list):
+            pending = ["["]
+            for index, item in enumerate(value):
+                if index:
+                    pending.append(",")
+                pending.append((item,))
+            pending.append("]")
+            stack.extend(reversed(pending))
+            continue
+
+        kind = value.get("type") if isinstance(value, dict) else None
+        material = AdaptiveCardMaterial.resolve(kind) if isinstance(kind, str) else None
+        if material is None:
+            parts.append(_COMPACT(value))
+            continue
+
+        pending = []
+        text = "{"
+        for key, item in value.items():
+            text += ("" if text == "{" and not pending else ",") + dumps(key) + ":"
+            if key in material.child_fields:
+                pending.extend([text, (item,)])
+                text = ""
+            else:
+                text += _COMPACT(item)
+        pending.append(text + "}")
+        stack.extend(reversed(pending))
+
+    return "".join(parts)
+
+def minify(__card: AdaptiveCardMaterial | dict, version: Optional[str | float]=None) -> str:
+    if not isinstance(__card, (AdaptiveCardMaterial, dict)):
+        raise TypeError(f"Cannot minify an object of type '{__card.__class__.__name__}'.")
+
+    data = __card.__dict__ if isinstance(__card, AdaptiveCardMaterial) else __card
+    version = version if version is not None else data.get("version", _text(_LATEST))
+    target = _version(version)
+
+    if target is None:
+        raise ValueError(f"Invalid version '{version}'. Expected a version such as '1.5'.")
+
+    stripped, depth = _strip(data, target)
+    return _COMPACT(stripped) if depth < _DEPTH else _encode(stripped)
+
+__all__ = ['minify']
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+from json import dumps
+
+from .material import *
+from .adaptive_card import AdaptiveCard
+from .containers import Carousel, CarouselPage
+from .validation import _version
+
+
+_FIELDS = {
+    MaterialType.TABLE.value: "rows",
+    MaterialType.FACT_SET.value: "facts",
+    MaterialType.CONTAINER.value: "items"
+}
+
+def _size(__value: Any, __compact: bool) -> int:
+    if isinstance(__value, AdaptiveCardMaterial):
+        return __value.compact_size if __compact else __value.encoded_size
+
+    return len(dumps(__value, separators=(",", ":")) if __compact else dumps(__value))
+
+def _locate(__card: AdaptiveCardMaterial, __element: Optional[AdaptiveCardMaterial | str], __budget: int, __compact: bool) -> tuple[str, AdaptiveCardMaterial, dict[str, AdaptiveCardMaterial]]:
+    if isinstance(__element, str):
+        found = __card.find_by_id(__element)
+        if found is None:
+            raise KeyError(f"No element with the id '{__element}' in the card.")
+        __element = found
+
+    if __element is None:
+        breakdown = __card.size_breakdown(compact=__compact, prune=lambda node: node.__dict__.get("type") in _FIELDS)
+    else:
+        breakdown = __card.size_breakdown(prune=lambda node: node is __element)
+    nodes = {pointer: node for pointer, node, size in breakdown}
+
+    if __element is None:
+        candidates = [(size, pointer, node) for pointer, node, size in breakdown if node.__dict__.get("type") in _FIELDS]
+        if not candidates:
+            raise ValueError("The card has no Table, FactSet or Container to paginate.")
+
+        total = _size(__card, __compact)
+        size, pointer, node = max(candidates, key=lambda candidate: candidate[0])
+
+        while True:
+            items = node.get(_FIELDS[node.__dict__["type"]]) or []
+            largest = max([_size(node._child(item) or item, __compact) for item in items], default=0)
+            if total - size + largest <= __budget:
+                return pointer, node, nodes
+
+            outer = node
+            inner = outer.size_breakdown(compact=__compact, prune=lambda node: node is not outer and node.__dict__.get("type") in _FIELDS)[1:]
+            nodes.update({pointer + path: child for path, child, child_size in inner})
+            inner = [(child_size, pointer + path, child) for path, child, child_size in inner if child.__dict__.get("type") in _FIELDS]
+            if not inner:
+                return pointer, node, nodes
+
+            size, pointer, node = max(inner, key=lambda candidate: candidate[0])
+
+    for pointer, node, size in breakdown:
+        if node is __element:
+            if node.__dict__.get("type") not in _FIELDS:
+                raise TypeError(f"Cannot paginate a '{node.__class__.__name__}'. Expected a Table, FactSet or Container.")
+
+            return pointer, node, nodes
+
+    raise KeyError(f"The '{__element.__class__.__name__}' to paginate is not part of the card.")
+
+def _chunks(__items: list, __header: list, __base: int, __budget: int, __compact: bool) -> List[list]:
+    separator = 1 if __compact else 2
+    header = sum([_size(item, __compact) + separator for item in __header])
+    chunks = []
+    chunk = []
+    size = __base + 2 + header
+
+    if size > __budget:
+        raise ValueError(f"A page needs {size} bytes before any item is added, more than the budget of {__budget} bytes.")
+
+    for index, item in enumerate(__items):
+        item_size = _size(item, __compact) + separator
+        if chunk and size + item_size - separator > __budget:
+            chunks.append(__header + chunk)
+            chunk = []
+            size = __base + 2 + header
+
+        if size + item_size - separator > __budget:
+            raise ValueError(f"Item at index {index + len(__header)} needs {__base + 2 + header + item_size - separator} bytes on a page of its own, more than the budget of {__budget} bytes.")
+
+        chunk.append(item)
+        size += item_size
+
+    if chunk or not chunks:
+        chunks.append(__header + chunk)
+
+    return chunks
+
+def paginate(
+        __card: AdaptiveCardMaterial,
+        __max_size: int,
+        element: Optional[AdaptiveCardMaterial | str]=None,
+        carousel: bool=False,
+        compact: bool=False) -> List[AdaptiveCardMaterial]:
+    if not isinstance(__card, AdaptiveCard):
+        raise TypeError(f"Cannot paginate an object of type '{__card.__class__.__name__}'.")
+
+    pointer, node, nodes = _locate(__card, element, __max_size, compact)
+    field = _FIELDS[node.__dict__["type"]]
+    values = node.get(field) or []
+    items = [node._child(item) or item for item in values]
+
+    header = items[:1] if node.__dict__["type"] == MaterialType.TABLE.value and node.get("firstRowAsHeaders", True) else []
+    body = items[len(header):]
+
+    separator = 1 if compact else 2
+    listed = 2 + sum([_size(item, compact) for item in items]) + separator * max(len(items) - 1, 0)
+
+    segments = pointer.split("/")
+    parent = nodes.get("/".join(segments[:-2]))
+    if segments[-1].isdigit() and parent is not None and isinstance(parent.get(segments[-2].replace("~1", "/").replace("~0", "~")), list):
+        parent_pointer, key, index = "/".join(segments[:-2]), segments[-2], int(segments[-1])
+    else:
+        parent_pointer, key, index = "/".join(segments[:-1]), segments[-1], None
+
+    key = key.replace("~1", "/").replace("~0", "~")
+    parent = nodes[parent_pointer]
+
+    def replace(__replacement: AdaptiveCardMaterial) -> AdaptiveCardMaterial:
+        if index is None:
+            return __card.evolve(parent_pointer, **{key: __replacement})
+
+        value = [parent._child(item) or item for item in parent.get(key)]
+        value[index] = __replacement
+        return __card.evolve(parent_pointer, **{key: value})
+
+    if not carousel:
+        base = _size(__card, compact) - listed
+        return [replace(node._derive(**{field: chunk})) for chunk in _chunks(body, header, base, __max_size, compact)]
+
+    skeleton = {name: value for name, value in node.__dict__.items() if name != field}
+    skeleton[field] = []
+    base = _size({"type": MaterialType.CAROUSEL_PAGE.value, "items": [skeleton]}, compact) - 2
+    pages = [CarouselPage(items=[node._derive(**{field: chunk})]) for chunk in _chunks(body, header, base, __max_size, compact)]
+
+    result = replace(Carousel(pages=pages, id=node.id))
+    if (_version(result.get("version")) or (0, 0)) < (1, 6):
+        result.update(version="1.6")
+
+    return [result]
+
+__all__ = ['paginate']
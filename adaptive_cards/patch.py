@@ -0,0 +1,265 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+
+from .material import *
+
+
+def _escape(__key: str | int) -> str:
+    return str(__key).replace("~", "~0").replace("/", "~1")
+
+def _parse(__pointer: str) -> List[str]:
+    if __pointer == "":
+        return []
+
+    if not __pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer '{__pointer}'.")
+
+    return [key.replace("~1", "/").replace("~0", "~") for key in __pointer.split("/")[1:]]
+
+class _Digests:
+    def __init__(self):
+        self.memo = dict()
+
+    def known(self, __value: Any) -> bool:
+        cached = self.memo.get(id(__value))
+        return cached is not None and cached[0] is __value
+
+    def __call__(self, __value: Any, __material: Optional[AdaptiveCardMaterial]=None) -> bytes:
+        if __material is not None:
+            return __material.content_hash
+
+        if not isinstance(__value, (dict, list)):
+            return AdaptiveCardMaterial.digest(__value)
+
+        cached = self.memo.get(id(__value))
+        if cached is None or cached[0] is not __value:
+            cached = self.memo[id(__value)] = (__value, AdaptiveCardMaterial.digest(__value, self))
+
+        return cached[1]
+
+def _material(__value: Any, __owner: Optional[AdaptiveCardMaterial]) -> Optional[AdaptiveCardMaterial]:
+    return __owner._child(__value) if __owner is not None and isinstance(__value, dict) else None
+
+def _same(__old: Any, __new: Any, __digests: _Digests, __old_owner: Optional[AdaptiveCardMaterial], __new_owner: Optional[AdaptiveCardMaterial]) -> bool:
+    if __old is __new:
+        return True
+
+    if isinstance(__old, (dict, list)) and __old.__class__ is __new.__class__:
+        return __digests(__old, _material(__old, __old_owner)) == __digests(__new, _material(__new, __new_owner))
+
+    return __old.__class__ is __new.__class__ and __old == __new
+
+def _number(__value: Any) -> bool:
+    return isinstance(__value, (int, float)) and not isinstance(__value, bool)
+
+def _equal(__old: Any, __new: Any) -> bool:
+    stack = [(__old, __new)]
+    while stack:
+        old, new = stack.pop()
+        if old is new:
+            continue
+
+        if isinstance(old, dict) and isinstance(new, dict):
+            if old.keys() != new.keys():
+                return False
+            stack.extend([(old[key], new[key]) for key in old])
+        elif isinstance(old, list) and isinstance(new, list):
+            if len(old) != len(new):
+                return False
+            stack.extend(zip(old, new))
+        elif _number(old) and _number(new):
+            if old != new:
+                return False
+        elif old.__class__ is not new.__class__ or old != new:
+            return False
+
+    return True
+
+def _diff(
+        __old: Any,
+        __new: Any,
+        __path: str,
+        __patch: list,
+        __digests: _Digests,
+        __old_owner: Optional[AdaptiveCardMaterial]=None,
+        __new_owner: Optional[AdaptiveCardMaterial]=None):
+    if __old is __new:
+        return
+
+    if isinstance(__old, dict) and isinstance(__new, dict):
+        if __digests.known(__old) and __digests.known(__new) and __digests(__old) == __digests(__new):
+            return
+
+        for key in __old:
+            if key not in __new:
+                __patch.append({"op": "remove", "path": f"{__path}/{_escape(key)}"})
+
+        for key, value in __new.items():
+            if key not in __old:
+                __patch.append({"op": "add", "path": f"{__path}/{_escape(key)}", "value": value})
+                continue
+
+            old_owner, new_owner = _material(__old[key], __old_owner), _material(value, __new_owner)
+            if isinstance(value, list):
+                old_owner, new_owner = __old_owner, __new_owner
+
+            _diff(__old[key], value, f"{__path}/{_escape(key)}", __patch, __digests, old_owner, new_owner)
+
+    elif isinstance(__old, list) and isinstance(__new, list):
+        start = 0
+        while start < len(__old) and start < len(__new) and _same(__old[start], __new[start], __digests, __old_owner, __new_owner):
+            start += 1
+
+        old_end, new_end = len(__old), len(__new)
+        while old_end > start and new_end > start and _same(__old[old_end - 1], __new[new_end - 1], __digests, __old_owner, __new_owner):
+            old_end -= 1
+            new_end -= 1
+
+        common = min(old_end, new_end) - start
+        for index in range(start, start + common):
+            _diff(__old[index], __new[index], f"{__path}/{index}", __patch, __digests, _material(__old[index], __old_owner), _material(__new[index], __new_owner))
+
+        for index in range(old_end - 1, start + common - 1, -1):
+            __patch.append({"op": "remove", "path": f"{__path}/{index}"})
+
+        for index in range(start + common, new_end):
+            __patch.append({"op": "add", "path": f"{__path}/{index}", "value": __new[index]})
+
+    elif __old.__class__ is not __new.__class__ or __old != __new:
+        __patch.append({"op": "replace", "path": __path, "value": __new})
+
+def diff(__old: AdaptiveCardMaterial | dict, __new: AdaptiveCardMaterial | dict) -> List[dict]:
+    for card in (__old, __new):
+        if not isinstance(card, (AdaptiveCardMaterial, dict)):
+            raise TypeError(f"Cannot diff an object of type '{card.__class__.__name__}'.")
+
+    patch = []
+    _diff(
+        __old.__dict__ if isinstance(__old, AdaptiveCardMaterial) else __old,
+        __new.__dict__ if isinstance(__new, AdaptiveCardMaterial) else __new,
+        "",
+        patch,
+        _Digests(),
+        __old if isinstance(__old, AdaptiveCardMaterial) else None,
+        __new if isinstance(__new, AdaptiveCardMaterial) else None
+    )
+    return patch
+
+class _Document:
+    def __init__(self, __root: Any):
+        self.root = __root
+        self.copied = dict()
+
+    def own(self, __value: Any) -> Any:
+        if self.copied.get(id(__value)) is __value:
+            return __value
+
+        value = dict(__value) if isinstance(__value, dict) else list(__value)
+        self.copied[id(value)] = value
+        return value
+
+    def resolve(self, __keys: List[str]) -> Any:
+        value = self.root
+        for key in __keys:
+            value = self.child(value, key)
+
+        return value
+
+    def child(self, __container: Any, __key: str) -> Any:
+        try:
+            if isinstance(__container, dict):
+                return __container[__key]
+
+            if isinstance(__container, list) and __key.isdigit() and (__key == "0" or not __key.startswith("0")):
+                return __container[int(__key)]
+        except (KeyError, IndexError):
+            pass
+
+        raise KeyError(f"Path segment '{__key}' does not exist in the card.")
+
+    def parent(self, __keys: List[str]) -> Any:
+        if not __keys:
+            raise KeyError("The root of the card cannot be the target of this operation.")
+
+        self.root = container = self.own(self.root)
+        for key in __keys[:-1]:
+            value = self.own(self.child(container, key))
+            container[int(key) if isinstance(container, list) else key] = value
+            container = value
+
+        if not isinstance(container, (dict, list)):
+            raise KeyError(f"Path segment '{__keys[-2]}' does not lead to an object or array.")
+
+        return container
+
+    def index(self, __container: list, __key: str, __append: bool) -> int:
+        if __append and __key == "-":
+            return len(__container)
+
+        if not __key.isdigit() or (__key != "0" and __key.startswith("0")) or int(__key) > len(__container) - (0 if __append else 1):
+            raise KeyError(f"Index '{__key}' is out of range.")
+
+        return int(__key)
+
+    def add(self, __keys: List[str], __value: Any):
+        if not __keys:
+            self.root = __value
+            return
+
+        container = self.parent(__keys)
+        if isinstance(container, list):
+            container.insert(self.index(container, __keys[-1], True), __value)
+        else:
+            container[__keys[-1]] = __value
+
+    def remove(self, __keys: List[str]) -> Any:
+        container = self.parent(__keys)
+        if isinstance(container, list):
+            return container.pop(self.index(container, __keys[-1], False))
+
+        if __keys[-1] not in container:
+            raise KeyError(f"Path segment '{__keys[-1]}' does not exist in the card.")
+
+        return container.pop(__keys[-1])
+
+def apply_patch(__card: AdaptiveCardMaterial | dict, __patch: List[dict]) -> AdaptiveCardMaterial | dict:
+    if not isinstance(__card, (AdaptiveCardMaterial, dict)):
+        raise TypeError(f"Cannot patch an object of type '{__card.__class__.__name__}'.")
+
+    document = _Document(__card.__dict__ if isinstance(__card, AdaptiveCardMaterial) else __card)
+
+    for index, operation in enumerate(__patch):
+        op = operation.get("op")
+        if "path" not in operation or (op in ("add", "replace", "test") and "value" not in operation) or (op in ("move", "copy") and "from" not in operation):
+            raise ValueError(f"Operation at index {index} of the patch is missing a member.")
+
+        keys = _parse(operation["path"])
+
+        if op == "add":
+            document.add(keys, operation["value"])
+        elif op == "remove":
+            document.remove(keys)
+        elif op == "replace":
+            if keys:
+                document.remove(keys)
+            document.add(keys, operation["value"])
+        elif op == "move":
+            source = _parse(operation["from"])
+            if keys[:len(source)] == source and keys != source:
+                raise ValueError(f"Operation at index {index} of the patch moves a value into itself.")
+            document.add(keys, document.remove(source) if source else document.root)
+        elif op == "copy":
+            document.add(keys, document.resolve(_parse(operation["from"])))
+        elif op == "test":
+            value = document.resolve(keys)
+            if not _equal(value, operation["value"]):
+                raise ValueError(f"Test operation at index {index} of the patch failed for path '{operation['path']}'.")
+        else:
+            raise ValueError(f"Invalid operation '{op}' at index {index} of the patch.")
+
+    if isinstance(__card, AdaptiveCardMaterial):
+        return __card.__class__.from_json(document.root)
+
+    return document.root
+
+__all__ = ['diff', 'apply_patch']
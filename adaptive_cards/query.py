@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator, List, Optional
+from functools import lru_cache
+from json import loads
+import re
+
+from .material import *
+
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<operator>\^=|\$=|\*=|!=|=)
+  | (?P<negation>:not\()
+  | (?P<name>[A-Za-z_$][\w.-]*)
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<punctuation>[\[\](),>*])
+""", re.VERBOSE)
+
+_MISSING = object()
+
+def _equals(__value: Any, __expected: Any) -> bool:
+    return __value == __expected and isinstance(__value, bool) == isinstance(__expected, bool)
+
+_OPERATORS: dict[str, Callable[[Any, Any, str], bool]] = {
+    "=": lambda value, expected, text: _equals(value, expected),
+    "!=": lambda value, expected, text: not _equals(value, expected),
+    "^=": lambda value, expected, text: isinstance(value, str) and value.startswith(text),
+    "$=": lambda value, expected, text: isinstance(value, str) and value.endswith(text),
+    "*=": lambda value, expected, text: isinstance(value, str) and text in value
+}
+
+class _Parser:
+    def __init__(self, __selector: str):
+        self.selector = __selector
+        self.tokens = []
+        position = 0
+
+        while position < len(__selector):
+            match = _TOKEN.match(__selector, position)
+            if not match:
+                raise ValueError(f"Unexpected character '{__selector[position]}' at position {position} of selector '{__selector}'.")
+
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup), position))
+            position = match.end()
+
+        self.position = 0
+
+    def peek(self, __skip_space: bool=True) -> Optional[tuple]:
+        if __skip_space and self.position < len(self.tokens) and self.tokens[self.position][0] == "space":
+            self.position += 1
+
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, __text: Optional[str]=None, __kind: Optional[str]=None) -> tuple:
+        token = self.peek()
+        if token is None or (__text is not None and token[1] != __text) or (__kind is not None and token[0] != __kind):
+            where = f"'{token[1]}' at position {token[2]}" if token else "end"
+            raise ValueError(f"Unexpected {where} of selector '{self.selector}'.")
+
+        self.position += 1
+        return token
+
+    def parse(self) -> List[tuple[list, list]]:
+        selectors = self.selector_list()
+        if self.peek() is not None:
+            self.take(",")
+
+        return selectors
+
+    def selector_list(self) -> List[tuple[list, list]]:
+        selectors = [self.complex()]
+        while self.peek() is not None and self.peek()[1] == ",":
+            self.take()
+            selectors.append(self.complex())
+
+        return selectors
+
+    def complex(self) -> tuple[list, list]:
+        compounds = [self.compound()]
+        combinators = []
+
+        while True:
+            spaced = self.peek(False) is not None and self.peek(False)[0] == "space"
+            token = self.peek()
+            if token is None or token[1] in ",)":
+                return compounds, combinators
+
+            if token[1] == ">":
+                self.take()
+                combinators.append(">")
+            elif spaced:
+                combinators.append(" ")
+            else:
+                self.take(",")
+
+            compounds.append(self.compound())
+
+    def compound(self) -> tuple[Optional[str], Callable[[dict], bool]]:
+        kind = None
+        predicates = []
+
+        token = self.peek()
+        if token is not None and token[0] == "name":
+            self.take()
+            try:
+                kind = MaterialType(token[1]).value
+            except ValueError:
+                raise ValueError(f"Unknown element type '{token[1]}' in selector '{self.selector}'.")
+        elif token is not None and token[1] == "*":
+            self.take()
+        elif token is None or token[1] not in ("[", ":not("):
+            self.take("*")
+
+        while True:
+            token = self.peek(False)
+            if token is not None and token[1] == "[":
+                self.take()
+                predicates.append(self.attribute())
+            elif token is not None and token[0] == "negation":
+                self.take()
+                inner = []
+                for compounds, combinators in self.selector_list():
+                    if combinators:
+                        raise ValueError(f"Only simple selectors are allowed inside ':not()' in selector '{self.selector}'.")
+                    inner.append(compounds[0][1])
+                
+                self.take(")")
+                predicates.append((lambda matchers: lambda data: not any(matcher(data) for matcher in matchers))(inner))
+            else:
+                break
+
+        if not predicates:
+            return kind, (lambda kind: lambda data: kind is None or data["type"] == kind)(kind)
+
+        return kind, (lambda kind, predicates: lambda data: (kind is None or data["type"] == kind) and all(predicate(data) for predicate in predicates))(kind, predicates)
+
+    def attribute(self) -> Callable[[dict], bool]:
+        name = self.take(None, "name")[1]
+        token = self.take()
+
+        if token[1] == "]":
+            return lambda data: name in data
+
+        if token[0] != "operator":
+            raise ValueError(f"Unexpected '{token[1]}' at position {token[2]} of selector '{self.selector}'.")
+
+        comparison = _OPERATORS[token[1]]
+        kind, text, position = self.take()
+
+        if kind == "string":
+            expected = text = loads(text) if text[0] == '"' else re.sub(r"\\(.)", r"\1", text[1:-1])
+        elif kind == "number" or text in ("true", "false", "null"):
+            expected = loads(text)
+        elif kind == "name":
+            expected = text
+        else:
+            raise ValueError(f"Unexpected '{text}' at position {position} of selector '{self.selector}'.")
+
+        self.take("]")
+        return lambda data: comparison(data.get(name, _MISSING), expected, text)
+
+def _chain(__compounds: list, __combinators: list) -> Callable[[dict, list], bool]:
+    __compounds = [matcher for kind, matcher in __compounds]
+    subject = __compounds[-1]
+    if not __combinators:
+        return lambda data, ancestors: subject(data)
+
+    def upwards(index: int, position: int, ancestors: list) -> bool:
+        if index < 0:
+            return True
+
+        matcher = __compounds[index]
+        if __combinators[index] == ">":
+            return position >= 0 and matcher(ancestors[position]) and upwards(index - 1, position - 1, ancestors)
+
+        for candidate in range(position, -1, -1):
+            if matcher(ancestors[candidate]) and upwards(index - 1, candidate - 1, ancestors):
+                return True
+
+        return False
+
+    last = len(__compounds) - 2
+    return lambda data, ancestors: subject(data) and upwards(last, len(ancestors) - 1, ancestors)
+
+class Selector:
+    def __init__(self, __selector: str):
+        if not isinstance(__selector, str):
+            raise TypeError(f"Cannot compile a selector from an object of type '{__selector.__class__.__name__}'.")
+
+        selectors = _Parser(__selector).parse()
+        self.__selector = __selector
+        self.__contextual = any(combinators for compounds, combinators in selectors)
+        subjects = {compounds[-1][0] for compounds, combinators in selectors}
+        self.__types = None if None in subjects else subjects
+        chains = [_chain(compounds, combinators) for compounds, combinators in selectors]
+        self.__match = chains[0] if len(chains) == 1 else lambda data, ancestors: any(chain(data, ancestors) for chain in chains)
+
+    def matches(self, __node: AdaptiveCardMaterial | dict, ancestors: Optional[List[AdaptiveCardMaterial | dict]]=None) -> bool:
+        return self.__match(__node.__dict__ if isinstance(__node, AdaptiveCardMaterial) else __node, [ancestor.__dict__ if isinstance(ancestor, AdaptiveCardMaterial) else ancestor for ancestor in ancestors or ()])
+
+    def iter_select(self, __root: AdaptiveCardMaterial | dict) -> Iterator[AdaptiveCardMaterial | dict]:
+        if not isinstance(__root, (AdaptiveCardMaterial, dict)):
+            raise TypeError(f"Cannot query an object of type '{__root.__class__.__name__}'.")
+
+        match = self.__match
+        if not self.__contextual:
+            for node in AdaptiveCardMaterial._elements(__root, self.__types):
+                if match(node.__dict__ if isinstance(node, AdaptiveCardMaterial) else node, None):
+                    yield node
+            return
+
+        path = []
+        for node, data, depth in AdaptiveCardMaterial._elements(__root, None, None, True):
+            del path[depth:]
+            if match(data, path):
+                yield node
+            path.append(data)
+
+    def select(self, __root: AdaptiveCardMaterial | dict) -> List[AdaptiveCardMaterial | dict]:
+        return list(self.iter_select(__root))
+
+    def first(self, __root: AdaptiveCardMaterial | dict) -> Optional[AdaptiveCardMaterial | dict]:
+        return next(self.iter_select(__root), None)
+
+    def __str__(self) -> str:
+        return self.__selector
+
+@lru_cache(maxsize=256)
+def compile_selector(__selector: str) -> Selector:
+    return Selector(__selector)
+
+def select(__root: AdaptiveCardMaterial | dict, __selector: str) -> List[AdaptiveCardMaterial | dict]:
+    return compile_selector(__selector).select(__root)
+
+def select_first(__root: AdaptiveCardMaterial | dict, __selector: str) -> Optional[AdaptiveCardMaterial | dict]:
+    return compile_selector(__selector).first(__root)
+
+__all__ = ['Selector', 'compile_selector', 'select', 'select_first']
@@ -0,0 +1,446 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator, List, Optional
+from collections.abc import Iterable
+from json import dumps
+import operator
+import re
+
+from .material import *
+
+
+_BINDING = re.compile(r"\$\{([^{}]*)\}")
+_SEGMENT = re.compile(r"\s*(?:\.?\s*([A-Za-z_$][\w$]*)|\[\s*(\d+)\s*\]|\[\s*'([^']*)'\s*\])")
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<number>\d+(?:\.\d+)?)|
+    (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|
+    (?P<name>\$?[A-Za-z_]\w*(?:\s*\.\s*\$?[A-Za-z_]\w*|\s*\[\s*(?:\d+|'[^']*')\s*\])*)|
+    (?P<operator>==|!=|<=|>=|&&|\|\||[<>!(),])
+)""", re.VERBOSE)
+_MISSING = object()
+
+class _Unsupported(Exception):
+    pass
+
+class _Scope:
+    __slots__ = ("data", "root", "index")
+
+    def __init__(self, data: Any, root: Any, index: Optional[int]=None):
+        self.data = data
+        self.root = root
+        self.index = index
+
+def _truthy(__value: Any) -> bool:
+    return __value is not _MISSING and bool(__value)
+
+def _defined(__value: Any) -> Any:
+    return None if __value is _MISSING else __value
+
+def _stringify(__value: Any) -> str:
+    return __value if isinstance(__value, str) else dumps(__value)
+
+_FUNCTIONS = {
+    "equals": operator.eq,
+    "not": lambda value: not _truthy(value),
+    "and": lambda *values: all(_truthy(value) for value in values),
+    "or": lambda *values: any(_truthy(value) for value in values),
+    "if": lambda condition, when_true, when_false: when_true if _truthy(condition) else when_false,
+    "exists": lambda value: value is not None,
+    "empty": lambda value: not value,
+    "count": len,
+    "length": len,
+    "greater": operator.gt,
+    "greaterOrEquals": operator.ge,
+    "less": operator.lt,
+    "lessOrEquals": operator.le,
+    "concat": lambda *values: "".join(_stringify(value) for value in values),
+    "toLower": lambda value: _stringify(value).lower(),
+    "toUpper": lambda value: _stringify(value).upper()
+}
+
+_BINARY = {
+    "||": (1, lambda left, right: _truthy(left) or _truthy(right)),
+    "&&": (2, lambda left, right: _truthy(left) and _truthy(right)),
+    "==": (3, operator.eq),
+    "!=": (3, operator.ne),
+    "<": (4, operator.lt),
+    "<=": (4, operator.le),
+    ">": (4, operator.gt),
+    ">=": (4, operator.ge)
+}
+
+def _compile_path(__expression: str) -> Optional[Callable[[_Scope], Any]]:
+    keys = []
+    position = 0
+    expression = __expression.strip()
+
+    while position < len(expression):
+        match = _SEGMENT.match(expression, position)
+        if not match or match.end() == position:
+            return None
+
+        name, index, quoted = match.groups()
+        if name is not None and ("." in expression[position:match.start(1)]) != bool(keys):
+            return None
+
+        keys.append(int(index) if index is not None else (name if name is not None else quoted))
+        position = match.end()
+
+    if not keys or isinstance(keys[0], int) or (len(keys) == 1 and keys[0] in ("true", "false", "null")):
+        return None
+
+    head = keys.pop(0) if keys[0] in ("$root", "$data", "$index") else "$data"
+    keys = tuple(keys)
+
+    if head == "$index":
+        return None if keys else (lambda scope: _MISSING if scope.index is None else scope.index)
+
+    start = operator.attrgetter("root" if head == "$root" else "data")
+
+    def resolve(scope: _Scope) -> Any:
+        value = start(scope)
+        for key in keys:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return _MISSING
+        return value
+
+    return resolve
+
+class _Parser:
+    def __init__(self, __expression: str):
+        self.tokens = []
+        position = 0
+        __expression = __expression.rstrip()
+
+        while position < len(__expression):
+            match = _TOKEN.match(__expression, position)
+            if not match or match.end() == position:
+                raise _Unsupported(__expression)
+
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+
+        self.position = 0
+
+    def peek(self) -> Optional[tuple]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, __text: Optional[str]=None) -> tuple:
+        token = self.peek()
+        if token is None or (__text is not None and token[1] != __text):
+            raise _Unsupported(__text)
+
+        self.position += 1
+        return token
+
+    def parse(self) -> Callable[[_Scope], Any]:
+        compiled = self.expression(0)
+        if self.peek() is not None:
+            raise _Unsupported(self.peek()[1])
+        return compiled
+
+    def expression(self, __precedence: int) -> Callable[[_Scope], Any]:
+        left = self.unary()
+
+        while True:
+            token = self.peek()
+            if token is None or token[0] != "operator" or token[1] not in _BINARY:
+                return left
+
+            precedence, function = _BINARY[token[1]]
+            if precedence <= __precedence:
+                return left
+
+            self.take()
+            right = self.expression(precedence)
+            left = (lambda l, r, f: lambda scope: f(_defined(l(scope)), _defined(r(scope))))(left, right, function)
+
+    def unary(self) -> Callable[[_Scope], Any]:
+        kind, text = self.take()
+
+        if text == "!":
+            operand = self.unary()
+            return lambda scope: not _truthy(operand(scope))
+
+        if text == "(":
+            inner = self.expression(0)
+            self.take(")")
+            return inner
+
+        if kind == "number":
+            value = float(text) if "." in text else int(text)
+            return lambda scope: value
+
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", text[1:-1])
+            return lambda scope: value
+
+        if kind != "name":
+            raise _Unsupported(text)
+
+        if text in ("true", "false", "null"):
+            value = dict(true=True, false=False, null=None)[text]
+            return lambda scope: value
+
+        token = self.peek()
+        if token is not None and token[1] == "(":
+            return self.call(text)
+
+        path = _compile_path(text)
+        if path is None:
+            raise _Unsupported(text)
+
+        return path
+
+    def call(self, __name: str) -> Callable[[_Scope], Any]:
+        function = _FUNCTIONS.get(__name)
+        if function is None:
+            raise _Unsupported(__name)
+
+        self.take("(")
+        arguments = []
+        while self.peek() is not None and self.peek()[1] != ")":
+            if arguments:
+                self.take(",")
+            arguments.append(self.expression(0))
+        self.take(")")
+
+        return lambda scope: function(*[_defined(argument(scope)) for argument in arguments])
+
+def _compile_expression(__expression: str) -> Optional[Callable[[_Scope], Any]]:
+    path = _compile_path(__expression)
+    if path is not None:
+        return path
+
+    try:
+        compiled = _Parser(__expression).parse()
+    except _Unsupported:
+        return None
+
+    def evaluate(scope: _Scope) -> Any:
+        try:
+            return compiled(scope)
+        except (TypeError, ValueError, AttributeError):
+            return _MISSING
+
+    return evaluate
+
+def _compile_condition(__condition: Any) -> Optional[Callable[[_Scope], Any]]:
+    if not isinstance(__condition, str):
+        return lambda scope: __condition
+
+    match = _BINDING.fullmatch(__condition.strip())
+    return _compile_expression(match.group(1)) if match else None
+
+def _compile_string(__value: str) -> str | Callable[[_Scope], str]:
+    static = dumps(__value)
+    matches = list(_BINDING.finditer(__value))
+
+    accessors = [_compile_expression(match.group(1)) for match in matches]
+    if not any(accessors):
+        return static
+
+    if len(matches) == 1 and matches[0].span() == (0, len(__value)):
+        accessor = accessors[0]
+
+        def render_value(scope: _Scope) -> str:
+            value = accessor(scope)
+            return static if value is _MISSING else dumps(value)
+
+        return render_value
+
+    pieces: List[str | tuple] = []
+    position = 0
+    for match, accessor in zip(matches, accessors):
+        pieces.append(__value[position:match.start()] if accessor else __value[position:match.end()])
+        if accessor:
+            pieces.append((accessor, match.group(0)))
+        position = match.end()
+    pieces.append(__value[position:])
+
+    def render_text(scope: _Scope) -> str:
+        text = []
+        for piece in pieces:
+            if piece.__class__ is str:
+                text.append(piece)
+                continue
+
+            value = piece[0](scope)
+            text.append(piece[1] if value is _MISSING else _stringify(value))
+
+        return dumps("".join(text))
+
+    return render_text
+
+def _emit(__parts: list, scope: _Scope) -> Iterator[str]:
+    for part in __parts:
+        if part.__class__ is str:
+            yield part
+        elif part.__class__ is _Block:
+            yield from part.emit(scope)
+        else:
+            yield part(scope)
+
+class _Element:
+    def __init__(self, __value: dict):
+        self.data = None
+        self.condition = None
+        remainder = dict(__value)
+
+        if "$data" in __value:
+            data = __value["$data"]
+            match = _BINDING.fullmatch(data.strip()) if isinstance(data, str) else None
+            self.data = _compile_expression(match.group(1)) if match else (lambda scope: data)
+
+            if self.data is not None:
+                del remainder["$data"]
+
+        if "$when" in __value:
+            self.condition = _compile_condition(__value["$when"])
+
+            if self.condition is not None:
+                del remainder["$when"]
+
+        self.parts = _compile(remainder)
+
+    def expand(self, scope: _Scope, repeat: bool) -> Iterator[_Scope]:
+        if self.data is not None:
+            value = self.data(scope)
+            if value is _MISSING or value is None:
+                return
+
+            if repeat and isinstance(value, Iterable) and not isinstance(value, (str, bytes, dict)):
+                for index, item in enumerate(value):
+                    item_scope = _Scope(item, scope.root, index)
+                    if self.condition is None or _truthy(self.condition(item_scope)):
+                        yield item_scope
+                return
+
+            scope = _Scope(value, scope.root, scope.index)
+
+        if self.condition is None or _truthy(self.condition(scope)):
+            yield scope
+
+class _Block:
+    def __init__(self, __open: str, __close: str, members: List[tuple]):
+        self.open = __open
+        self.close = __close
+        self.members = members
+
+    def emit(self, scope: _Scope) -> Iterator[str]:
+        yield self.open
+        separator = ""
+        repeat = self.open == "["
+
+        for prefix, member in self.members:
+            if member.__class__ is not _Element:
+                yield separator + prefix
+                yield from _emit(member, scope)
+                separator = ", "
+                continue
+
+            for element_scope in member.expand(scope, repeat):
+                yield separator + prefix
+                yield from _emit(member.parts, element_scope)
+                separator = ", "
+
+        yield self.close
+
+def _dynamic(__value: Any) -> bool:
+    return isinstance(__value, dict) and ("$data" in __value or "$when" in __value)
+
+def _append(__parts: list, __part: Any):
+    if __part.__class__ is str and __parts and __parts[-1].__class__ is str:
+        __parts[-1] += __part
+    else:
+        __parts.append(__part)
+
+def _compile(__value: Any, __parts: Optional[list]=None) -> list:
+    parts = [] if __parts is None else __parts
+
+    if isinstance(__value, str):
+        _append(parts, _compile_string(__value))
+
+    elif isinstance(__value, dict):
+        if any(_dynamic(item) for item in __value.values()):
+            members = []
+            for key, item in __value.items():
+                members.append((dumps(key) + ": ", _Element(item) if _dynamic(item) else _compile(item)))
+            _append(parts, _Block("{", "}", members))
+            return parts
+
+        _append(parts, "{")
+        for index, key in enumerate(__value):
+            _append(parts, ("" if index==0 else ", ") + dumps(key) + ": ")
+            _compile(__value[key], parts)
+        _append(parts, "}")
+
+    elif isinstance(__value, (list, tuple)):
+        if any(_dynamic(item) for item in __value):
+            members = [("", _Element(item) if _dynamic(item) else _compile(item)) for item in __value]
+            _append(parts, _Block("[", "]", members))
+            return parts
+
+        _append(parts, "[")
+        for index, item in enumerate(__value):
+            if index:
+                _append(parts, ", ")
+            _compile(item, parts)
+        _append(parts, "]")
+
+    else:
+        _append(parts, dumps(__value))
+
+    return parts
+
+class CardTemplate:
+    def __init__(self, __template: AdaptiveCardMaterial | dict):
+        if isinstance(__template, AdaptiveCardMaterial):
+            self.__etag = __template.etag
+            __template = __template.__dict__
+        elif isinstance(__template, dict):
+            self.__etag = '"' + AdaptiveCardMaterial.digest(__template).hex() + '"'
+        else:
+            raise TypeError(f"Cannot compile a template from an object of type '{__template.__class__.__name__}'.")
+
+        self.__root = _Element(__template) if _dynamic(__template) else None
+        self.__parts: list = self.__root.parts if self.__root else _compile(__template)
+        self.__flat = self.__root is None and all(part.__class__ is not _Block for part in self.__parts)
+
+    @property
+    def etag(self) -> str:
+        return self.__etag
+
+    def iter_render(self, __data: Any, chunk_size: int=65536) -> Iterator[str]:
+        scope = _Scope(__data, __data)
+        chunks = iter(["null"])
+
+        if self.__root is None:
+            chunks = _emit(self.__parts, scope)
+        else:
+            for element_scope in self.__root.expand(scope, False):
+                chunks = _emit(self.__parts, element_scope)
+
+        buffer = []
+        buffered = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            buffered += len(chunk)
+
+            if buffered >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+
+        if buffer:
+            yield "".join(buffer)
+
+    def render(self, __data: Any) -> str:
+        if self.__flat:
+            scope = _Scope(__data, __data)
+            return "".join([part if part.__class__ is str else part(scope) for part in self.__parts])
+
+        return "".join(self.iter_render(__data))
+
+__all__ = ['CardTemplate']
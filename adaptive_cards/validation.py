@@ -0,0 +1,399 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+from functools import lru_cache
+import re
+
+from .material import *
+
+
+class ValidationError(NamedTuple):
+    pointer: str
+    message: str
+
+_LATEST = (1, 6)
+_PIXELS = re.compile(r"^\d+px$")
+_VERSION = re.compile(r"^\d+\.\d+$")
+
+def _version(__value: Any) -> Optional[tuple[int, int]]:
+    if isinstance(__value, (int, float)) and not isinstance(__value, bool):
+        __value = str(float(__value))
+
+    if not isinstance(__value, str) or not _VERSION.match(__value):
+        return None
+
+    major, minor = __value.split(".")
+    return int(major), int(minor)
+
+def _text(__version: tuple[int, int]) -> str:
+    return f"{__version[0]}.{__version[1]}"
+
+def _enum(*values: str) -> tuple[Callable[[Any], bool], str]:
+    allowed = {value.lower() for value in values}
+    return lambda value: isinstance(value, str) and value.lower() in allowed, "one of " + ", ".join([f"'{value}'" for value in values])
+
+_STRING = (lambda value: isinstance(value, str), "a string")
+_BOOLEAN = (lambda value: isinstance(value, bool), "a boolean")
+_NUMBER = (lambda value: isinstance(value, (int, float)) and not isinstance(value, bool), "a number")
+_INTEGER = (lambda value: isinstance(value, int) and not isinstance(value, bool), "an integer")
+_OBJECT = (lambda value: isinstance(value, dict), "an object")
+_PIXEL = (lambda value: isinstance(value, str) and _PIXELS.match(value) is not None, "a size in pixels such as '50px'")
+_WIDTH = (lambda value: _NUMBER[0](value) or (isinstance(value, str) and (value.lower() in ("auto", "stretch") or _PIXELS.match(value) is not None or value.isdigit())), "'auto', 'stretch', a weight or a size in pixels")
+_DATA = (lambda value: isinstance(value, (dict, str)), "an object or a string")
+
+def _objects(**fields: tuple[Callable[[Any], bool], str]) -> tuple[Callable[[Any], bool], str]:
+    def check(value: Any) -> bool:
+        return isinstance(value, list) and all(isinstance(item, dict) and all(key not in item or field[0](item[key]) for key, field in fields.items()) for item in value)
+
+    return check, "an array of objects with " + ", ".join(fields)
+
+_SPACING = _enum("None", "Small", "Default", "Medium", "Large", "ExtraLarge", "Padding")
+_HEIGHT = _enum("auto", "stretch")
+_HORIZONTAL = _enum("Left", "Center", "Right")
+_VERTICAL = _enum("Top", "Center", "Bottom")
+_CONTAINER_STYLE = _enum("default", "emphasis", "good", "attention", "warning", "accent")
+_BACKGROUND = (lambda value: isinstance(value, str) or (isinstance(value, dict) and isinstance(value.get("url"), str)), "a URL or an object with a url")
+
+_ELEMENTS = frozenset([
+    "Container", "Carousel", "Table", "TextBlock", "FactSet", "ColumnSet", "ImageSet", "Image", "ActionSet", "Media",
+    "Input.Text", "Input.Date", "Input.Time", "Input.Number", "Input.ChoiceSet", "Input.Toggle"
+])
+_ACTIONS = frozenset(["Action.OpenUrl", "Action.Submit", "Action.ShowCard", "Action.ToggleVisibility", "Action.Execute"])
+_SELECT_ACTIONS = _ACTIONS - {"Action.ShowCard"}
+
+def _children(*types: str, many: bool=True) -> tuple:
+    return ("children", frozenset(types), many)
+
+_ELEMENT = {
+    "id": (_STRING, "1.0"),
+    "isVisible": (_BOOLEAN, "1.2"),
+    "separator": (_BOOLEAN, "1.0"),
+    "spacing": (_SPACING, "1.0"),
+    "height": (_HEIGHT, "1.1"),
+    "requires": (_OBJECT, "1.2"),
+    "fallback": (("fallback", _ELEMENTS), "1.2")
+}
+_INPUT = {
+    **_ELEMENT,
+    "label": (_STRING, "1.3"),
+    "isRequired": (_BOOLEAN, "1.3"),
+    "errorMessage": (_STRING, "1.3")
+}
+_ACTION = {
+    "id": (_STRING, "1.0"),
+    "title": (_STRING, "1.0"),
+    "iconUrl": (_STRING, "1.1"),
+    "style": (_enum("default", "positive", "destructive"), "1.2"),
+    "mode": (_enum("primary", "secondary"), "1.5"),
+    "tooltip": (_STRING, "1.5"),
+    "isEnabled": (_BOOLEAN, "1.5"),
+    "role": (_enum("Button", "Link", "Tab", "Menu", "MenuItem"), "1.6"),
+    "requires": (_OBJECT, "1.2"),
+    "fallback": (("fallback", _ACTIONS), "1.2")
+}
+_CONTAINER = {
+    **_ELEMENT,
+    "items": (_children(*_ELEMENTS), "1.0"),
+    "selectAction": (_children(*_SELECT_ACTIONS, many=False), "1.1"),
+    "style": (_CONTAINER_STYLE, "1.0"),
+    "verticalContentAlignment": (_VERTICAL, "1.1"),
+    "bleed": (_BOOLEAN, "1.2"),
+    "backgroundImage": (_BACKGROUND, "1.2"),
+    "minHeight": (_PIXEL, "1.2"),
+    "rtl": (_BOOLEAN, "1.5")
+}
+
+_SPECS: dict[str, tuple[str, dict, tuple[str, ...]]] = {
+    "AdaptiveCard": ("1.0", {
+        "version": (_STRING, "1.0"),
+        "$schema": (_STRING, "1.0"),
+        "body": (_children(*_ELEMENTS), "1.0"),
+        "actions": (_children(*_ACTIONS), "1.0"),
+        "selectAction": (_children(*_SELECT_ACTIONS, many=False), "1.1"),
+        "fallbackText": (_STRING, "1.0"),
+        "backgroundImage": (_BACKGROUND, "1.0"),
+        "minHeight": (_PIXEL, "1.2"),
+        "rtl": (_BOOLEAN, "1.5"),
+        "speak": (_STRING, "1.0"),
+        "lang": (_STRING, "1.0"),
+        "verticalContentAlignment": (_VERTICAL, "1.1"),
+        "refresh": (_OBJECT, "1.4"),
+        "authentication": (_OBJECT, "1.4"),
+        "id": (_STRING, "1.0")
+    }, ()),
+    "Container": ("1.0", {**_CONTAINER, "horizontalAlignment": (_HORIZONTAL, "1.0")}, ("items",)),
+    "Column": ("1.0", {**_CONTAINER, "horizontalAlignment": (_HORIZONTAL, "1.0"), "width": (_WIDTH, "1.0"), "fallback": (("fallback", frozenset(["Column"])), "1.2")}, ()),
+    "ColumnSet": ("1.0", {
+        **_ELEMENT,
+        "columns": (_children("Column"), "1.0"),
+        "selectAction": (_children(*_SELECT_ACTIONS, many=False), "1.1"),
+        "style": (_CONTAINER_STYLE, "1.2"),
+        "bleed": (_BOOLEAN, "1.2"),
+        "minHeight": (_PIXEL, "1.2"),
+        "horizontalAlignment": (_HORIZONTAL, "1.0")
+    }, ()),
+    "TextBlock": ("1.0", {
+        **_ELEMENT,
+        "text": (_STRING, "1.0"),
+        "color": (_enum("Default", "Dark", "Light", "Accent", "Good", "Warning", "Attention"), "1.0"),
+        "fontType": (_enum("Default", "Monospace"), "1.2"),
+        "horizontalAlignment": (_HORIZONTAL, "1.0"),
+        "isSubtle": (_BOOLEAN, "1.0"),
+        "maxLines": (_INTEGER, "1.0"),
+        "size": (_enum("Default", "Small", "Medium", "Large", "ExtraLarge"), "1.0"),
+        "weight": (_enum("Default", "Lighter", "Bolder"), "1.0"),
+        "wrap": (_BOOLEAN, "1.0"),
+        "style": (_enum("default", "heading", "columnHeader"), "1.5")
+    }, ("text",)),
+    "Image": ("1.0", {
+        **_ELEMENT,
+        "url": (_STRING, "1.0"),
+        "altText": (_STRING, "1.0"),
+        "backgroundColor": (_STRING, "1.1"),
+        "height": ((lambda value: _HEIGHT[0](value) or _PIXEL[0](value), "'auto', 'stretch' or a size in pixels"), "1.1"),
+        "horizontalAlignment": (_HORIZONTAL, "1.0"),
+        "selectAction": (_children(*_SELECT_ACTIONS, many=False), "1.1"),
+        "size": (_enum("Auto", "Stretch", "Small", "Medium", "Large"), "1.0"),
+        "style": (_enum("Default", "Person"), "1.0"),
+        "width": (_PIXEL, "1.1")
+    }, ("url",)),
+    "ImageSet": ("1.0", {
+        **_ELEMENT,
+        "images": (_children("Image"), "1.0"),
+        "imageSize": (_enum("Auto", "Stretch", "Small", "Medium", "Large"), "1.0"),
+        "horizontalAlignment": (_HORIZONTAL, "1.0")
+    }, ("images",)),
+    "FactSet": ("1.0", {**_ELEMENT, "facts": (_objects(title=_STRING, value=_STRING), "1.0")}, ("facts",)),
+    "ActionSet": ("1.2", {**_ELEMENT, "actions": (_children(*_ACTIONS), "1.2"), "horizontalAlignment": (_HORIZONTAL, "1.2")}, ("actions",)),
+    "Media": ("1.1", {
+        **_ELEMENT,
+        "sources": (_objects(url=_STRING, mimeType=_STRING), "1.1"),
+        "poster": (_STRING, "1.1"),
+        "altText": (_STRING, "1.1"),
+        "captionSources": (_objects(url=_STRING, mimeType=_STRING, label=_STRING), "1.6"),
+        "horizontalAlignment": (_HORIZONTAL, "1.1")
+    }, ("sources",)),
+    "Table": ("1.5", {
+        **_ELEMENT,
+        "columns": (_objects(width=_WIDTH), "1.5"),
+        "rows": (_children("TableRow"), "1.5"),
+        "firstRowAsHeader": (_BOOLEAN, "1.5"),
+        "firstRowAsHeaders": (_BOOLEAN, "1.5"),
+        "showGridLines": (_BOOLEAN, "1.5"),
+        "gridStyle": (_CONTAINER_STYLE, "1.5"),
+        "horizontalAlignment": (_HORIZONTAL, "1.5"),
+        "horizontalCellContentAlignment": (_HORIZONTAL, "1.5"),
+        "verticalCellContentAlignment": (_VERTICAL, "1.5")
+    }, ()),
+    "TableRow": ("1.5", {
+        **_ELEMENT,
+        "cells": (_children("TableCell"), "1.5"),
+        "style": (_CONTAINER_STYLE, "1.5"),
+        "horizontalCellContentAlignment": (_HORIZONTAL, "1.5"),
+        "verticalCellContentAlignment": (_VERTICAL, "1.5")
+    }, ()),
+    "TableCell": ("1.5", {**_CONTAINER, "horizontalAlignment": (_HORIZONTAL, "1.5")}, ("items",)),
+    "Carousel": ("1.6", {
+        **_ELEMENT,
+        "pages": (_children("CarouselPage"), "1.6"),
+        "timer": (_INTEGER, "1.6"),
+        "initialPage": (_INTEGER, "1.6"),
+        "orientation": (_enum("horizontal", "vertical"), "1.6"),
+        "heightInPixels": (_PIXEL, "1.6"),
+        "loop": (_BOOLEAN, "1.6"),
+        "backgroundImage": (_BACKGROUND, "1.6"),
+        "minHeight": (_PIXEL, "1.6"),
+        "horizontalAlignment": (_HORIZONTAL, "1.6"),
+        "verticalContentAlignment": (_VERTICAL, "1.6"),
+        "rtl": (_BOOLEAN, "1.6")
+    }, ("pages",)),
+    "CarouselPage": ("1.6", {**_CONTAINER, "horizontalAlignment": (_HORIZONTAL, "1.6")}, ("items",)),
+    "Input.Text": ("1.0", {
+        **_INPUT,
+        "isMultiline": (_BOOLEAN, "1.0"),
+        "maxLength": (_INTEGER, "1.0"),
+        "placeholder": (_STRING, "1.0"),
+        "style": (_enum("Text", "Tel", "Url", "Email", "Password"), "1.0"),
+        "inlineAction": (_children(*_SELECT_ACTIONS, many=False), "1.2"),
+        "value": (_STRING, "1.0"),
+        "regex": (_STRING, "1.3")
+    }, ("id",)),
+    "Input.Number": ("1.0", {**_INPUT, "max": (_NUMBER, "1.0"), "min": (_NUMBER, "1.0"), "placeholder": (_STRING, "1.0"), "value": (_NUMBER, "1.0")}, ("id",)),
+    "Input.Date": ("1.0", {**_INPUT, "max": (_STRING, "1.0"), "min": (_STRING, "1.0"), "placeholder": (_STRING, "1.0"), "value": (_STRING, "1.0")}, ("id",)),
+    "Input.Time": ("1.0", {**_INPUT, "max": (_STRING, "1.0"), "min": (_STRING, "1.0"), "placeholder": (_STRING, "1.0"), "value": (_STRING, "1.0")}, ("id",)),
+    "Input.Toggle": ("1.0", {
+        **_INPUT,
+        "title": (_STRING, "1.0"),
+        "value": (_STRING, "1.0"),
+        "valueOff": (_STRING, "1.0"),
+        "valueOn": (_STRING, "1.0"),
+        "wrap": (_BOOLEAN, "1.2")
+    }, ("id", "title")),
+    "Input.ChoiceSet": ("1.0", {
+        **_INPUT,
+        "choices": (_objects(title=_STRING, value=_STRING), "1.0"),
+        "isMultiSelect": (_BOOLEAN, "1.0"),
+        "style": (_enum("compact", "expanded", "filtered"), "1.0"),
+        "value": (_STRING, "1.0"),
+        "placeholder": (_STRING, "1.0"),
+        "wrap": (_BOOLEAN, "1.2")
+    }, ("id",)),
+    "Action.OpenUrl": ("1.0", {**_ACTION, "url": (_STRING, "1.0")}, ("url",)),
+    "Action.Submit": ("1.0", {**_ACTION, "data": (_DATA, "1.0"), "associatedInputs": (_enum("auto", "none"), "1.3")}, ()),
+    "Action.ShowCard": ("1.0", {**_ACTION, "card": (_children("AdaptiveCard", many=False), "1.0")}, ("card",)),
+    "Action.ToggleVisibility": ("1.2", {**_ACTION, "targetElements": (("targets",), "1.2")}, ("targetElements",)),
+    "Action.Execute": ("1.4", {**_ACTION, "verb": (_STRING, "1.4"), "data": (_DATA, "1.4"), "associatedInputs": (_enum("auto", "none"), "1.4")}, ()),
+    "TargetElement": ("1.2", {"elementId": (_STRING, "1.2"), "isVisible": (_BOOLEAN, "1.2")}, ("elementId",))
+}
+
+def _bound(__value: Any) -> bool:
+    return isinstance(__value, str) and "${" in __value
+
+def _escape(__key: str) -> str:
+    return __key.replace("~", "~0").replace("/", "~1")
+
+def _compile_property(__name: str, __kind: tuple, __since: tuple[int, int], __version: tuple[int, int]) -> Callable:
+    if __since > __version:
+        message = f"Property '{__name}' requires version {_text(__since)}, but the card targets {_text(__version)}."
+        return lambda value, pointer, errors, push: errors.append(ValidationError(pointer, message))
+
+    if __kind[0] == "children":
+        allowed, many = __kind[1], __kind[2]
+        expected = "an array of " + ("elements" if allowed & _ELEMENTS else "actions" if allowed & _ACTIONS else "/".join(sorted(allowed)))
+
+        if many:
+            def check(value: Any, pointer: str, errors: list, push: Callable):
+                if not isinstance(value, list):
+                    if not _bound(value):
+                        errors.append(ValidationError(pointer, f"Property '{__name}' must be {expected}."))
+                    return
+
+                for index in range(len(value) - 1, -1, -1):
+                    push((value[index], f"{pointer}/{index}", allowed))
+        else:
+            def check(value: Any, pointer: str, errors: list, push: Callable):
+                push((value, pointer, allowed))
+
+        return check
+
+    if __kind[0] == "fallback":
+        allowed = __kind[1]
+
+        def check(value: Any, pointer: str, errors: list, push: Callable):
+            if value != "drop":
+                push((value, pointer, allowed))
+
+        return check
+
+    if __kind[0] == "targets":
+        def check(value: Any, pointer: str, errors: list, push: Callable):
+            if not isinstance(value, list):
+                errors.append(ValidationError(pointer, f"Property '{__name}' must be an array of element ids or TargetElements."))
+                return
+
+            for index in range(len(value) - 1, -1, -1):
+                if not isinstance(value[index], str):
+                    push((value[index], f"{pointer}/{index}", frozenset(["TargetElement"])))
+
+        return check
+
+    test, expected = __kind
+    message = f"Property '{__name}' must be {expected}."
+
+    def check(value: Any, pointer: str, errors: list, push: Callable):
+        if not test(value) and not _bound(value):
+            errors.append(ValidationError(pointer, message))
+
+    return check
+
+@lru_cache(maxsize=32)
+def _compile(__version: tuple[int, int], __excluded: frozenset[str]) -> dict[str, Callable]:
+    checkers = dict()
+
+    for kind, (since, properties, required) in _SPECS.items():
+        since = _version(since)
+        compiled = {name: _compile_property(name, spec, _version(spec_since), __version) for name, (spec, spec_since) in properties.items()}
+        problem = None
+
+        if kind in __excluded:
+            problem = f"'{kind}' is not supported by the target host."
+        elif since > __version:
+            problem = f"'{kind}' requires version {_text(since)}, but the card targets {_text(__version)}."
+
+        def check(node: dict, pointer: str, errors: list, push: Callable, compiled=compiled, required=required, problem=problem):
+            if problem is not None:
+                errors.append(ValidationError(pointer, problem))
+                return
+
+            for key, value in node.items():
+                checker = compiled.get(key)
+                if checker is not None:
+                    checker(value, f"{pointer}/{_escape(key)}", errors, push)
+
+            for key in required:
+                if key not in node:
+                    errors.append(ValidationError(pointer, f"Required property '{key}' is missing."))
+
+        checkers[kind] = check
+
+    return checkers
+
+class CardValidator:
+    def __init__(self, version: Optional[str | float]=None, exclude_types: Iterable[MaterialType | str]=()):
+        self.version = None if version is None else _version(version)
+        if version is not None and self.version is None:
+            raise ValueError(f"Invalid version '{version}'. Expected a version such as '1.5'.")
+
+        self.exclude_types = frozenset([kind.value if isinstance(kind, MaterialType) else MaterialType(kind).value for kind in exclude_types])
+
+    def validate(self, __card: AdaptiveCardMaterial | dict) -> List[ValidationError]:
+        if isinstance(__card, AdaptiveCardMaterial):
+            __card = __card.__dict__
+
+        if not isinstance(__card, dict):
+            raise TypeError(f"Cannot validate an object of type '{__card.__class__.__name__}'.")
+
+        errors = []
+        declared = _version(__card.get("version"))
+
+        if __card.get("type") != MaterialType.ADAPTIVE_CARD.value:
+            errors.append(ValidationError("", "The root of a card must be of type 'AdaptiveCard'."))
+        elif "version" not in __card:
+            errors.append(ValidationError("", "Required property 'version' is missing."))
+        elif declared is None:
+            errors.append(ValidationError("/version", f"Invalid version '{__card['version']}'. Expected a version such as '1.5'."))
+        elif self.version is not None and declared > self.version:
+            errors.append(ValidationError("/version", f"The card declares version {_text(declared)}, but the target host supports up to {_text(self.version)}."))
+
+        version = min(declared, self.version) if declared is not None and self.version is not None else self.version or declared or _LATEST
+        checkers = _compile(version, self.exclude_types)
+        stack = [(__card, "", frozenset([MaterialType.ADAPTIVE_CARD.value]))]
+        push = stack.append
+
+        while stack:
+            node, pointer, allowed = stack.pop()
+
+            if not isinstance(node, dict):
+                errors.append(ValidationError(pointer, "Expected an object with a 'type'."))
+                continue
+
+            kind = node.get("type")
+            checker = checkers.get(kind) if isinstance(kind, str) else None
+
+            if checker is None:
+                errors.append(ValidationError(pointer, f"Unknown type '{kind}'." if kind is not None else "Required property 'type' is missing."))
+                continue
+
+            if kind not in allowed:
+                errors.append(ValidationError(pointer, f"'{kind}' is not allowed here."))
+
+            checker(node, pointer, errors, push)
+
+        return errors
+
+    def is_valid(self, __card: AdaptiveCardMaterial | dict) -> bool:
+        return not self.validate(__card)
+
+def validate(__card: AdaptiveCardMaterial | dict, version: Optional[str | float]=None, exclude_types: Iterable[MaterialType | str]=()) -> List[ValidationError]:
+    return CardValidator(version, exclude_types).validate(__card)
+
+__all__ = ['ValidationError', 'CardValidator', 'validate']
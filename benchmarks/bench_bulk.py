@@ -0,0 +1,34 @@
+from adaptive_cards import *
+
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import os
+
+CARDS = 20000
+
+card = AdaptiveCard(
+    body=[
+        TextBlock("${title}", style=TextStyle(size=TextSize.MEDIUM, weight=FontWeight.BOLDER)),
+        Container(items=[TextBlock(f"Line {i}") for i in range(10)]),
+        FactSet(facts=[Fact(f"Key {i}", f"Value {i}") for i in range(5)])
+    ],
+    actions=[ActionSubmit(title="OK"), ActionOpenUrl(title="View", url="https://example.com")]
+).to_json()
+
+with TemporaryDirectory() as directory:
+    path = os.path.join(directory, "cards.jsonl")
+    with open(path, "w") as file:
+        for _ in range(CARDS):
+            file.write(card + "\n")
+
+    print(f"Hydrating {CARDS} cards ({os.path.getsize(path) / 1024 / 1024:.1f} MiB), {os.cpu_count()} CPUs available")
+
+    baseline = None
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = perf_counter()
+        report = validate_jsonl(path, workers=workers)
+        elapsed = perf_counter() - start
+        baseline = baseline or elapsed
+
+        assert report.cards == CARDS and not report.errors
+        print(f"  {workers:>3} workers: {elapsed:6.2f} s, {CARDS / elapsed:8.0f} cards/s ({baseline / elapsed:.1f}x)")
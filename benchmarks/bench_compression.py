@@ -0,0 +1,121 @@
+from adaptive_cards import *
+
+import gzip
+import random
+import zlib
+from timeit import timeit
+
+def word(rng: random.Random) -> str:
+    return "".join(rng.choice("etaoinshrdlucmfwypvbgk") for _ in range(rng.randint(2, 9)))
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join(word(rng) for _ in range(count)).capitalize()
+
+def notification(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        schema="http://adaptivecards.io/schemas/adaptive-card.json",
+        body=[
+            TextBlock(words(rng, 4), style=TextStyle(size=TextSize.MEDIUM, weight=FontWeight.BOLDER)),
+            ColumnSet(columns=[
+                Column(layout=ColumnLayout(width=ColumnWidth.AUTO), items=[
+                    Image(f"https://example.com/avatars/{rng.randint(1, 999)}.png", style=ImageStyle(theme=ImageTheme.PERSON), layout=ImageLayout(size=ImageSize.SMALL))
+                ]),
+                Column(items=[
+                    TextBlock(words(rng, 2), style=TextStyle(weight=FontWeight.BOLDER)),
+                    TextBlock(f"Created {rng.randint(1, 28)}/{rng.randint(1, 12)}", style=TextStyle(subtle=True), layout=TextLayout(spacing=MaterialSpacing.NONE))
+                ])
+            ]),
+            TextBlock(words(rng, rng.randint(8, 30)))
+        ],
+        actions=[ActionOpenUrl("View", f"https://example.com/items/{rng.randint(1, 99999)}")]
+    )
+
+def approval(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        schema="http://adaptivecards.io/schemas/adaptive-card.json",
+        body=[
+            TextBlock(words(rng, 3), style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            FactSet(facts=[Fact(f"{words(rng, 1)}:", words(rng, 2)) for _ in range(rng.randint(2, 6))])
+        ],
+        actions=[
+            ActionShowCard("Comment", card=AdaptiveCard(
+                body=[InputText("comment", placeholder="Add a comment", multiline=True)],
+                actions=[ActionSubmit("OK")]
+            )),
+            ActionExecute("Approve", verb="approve", data={"id": rng.randint(1, 99999)}),
+            ActionExecute("Reject", verb="reject", data={"id": rng.randint(1, 99999)})
+        ]
+    )
+
+def table(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            TextBlock(words(rng, 2), style=TextStyle(weight=FontWeight.BOLDER)),
+            Table(rows=[
+                TableRow(cells=[TableCell(items=[TextBlock(words(rng, 1))]), TableCell(items=[TextBlock(str(rng.randint(1, 9999)))])])
+                for _ in range(rng.randint(3, 40))
+            ])
+        ]
+    )
+
+def form(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            TextBlock(words(rng, 3), style=TextStyle(size=TextSize.MEDIUM, weight=FontWeight.BOLDER)),
+            InputText("name", label="Name", placeholder="Your name"),
+            InputDate("date", label="Date"),
+            InputChoiceSet("choice", [InputChoice(value.capitalize(), value) for value in (word(rng) for _ in range(4))], label="Category"),
+            InputToggle("agree", "I agree")
+        ],
+        actions=[ActionSubmit("Send", data={"form": words(rng, 1).lower()})]
+    )
+
+def gallery(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.6,
+        body=[
+            Carousel(pages=[CarouselPage(items=[Image(f"https://example.com/images/{rng.randint(1, 999)}.png"), TextBlock(words(rng, 5))]) for _ in range(rng.randint(2, 5))]),
+            ImageSet(images=[Image(f"https://example.com/thumbs/{rng.randint(1, 999)}.png") for _ in range(rng.randint(2, 6))])
+        ]
+    )
+
+def task(rng: random.Random) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            Container(items=[TextBlock(words(rng, 4), style=TextStyle(weight=FontWeight.BOLDER))], style=ContainerStyle(ContainerTheme.EMPHASIS)),
+            Container(items=[
+                InputNumber("hours", label="Hours", minimum_value=0, maximum_value=rng.randint(8, 40)),
+                InputTime("start", label="Start")
+            ], id="details", visible=False)
+        ],
+        actions=[ActionToggleVisibility("Details", ["details"]), ActionSubmit("Log", data={"task": rng.randint(1, 99999)})]
+    )
+
+def sample(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    builders = (notification, approval, table, form, gallery, task)
+    return [builders[index % len(builders)](rng) for index in range(count)]
+
+if __name__ == "__main__":
+    corpus = sample(1200, 2)
+    assert train_dictionary(sample(600, 1), 1) == CardDictionary.DEFAULT
+
+    print(f"{len(corpus)} cards, {sum(len(card.to_bytes()) for card in corpus) / len(corpus):.0f} B on average")
+    for name, encode, decode in (
+        ("gzip(str(card))", lambda card: gzip.compress(str(card).encode()), lambda payload: AdaptiveCard.from_json(gzip.decompress(payload))),
+        ("zlib(str(card))", lambda card: zlib.compress(str(card).encode(), 9), lambda payload: AdaptiveCard.from_json(zlib.decompress(payload))),
+        ("compress_card(card)", lambda card: compress_card(card), lambda payload: AdaptiveCard.from_json(decompress_card(payload)))
+    ):
+        payloads = [encode(card) for card in corpus]
+        original = sum(len(card.to_bytes()) for card in corpus)
+        compressed = sum(len(payload) for payload in payloads)
+        compress = timeit(lambda: [encode(card) for card in corpus], number=3) / 3 / len(corpus)
+        decompress = timeit(lambda: [decode(payload) for payload in payloads], number=3) / 3 / len(corpus)
+        assert all(decode(payload) == card for payload, card in zip(payloads, corpus))
+
+        print(f"{name:22}: {compressed / len(corpus):6.0f} B per card, ratio {original / compressed:5.2f}x, compress {compress * 1e6:6.1f} us, decompress {decompress * 1e6:7.1f} us")
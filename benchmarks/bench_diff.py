@@ -0,0 +1,31 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+
+SECTIONS = 2500
+
+card = AdaptiveCard(
+    body=[
+        Container(items=[TextBlock(f"Section {i}", id=f"title-{i}"), TextBlock("Body"), FactSet(facts=[Fact("Key", f"Value {i}")])])
+        for i in range(SECTIONS)
+    ]
+)
+variant = card.evolve("/body/1234/items/0", text="Section 1234 (updated)")
+rebuilt = AdaptiveCard.from_json(variant.to_json())
+
+cold = timeit(lambda: diff(card, AdaptiveCard.from_json(variant.to_json())), number=1) - timeit(lambda: AdaptiveCard.from_json(variant.to_json()), number=1)
+patch = diff(card, variant)
+assert patch == diff(card, rebuilt) == [{"op": "replace", "path": "/body/1234/items/0/text", "value": "Section 1234 (updated)"}]
+
+number = 20
+shared = timeit(lambda: diff(card, variant), number=number) / number
+independent = timeit(lambda: diff(card, rebuilt), number=number) / number
+applied = timeit(lambda: apply_patch(card.__dict__, patch), number=number * 100) / (number * 100)
+
+print(f"Diffing a card with {SECTIONS * 4 + 1} nodes after one TextBlock changed")
+print(f"  diff() of evolve() variants:     {shared * 1e3:8.3f} ms")
+print(f"  diff() of independent cards:     {cold * 1e3:8.3f} ms (first diff, hashes every node)")
+print(f"  again, with cached node hashes:  {independent * 1e3:8.3f} ms")
+print(f"  apply_patch() on the dictionary: {applied * 1e3:8.3f} ms")
+print(f"  payload: {len(variant.to_json())} bytes, patch: {len(dumps(patch))} bytes")
@@ -0,0 +1,26 @@
+from adaptive_cards import *
+
+from timeit import timeit
+
+def build(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.6,
+        body=[
+            TextBlock("Weekly report", style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            Table(rows=[
+                TableRow(cells=[TableCell(items=[TextBlock(f"Row {i}")]), TableCell(items=[TextBlock(f"{i * 7} items")])])
+                for i in range(rows)
+            ]),
+            Carousel(pages=[CarouselPage(items=[Image(f"https://example.com/{i}.png")]) for i in range(3)]),
+            InputText("comment", label="Comment", multiline=True)
+        ],
+        actions=[ActionExecute("Approve", verb="approve", mode=ActionMode.PRIMARY), ActionOpenUrl("Open", "https://example.com")]
+    )
+
+for rows in (10, 100, 1000):
+    card = build(rows)
+    for version in ("1.5", "1.4", "1.2"):
+        cold = timeit(lambda: downgrade(card, version), number=1)
+        number = 20
+        warm = timeit(lambda: downgrade(card, version), number=number) / number
+        print(f"{rows:5} rows to {version}: first call {cold * 1e3:8.2f} ms, repeated {warm * 1e3:8.2f} ms")
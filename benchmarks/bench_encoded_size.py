@@ -0,0 +1,31 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+
+def build(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            Container(items=[
+                ColumnSet(columns=[
+                    Column(items=[TextBlock(f"Row {i}", id=f"row-{i}", style=TextStyle(weight=FontWeight.BOLDER))]),
+                    Column(items=[TextBlock(f"{i * 7} items", wrap=True)])
+                ])
+                for i in range(rows)
+            ])
+        ]
+    )
+
+for rows in (100, 1000, 10000):
+    card = build(rows)
+    nodes = sum(1 for _ in card.walk())
+    target = card.find_by_id(f"row-{rows // 2}")
+    card.encoded_size
+
+    encode = timeit(lambda: len(dumps(card.__dict__)), number=10) / 10
+    cached = timeit(lambda: card.encoded_size, number=100000) / 100000
+    edited = timeit(lambda: (target.update(text="Row edited"), card.encoded_size), number=1000) / 1000
+    assert card.encoded_size == len(dumps(card.__dict__))
+
+    print(f"{nodes:6} nodes: json.dumps {encode * 1e3:7.2f} ms, encoded_size {cached * 1e9:5.0f} ns, update + encoded_size {edited * 1e6:7.1f} us")
@@ -0,0 +1,53 @@
+from adaptive_cards import *
+
+from timeit import timeit
+
+SECTIONS = 2500
+
+card = AdaptiveCard(
+    body=[
+        Container(items=[TextBlock(f"Section {i}", id=f"title-{i}"), TextBlock("Body", id=f"body-{i}"), TextBlock("Footer")], id=f"section-{i}")
+        for i in range(SECTIONS)
+    ],
+    actions=[ActionToggleVisibility("Toggle", [f"body-{i}" for i in range(0, SECTIONS, 10)])]
+)
+nodes = SECTIONS * 4 + 2
+targets = [f"body-{i}" for i in range(0, SECTIONS, 97)]
+
+def scan(element_id):
+    stack = [card.__dict__]
+    while stack:
+        node = stack.pop()
+        if node.get("id") == element_id:
+            return node
+        for field in AdaptiveCardMaterial.resolve(node["type"]).child_fields:
+            value = node.get(field)
+            stack.extend(item for item in (value if isinstance(value, list) else [value]) if isinstance(item, dict))
+
+def linear():
+    for target in targets:
+        scan(target)
+
+def indexed():
+    for target in targets:
+        card.find_by_id(target)
+
+built = timeit(lambda: card.find_by_id("section-0"), number=1)
+assert all(scan(target) is card.find_by_id(target).__dict__ for target in targets)
+
+section = card.find_by_id("section-7")
+def edit():
+    section.update(items=[TextBlock("Replaced", id="body-7")])
+    section.update(items=[TextBlock("Section 7", id="title-7"), TextBlock("Body", id="body-7")])
+
+number = 5
+scanned = timeit(linear, number=number) / (number * len(targets))
+found = timeit(indexed, number=number * 1000) / (number * 1000 * len(targets))
+edited = timeit(edit, number=1000) / 2000
+
+print(f"Looking up ids in a card with {nodes} nodes")
+print(f"  linear scan:         {scanned * 1e6:10.2f} us/lookup")
+print(f"  find_by_id():        {found * 1e6:10.2f} us/lookup ({scanned / found:.0f}x)")
+print(f"  first index build:   {built * 1e3:10.2f} ms")
+print(f"  indexed update():    {edited * 1e6:10.2f} us/update")
+print(f"  duplicate ids: {len(card.duplicate_ids)}, dangling targets: {len(card.dangling_targets)}")
@@ -0,0 +1,29 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+
+def build(rows: int, paragraphs: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.6,
+        body=[
+            TextBlock("Weekly report", style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            Container(items=[TextBlock("Lorem ipsum dolor sit amet. " * 40) for _ in range(paragraphs)], style=ContainerStyle(ContainerTheme.EMPHASIS)),
+            Table(rows=[
+                TableRow(cells=[TableCell(items=[TextBlock(f"Row {i}")]), TableCell(items=[TextBlock(f"{i * 7} items")])])
+                for i in range(rows)
+            ])
+        ],
+        actions=[ActionExecute("Approve", verb="approve")]
+    )
+
+for rows, paragraphs in ((20, 40), (400, 5), (400, 40)):
+    card = build(rows, paragraphs)
+    result = fit(card, HostProfile.TEAMS)
+    elapsed = min(timeit(lambda: fit(card, HostProfile.TEAMS), number=1) for _ in range(5))
+    encode = timeit(lambda: dumps(card.__dict__, separators=(",", ":")), number=20) / 20
+    edits = paragraphs + rows + 1
+
+    print(f"{rows:4} rows, {paragraphs:3} paragraphs ({len(card.to_bytes()) / 1000:6.1f} KB): {', '.join(result.applied) or 'nothing':32} "
+          f"-> {len(result.cards)} card(s) of {max(result.sizes) / 1000:4.1f} KB in {elapsed * 1e3:6.2f} ms "
+          f"(re-encoding after each of ~{edits} edits would add ~{encode * edits * 1e3:.0f} ms)")
@@ -0,0 +1,35 @@
+from adaptive_cards import *
+
+from time import perf_counter
+
+ELEMENTS = 100000
+
+samples = [
+    TextBlock("Hello", style=TextStyle(weight=FontWeight.BOLDER)).__dict__,
+    Image("https://example.com/image.png", alternate_text="Image").__dict__,
+    FactSet(facts=[Fact("Key", "Value")]).__dict__,
+    Container(items=[]).__dict__,
+    ActionSet(actions=[]).__dict__
+]
+elements = [samples[i % len(samples)] for i in range(ELEMENTS)]
+
+def legacy_from_dict(data: dict) -> AdaptiveCardMaterial:
+    data = data.copy()
+    data_type = data.pop("type")
+    instances = [sub.empty() for sub in AdaptiveCardMaterial.__subclasses__() if sub not in (AdaptiveCardAction, AdaptiveCardInput)]
+    instances = {instance.type.value: instance for instance in instances}
+    instances[data_type].update(**data)
+    return instances[data_type]
+
+def measure(parse) -> float:
+    start = perf_counter()
+    for element in elements:
+        parse(element)
+    return perf_counter() - start
+
+legacy = measure(legacy_from_dict)
+registry = measure(AdaptiveCardMaterial.from_dict)
+
+print(f"from_dict over {ELEMENTS} elements")
+print(f"  instantiate every subclass: {legacy:7.3f} s ({legacy / ELEMENTS * 1e6:6.2f} us/element)")
+print(f"  type registry:              {registry:7.3f} s ({registry / ELEMENTS * 1e6:6.2f} us/element, {legacy / registry:.1f}x)")
@@ -0,0 +1,36 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+
+ELEMENTS = 2000
+ROWS, COLUMNS = 200, 10
+
+blocks = [TextBlock(f"Line {i}", style=TextStyle(weight=FontWeight.BOLDER)) for i in range(ELEMENTS)]
+container_card = AdaptiveCard(body=[Container(items=blocks)])
+
+cells = [[TableCell(items=[TextBlock(f"{row}:{column}")]) for column in range(COLUMNS)] for row in range(ROWS)]
+table_card = AdaptiveCard(body=[Table(rows=[TableRow(cells=row) for row in cells])])
+
+def patch_block(i=[0]):
+    i[0] += 1
+    blocks[ELEMENTS // 2].update(text=f"Changed {i[0]}")
+
+def patch_cell(i=[0]):
+    i[0] += 1
+    cells[ROWS // 2][COLUMNS // 2].update(items=[TextBlock(f"Cell {i[0]}")])
+
+for name, card, patch in [
+    (f"Container with {ELEMENTS} TextBlocks", container_card, patch_block),
+    (f"Table with {ROWS}x{COLUMNS} cells", table_card, patch_cell)
+]:
+    card.to_json()
+    assert (patch() or card.to_json()) == dumps(card.__dict__)
+
+    number = 200
+    full = timeit(lambda: (patch(), dumps(card.__dict__)), number=number) / number
+    incremental = timeit(lambda: (patch(), card.to_json()), number=number) / number
+
+    print(name)
+    print(f"  update + json.dumps:   {full * 1e3:8.3f} ms")
+    print(f"  update + to_json():    {incremental * 1e3:8.3f} ms ({full / incremental:.1f}x)")
@@ -0,0 +1,46 @@
+from adaptive_cards import *
+
+from timeit import timeit
+import tracemalloc
+
+ELEMENTS = 10000
+
+def build(intern: bool) -> AdaptiveCard:
+    style = TextStyle.intern if intern else TextStyle
+    layout = TextLayout.intern if intern else TextLayout
+    fact = Fact.intern if intern else Fact
+
+    return AdaptiveCard(
+        body=[
+            Container(
+                items=[
+                    TextBlock(f"Row {i}", style=style(weight=FontWeight.BOLDER), layout=layout(spacing=MaterialSpacing.NONE)),
+                    FactSet(facts=[fact("Status", "Active"), fact("Owner", "Reporting")])
+                ],
+                style=ContainerStyle.intern(theme=ContainerTheme.EMPHASIS) if intern else ContainerStyle(theme=ContainerTheme.EMPHASIS)
+            )
+            for i in range(ELEMENTS // 3)
+        ]
+    )
+
+def measure(intern: bool) -> tuple[float, int]:
+    InternPool.shared.clear()
+    elapsed = min(timeit(lambda: build(intern), number=1) for _ in range(5))
+
+    InternPool.shared.clear()
+    tracemalloc.start()
+    card = build(intern)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(card.get("body")) == ELEMENTS // 3
+    return elapsed, size
+
+assert str(build(True)) == str(build(False))
+
+plain_time, plain_size = measure(False)
+interned_time, interned_size = measure(True)
+
+print(f"Building a card with {ELEMENTS} elements")
+print(f"  plain constructors: {plain_time * 1e3:8.1f} ms {plain_size / 1024 / 1024:7.2f} MiB")
+print(f"  interned mappings:  {interned_time * 1e3:8.1f} ms {interned_size / 1024 / 1024:7.2f} MiB")
+print(f"  pool: {InternPool.shared.hits} hits, {InternPool.shared.misses} misses")
@@ -0,0 +1,34 @@
+from adaptive_cards import *
+
+from json import loads
+from timeit import timeit
+
+ELEMENTS = 20000
+
+card = AdaptiveCard(
+    id="report",
+    body=[
+        Container(items=[TextBlock(f"Line {i}", style=TextStyle(weight=FontWeight.BOLDER)), Image(f"https://example.com/{i}.png")])
+        for i in range(ELEMENTS // 2)
+    ],
+    actions=[ActionExecute(title=f"Action {i}", verb=f"verb{i}") for i in range(5)]
+)
+payload = card.to_json()
+
+def inspect_hydrated():
+    parsed = AdaptiveCard.from_json(payload)
+    return parsed.id, [action["verb"] for action in parsed.get("actions")]
+
+def inspect_parsed():
+    parsed = loads(payload)
+    return parsed.get("id"), [action["verb"] for action in parsed["actions"]]
+
+def inspect_lazy():
+    parsed = LazyMaterial.from_json(payload)
+    return parsed.id, [action["verb"] for action in parsed["actions"]]
+
+assert inspect_hydrated() == inspect_parsed() == inspect_lazy()
+
+print(f"Reading id and actions[*].verb from a {len(payload) / 1024:.0f} KiB card with {ELEMENTS} elements")
+for name, inspect, number in [("from_json (typed tree)", inspect_hydrated, 3), ("json.loads (dicts)", inspect_parsed, 10), ("LazyMaterial", inspect_lazy, 10)]:
+    print(f"  {name:<24} {timeit(inspect, number=number) / number * 1e3:9.2f} ms")
@@ -0,0 +1,32 @@
+from adaptive_cards import *
+
+import tracemalloc
+
+COUNT = 20000
+
+class DictFact(Fact):
+    pass
+
+class DictInputChoice(InputChoice):
+    pass
+
+class DictPixels(Pixels):
+    pass
+
+def allocated(build) -> int:
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+print(f"Memory held by {COUNT} objects")
+for name, slotted, unslotted in [
+    ("Fact", lambda: [Fact(f"Title {i}", f"Value {i}") for i in range(COUNT)], lambda: [DictFact(f"Title {i}", f"Value {i}") for i in range(COUNT)]),
+    ("InputChoice", lambda: [InputChoice(f"Choice {i}") for i in range(COUNT)], lambda: [DictInputChoice(f"Choice {i}") for i in range(COUNT)]),
+    ("Pixels", lambda: [Pixels(i) for i in range(COUNT)], lambda: [DictPixels(i) for i in range(COUNT)])
+]:
+    before = allocated(unslotted)
+    after = allocated(slotted)
+    print(f"  {name:<12} with __dict__: {before / 1024:8.1f} KiB   slotted: {after / 1024:8.1f} KiB   (-{100 * (before - after) / before:.0f}%)")
@@ -0,0 +1,50 @@
+from adaptive_cards import *
+
+import sys
+from json import dumps, loads
+from timeit import timeit
+
+def report(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            TextBlock("Weekly report", style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            FactSet(facts=[Fact(f"Metric {i}", str(i * 7)) for i in range(5)], layout=FactSetLayout()),
+            Table(rows=[
+                TableRow(cells=[TableCell(items=[TextBlock(f"Row {i}", wrap=False)]), TableCell(items=[TextBlock(f"{i * 7} items")])])
+                for i in range(rows)
+            ])
+        ],
+        actions=[ActionSubmit("Approve"), ActionOpenUrl("Open", "https://example.com")]
+    )
+
+def form(fields: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.6,
+        body=[
+            Carousel(pages=[CarouselPage(items=[Image(f"https://example.com/{i}.png")]) for i in range(3)]),
+            *[InputText(f"field-{i}", label=f"Field {i}", layout=InputLayout()) for i in range(fields)],
+            InputToggle("agree", "I agree")
+        ],
+        actions=[ActionSubmit("Send"), ActionExecute("Save", verb="save")]
+    )
+
+corpus = {"report (10 rows)": report(10), "report (500 rows)": report(500), "form (5 fields)": form(5), "form (50 fields)": form(50)}
+
+for path in sys.argv[1:]:
+    with open(path) as file:
+        for index, line in enumerate(file):
+            if line.strip():
+                corpus[f"{path}:{index + 1}"] = AdaptiveCard.from_json(loads(line))
+
+totals = [0, 0, 0]
+for name, card in corpus.items():
+    encoded = len(str(card))
+    compact = len(dumps(card.__dict__, separators=(",", ":")))
+    minified = len(minify(card))
+    elapsed = timeit(lambda: minify(card), number=10) / 10
+    totals = [totals[0] + encoded, totals[1] + compact, totals[2] + minified]
+
+    print(f"{name:20}: str {encoded:8} B, compact {compact:8} B, minify {minified:8} B ({1 - minified / encoded:6.1%} smaller, {1 - minified / compact:6.1%} below compact) in {elapsed * 1e3:6.2f} ms")
+
+print(f"{'corpus':20}: str {totals[0]:8} B, compact {totals[1]:8} B, minify {totals[2]:8} B ({1 - totals[2] / totals[0]:6.1%} smaller, {1 - totals[2] / totals[1]:6.1%} below compact)")
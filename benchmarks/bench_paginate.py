@@ -0,0 +1,41 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+
+def build(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            TextBlock("Query results", style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            Table(rows=[
+                TableRow(cells=[TableCell(items=[TextBlock(f"Row {i}")]), TableCell(items=[TextBlock(f"{i * 7} items")])])
+                for i in range(rows)
+            ])
+        ]
+    )
+
+def trial_and_error(card: AdaptiveCard, budget: int) -> int:
+    data = card.__dict__
+    table = data["body"][1]
+    header, rows = table["rows"][:1], table["rows"][1:]
+    pages, page = 0, []
+
+    for row in rows:
+        candidate = dict(data, body=[data["body"][0], dict(table, rows=header + page + [row])])
+        if page and len(dumps(candidate)) > budget:
+            pages += 1
+            page = []
+        page.append(row)
+
+    return pages + 1
+
+for rows in (1000, 5000, 20000):
+    card = build(rows)
+    card.encoded_size
+
+    pages = paginate(card, 28000)
+    elapsed = min(timeit(lambda: paginate(card, 28000), number=1) for _ in range(3))
+    naive = timeit(lambda: trial_and_error(card, 28000), number=1)
+
+    print(f"{rows:6} rows ({card.encoded_size / 1000:7.1f} KB) -> {len(pages):3} cards: paginate {elapsed * 1e3:7.2f} ms, re-encoding every row {naive * 1e3:9.1f} ms")
@@ -0,0 +1,82 @@
+from adaptive_cards import *
+
+from timeit import repeat, timeit
+
+SECTIONS = 16667
+
+def section(i):
+    return {"type": "Container", "items": [
+        {"type": "TextBlock", "text": f"Section {i}"},
+        {"type": "Input.Text", "id": f"comment-{i}", "isRequired": i % 3 == 0},
+        {"type": "Image", "url": f"https://example.com/{i}.png", **({"altText": "Picture"} if i % 2 else {})},
+        {"type": "ActionSet", "actions": [{"type": "Action.Execute", "title": "Approve", "verb": "approve" if i % 5 else "reject"}]}
+    ]}
+
+card = {"type": "AdaptiveCard", "version": "1.6", "body": [
+    {"type": "Carousel", "pages": [{"type": "CarouselPage", "items": [section(i) for i in range(SECTIONS // 2)]}]},
+    *[section(i) for i in range(SECTIONS // 2, SECTIONS)]
+]}
+nodes = sum(1 for _ in iter_elements(card))
+
+FIELDS = ("body", "items", "pages", "actions", "columns", "rows", "cells", "card", "inlineAction", "selectAction", "images", "fallback")
+
+def children(node):
+    found = []
+    for field in FIELDS:
+        value = node.get(field)
+        if isinstance(value, list):
+            found.extend(value)
+        elif isinstance(value, dict):
+            found.append(value)
+    return found
+
+def required_inputs(node, found):
+    if node.get("type") == "Input.Text" and node.get("isRequired") is True:
+        found.append(node)
+    for child in children(node):
+        required_inputs(child, found)
+    return found
+
+def approvals_in_carousels(node, found, in_carousel=False):
+    if in_carousel and node.get("type") == "Action.Execute" and node.get("verb") == "approve":
+        found.append(node)
+    for child in children(node):
+        approvals_in_carousels(child, found, in_carousel or node.get("type") == "Carousel")
+    return found
+
+def images_without_alt_text(node, found):
+    if node.get("type") == "Image" and "altText" not in node:
+        found.append(node)
+    for child in children(node):
+        images_without_alt_text(child, found)
+    return found
+
+def by_hand():
+    return {
+        "required": required_inputs(card, []),
+        "executes": approvals_in_carousels(card, []),
+        "images": images_without_alt_text(card, [])
+    }
+
+QUERIES = {
+    "required": "Input.Text[isRequired=true]",
+    "executes": 'Carousel Action.Execute[verb="approve"]',
+    "images": "Image:not([altText])"
+}
+
+def by_selector():
+    return {name: select(card, query) for name, query in QUERIES.items()}
+
+expected = by_hand()
+assert all([id(node) for node in expected[name]] == [id(node) for node in by_selector()[name]] for name in QUERIES)
+
+hand = min(repeat(by_hand, number=1, repeat=5))
+selected = min(repeat(by_selector, number=1, repeat=5))
+compiled = timeit(lambda: Selector('Carousel Action.Execute[verb="approve"], Image:not([altText])'), number=1000) / 1000
+
+print(f"Running 3 queries over a card with {nodes} nodes")
+print(f"  hand-written recursion:  {hand / 3 * 1e3:8.1f} ms/query")
+print(f"  select():                {selected / 3 * 1e3:8.1f} ms/query ({hand / selected:.1f}x)")
+print(f"  compiling a selector:    {compiled * 1e6:8.1f} us (cached by compile_selector)")
+for name, query in QUERIES.items():
+    print(f"  {query:40} {len(expected[name])} matches")
@@ -0,0 +1,56 @@
+from adaptive_cards import *
+
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+ROWS = 50
+RECIPIENTS = 1000
+CHANNELS = 10
+
+template = CardTemplate(AdaptiveCard(
+    body=[
+        TextBlock("${title}", style=TextStyle(size=TextSize.MEDIUM, weight=FontWeight.BOLDER)),
+        Container(items=[
+            ColumnSet(columns=[
+                Column(items=[TextBlock(f"${{rows[{i}].name}}")]),
+                Column(items=[Image(f"${{rows[{i}].avatar}}", alternate_text=f"${{rows[{i}].name}}")])
+            ])
+            for i in range(ROWS)
+        ])
+    ],
+    actions=[ActionOpenUrl(title="View", url="${viewUrl}")]
+))
+
+channels = [
+    {
+        "title": f"Channel {channel}",
+        "viewUrl": f"https://example.com/channels/{channel}",
+        "rows": [{"name": f"Member {i}", "avatar": f"https://example.com/{i}.png"} for i in range(ROWS)]
+    }
+    for channel in range(CHANNELS)
+]
+recipients = [channels[i % CHANNELS] for i in range(RECIPIENTS)]
+
+def uncached():
+    for data in recipients:
+        template.render(data).encode()
+
+def cached(cache):
+    for data in recipients:
+        cache.render(template, data, host="teams", version="1.5")
+
+memory = RenderCache()
+assert memory.render(template, channels[0]) == template.render(channels[0]).encode()
+memory.clear()
+
+plain = timeit(uncached, number=1) / RECIPIENTS
+in_memory = timeit(lambda: cached(memory), number=1) / RECIPIENTS
+
+with TemporaryDirectory() as directory:
+    disk = RenderCache(DiskCacheBackend(directory, maxsize=1000))
+    on_disk = timeit(lambda: cached(disk), number=1) / RECIPIENTS
+
+print(f"Rendering a card for {RECIPIENTS} recipients sharing {CHANNELS} channel payloads")
+print(f"  CardTemplate.render():        {plain * 1e6:8.1f} us/card")
+print(f"  RenderCache (memory backend): {in_memory * 1e6:8.1f} us/card ({plain / in_memory:.1f}x), {memory.hits} hits, {memory.misses} misses")
+print(f"  RenderCache (disk backend):   {on_disk * 1e6:8.1f} us/card ({plain / on_disk:.1f}x), {disk.hits} hits, {disk.misses} misses")
@@ -0,0 +1,45 @@
+from adaptive_cards import *
+
+from json import dumps
+import resource
+import subprocess
+import sys
+import os
+
+ROWS, COLUMNS = 10000, 10
+
+def build_card() -> AdaptiveCard:
+    return AdaptiveCard(
+        body=[
+            Table(
+                rows=[
+                    TableRow(cells=[TableCell(items=[TextBlock(f"Row {row}, column {column}")]) for column in range(COLUMNS)])
+                    for row in range(ROWS)
+                ]
+            )
+        ]
+    )
+
+def peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def run(mode: str):
+    card = build_card()
+    built = peak_rss()
+
+    with open(os.devnull, "wb") as devnull:
+        if mode == "json.dumps":
+            devnull.write(dumps(card.__dict__).encode())
+        else:
+            card.write_to(devnull)
+
+    print(f"{built} {peak_rss()}")
+
+if len(sys.argv) > 1:
+    run(sys.argv[1])
+else:
+    print(f"Table with {ROWS * COLUMNS} cells")
+    for mode in ["json.dumps", "write_to"]:
+        output = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True, check=True).stdout
+        built, peak = map(int, output.split())
+        print(f"  {mode:<11} peak RSS {peak / 1024:8.1f} MiB (tree {built / 1024:.1f} MiB, encoding +{(peak - built) / 1024:.1f} MiB)")
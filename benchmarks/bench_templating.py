@@ -0,0 +1,68 @@
+from adaptive_cards import *
+
+from json import dumps
+from timeit import timeit
+import re
+
+BINDING = re.compile(r"\$\{([^{}]*)\}")
+
+def build_template(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        body=[
+            TextBlock("${title}", style=TextStyle(size=TextSize.MEDIUM, weight=FontWeight.BOLDER)),
+            Container(
+                items=[
+                    ColumnSet(
+                        columns=[
+                            Column(items=[TextBlock(f"${{rows[{i}].name}}", style=TextStyle(weight=FontWeight.BOLDER))]),
+                            Column(items=[TextBlock(f"Updated {{{{DATE(${{rows[{i}].updated}},SHORT)}}}}")]),
+                            Column(items=[Image(f"${{rows[{i}].avatar}}", alternate_text=f"${{rows[{i}].name}}")])
+                        ]
+                    )
+                    for i in range(rows)
+                ]
+            )
+        ],
+        actions=[ActionOpenUrl(title="View", url="${viewUrl}")]
+    )
+
+def lookup(data, path):
+    for key in re.findall(r"[^.\[\]]+", path):
+        data = data[int(key)] if key.isdigit() else data[key]
+    return data
+
+def naive_substitution(value, data):
+    if isinstance(value, dict):
+        return {key: naive_substitution(item, data) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [naive_substitution(item, data) for item in value]
+
+    if isinstance(value, str):
+        match = BINDING.fullmatch(value)
+        if match:
+            return lookup(data, match.group(1))
+        return BINDING.sub(lambda m: str(lookup(data, m.group(1))), value)
+
+    return value
+
+ROWS = 200
+card = build_template(ROWS)
+data = dict(
+    title="Weekly report",
+    viewUrl="https://example.com/report",
+    rows=[dict(name=f"User {i}", updated="2024-01-01T00:00:00Z", avatar=f"https://example.com/{i}.png") for i in range(ROWS)]
+)
+
+template = CardTemplate(card)
+assert template.render(data) == dumps(naive_substitution(card.__dict__, data))
+
+number = 200
+naive = timeit(lambda: dumps(naive_substitution(card.__dict__, data)), number=number) / number
+compiled = timeit(lambda: template.render(data), number=number) / number
+compilation = timeit(lambda: CardTemplate(card), number=20) / 20
+
+print(f"bindings per render:     {ROWS * 4 + 2}")
+print(f"compile (once):          {compilation * 1e3:8.3f} ms")
+print(f"naive substitution:      {naive * 1e3:8.3f} ms/render")
+print(f"CardTemplate.render:     {compiled * 1e3:8.3f} ms/render ({naive / compiled:.1f}x)")
@@ -0,0 +1,34 @@
+from adaptive_cards import *
+
+from timeit import timeit
+
+def build(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(
+        version=1.5,
+        body=[
+            TextBlock("Weekly report", style=TextStyle(size=TextSize.LARGE, weight=FontWeight.BOLDER)),
+            Container(items=[
+                ColumnSet(columns=[
+                    Column(items=[TextBlock(f"Row {i}", style=TextStyle(weight=FontWeight.BOLDER))], layout=ColumnLayout(width=ColumnWidth.AUTO)),
+                    Column(items=[Image(f"https://example.com/{i}.png", alternate_text="Avatar", layout=ImageLayout(size=ImageSize.SMALL))])
+                ])
+                for i in range(rows)
+            ], style=ContainerStyle(ContainerTheme.EMPHASIS)),
+            FactSet(facts=[Fact("Owner", "Ada"), Fact("Due", "Friday")]),
+            InputText("comment", label="Comment", multiline=True)
+        ],
+        actions=[ActionExecute("Approve", verb="approve"), ActionOpenUrl("Open", "https://example.com")]
+    )
+
+validator = CardValidator()
+for rows in (5, 50, 500):
+    card = build(rows)
+    nodes = sum(1 for _ in card.walk())
+    assert validator.validate(card) == []
+
+    number = max(10, 20000 // nodes)
+    elapsed = timeit(lambda: validator.validate(card), number=number) / number
+    print(f"Validating a card with {nodes:5} nodes: {elapsed * 1e6:9.1f} us/card ({elapsed / nodes * 1e6:.2f} us/node)")
+
+compiled = timeit(lambda: CardValidator(version="1.4").validate(build(5)), number=1)
+print(f"First validation for a new version, including compilation: {compiled * 1e3:.2f} ms")
@@ -0,0 +1,16 @@
+from adaptive_cards import *
+
+from json import loads
+
+def test_render_cache_downgrades_for_the_target():
+    template = CardTemplate(AdaptiveCard(version=1.6, body=[TextBlock("${name}"), Table(rows=[TableRow(cells=[TableCell(items=[TextBlock("Cell")])])])]))
+    cache = RenderCache()
+
+    latest = loads(cache.render(template, {"name": "Ada"}))
+    older = loads(cache.render(template, {"name": "Ada"}, version="1.2"))
+    webex = loads(cache.render(template, {"name": "Ada"}, host="webex"))
+
+    assert latest["version"] == "1.6" and latest["body"][1]["type"] == "Table"
+    assert older["version"] == "1.2" and older["body"][1]["type"] == "Container"
+    assert webex == loads(cache.render(template, {"name": "Ada"}, host=HostProfile.WEBEX))
+    assert cache.misses == 3 and cache.hits == 1
@@ -0,0 +1,29 @@
+from adaptive_cards import *
+
+import pytest
+
+
+def test_round_trip_of_dictionaries_is_exact():
+    stored = {"type": "AdaptiveCard", "version": "1.2", "body": [{"type": "TextBlock", "text": "Plain"}], "actions": [{"type": "Action.Submit", "title": "OK"}]}
+    assert decompress_card(compress_card(stored)) == stored
+
+def test_round_trip_of_materials_is_exact():
+    card = downgrade(AdaptiveCard(version=1.5, body=[TextBlock("Title")], actions=[ActionSubmit("OK")]), "1.2")
+    restored = decompress_card(compress_card(card))
+
+    assert restored == card.__dict__
+    assert AdaptiveCard.from_json(restored) == card
+    assert validate(AdaptiveCard.from_json(restored), "1.2") == []
+
+def test_trained_dictionaries_are_needed_to_decompress():
+    cards = [AdaptiveCard(body=[TextBlock(f"Report {index}"), FactSet(facts=[Fact("Owner", "Reporting")])]) for index in range(20)]
+    dictionary = train_dictionary(cards, 7)
+    payload = compress_card(cards[0], dictionary)
+
+    assert decompress_card(payload, [dictionary]) == cards[0].__dict__
+
+    with pytest.raises(KeyError):
+        decompress_card(payload)
+
+    with pytest.raises(ValueError):
+        decompress_card(b"")
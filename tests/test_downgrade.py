@@ -0,0 +1,59 @@
+from adaptive_cards import *
+
+from json import dumps
+import gc
+import weakref
+
+
+def build() -> AdaptiveCard:
+    return AdaptiveCard(version=1.6, body=[
+        Container(items=[TextBlock("Title", id="title")]),
+        Table(rows=[TableRow(cells=[TableCell(items=[TextBlock("Cell", id="cell")])])])
+    ])
+
+def test_downgraded_cards_can_be_changed():
+    card = build()
+    older = downgrade(card, "1.2")
+
+    older.find_by_id("title").update(text="Changed")
+    older.find_by_id("cell").update(text="Changed")
+    assert older.to_json() == dumps(older.__dict__)
+    assert older.encoded_size == len(dumps(older.__dict__))
+    assert downgrade(card, "1.2").find_by_id("title").get("text") == "Title"
+
+def test_cache_follows_card_content():
+    card = build()
+    assert downgrade(card, "1.2").find_by_id("title").get("text") == "Title"
+
+    card.find_by_id("title").update(text="Changed")
+    assert downgrade(card, "1.2").find_by_id("title").get("text") == "Changed"
+
+def test_cache_does_not_keep_cards_alive():
+    card = build()
+    downgrade(card, "1.4")
+    reference = weakref.ref(card)
+
+    del card
+    gc.collect()
+    assert reference() is None
+
+def test_deep_clone_shares_nothing():
+    card = build()
+    copy = card.clone(deep=True)
+
+    card.find_by_id("title").update(text="Original")
+    copy.find_by_id("title").update(text="Copy")
+    assert card.find_by_id("title").get("text") == "Original"
+    assert copy.to_json() == dumps(copy.__dict__)
+    assert copy.encoded_size == len(dumps(copy.__dict__))
+
+def test_deeply_nested_cards_are_downgraded_without_recursion():
+    node = {"type": "Table", "rows": []}
+    for _ in range(5000):
+        node = {"type": "Container", "items": [node]}
+    card = AdaptiveCard.from_json({"type": "AdaptiveCard", "version": "1.5", "body": [node]})
+
+    older = downgrade(card, "1.2")
+    assert older.get("version") == "1.2"
+    assert [item.type for item in older.walk(MaterialType.TABLE)] == []
+    assert fit(card, HostProfile("Deep", "1.3", 10 ** 6)).cards[0].get("version") == "1.3"
@@ -0,0 +1,40 @@
+from adaptive_cards import *
+
+import pytest
+
+
+def row(index: int) -> TableRow:
+    return TableRow(cells=[TableCell(items=[TextBlock(f"Row {index} " + "x" * 40)]), TableCell(items=[TextBlock(str(index))])])
+
+def report(rows: int, oversized: int=-1) -> AdaptiveCard:
+    return AdaptiveCard(version=1.5, body=[
+        TextBlock("Report"),
+        Table(rows=[
+            TableRow(cells=[TableCell(items=[TextBlock("word " * 30) for _ in range(300)])]) if index == oversized else row(index)
+            for index in range(rows)
+        ])
+    ])
+
+def test_fit_splits_tables_after_downgrade():
+    result = fit(report(300), HostProfile.WEBEX)
+    assert "tables" in result.applied and len(result.cards) > 1
+    assert result.sizes == [len(payload) for payload in result.payloads]
+    assert all(size <= HostProfile.WEBEX.max_size for size in result.sizes)
+
+    tables = [card.get("body")[-1] for card in result.cards]
+    assert all(table["type"] == "Container" and table["items"][0].get("style") == "emphasis" for table in tables)
+    assert sum(len(table["items"]) for table in tables) == 300 + len(tables) - 1
+
+def test_fit_splits_native_tables():
+    result = fit(report(300), HostProfile.TEAMS)
+    tables = [card.get("body")[-1] for card in result.cards]
+    assert len(result.cards) > 1 and all(table["type"] == "Table" for table in tables)
+    assert all(size <= HostProfile.TEAMS.max_size for size in result.sizes)
+    assert sum(len(table["rows"]) for table in tables) == 300 + len(tables) - 1
+
+def test_fit_rejects_rows_larger_than_the_budget():
+    with pytest.raises(ValueError):
+        fit(report(800, oversized=700), HostProfile.TEAMS)
+
+    with pytest.raises(ValueError):
+        fit(report(800, oversized=700), HostProfile.WEBEX)
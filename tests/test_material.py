@@ -0,0 +1,210 @@
+from adaptive_cards import *
+
+from json import dumps
+
+import pytest
+
+
+def build() -> AdaptiveCard:
+    return AdaptiveCard(
+        body=[
+            TextBlock("Title", id="title"),
+            Container(id="details", items=[
+                ColumnSet(columns=[
+                    Column(items=[TextBlock("Left", id="left")]),
+                    Column(items=[TextBlock("Right", id="right")])
+                ]),
+                FactSet(facts=[Fact("Status", "Open")])
+            ])
+        ],
+        actions=[ActionSubmit("OK")]
+    )
+
+def assert_consistent(card: AdaptiveCardMaterial):
+    encoded = dumps(card.__dict__)
+    assert card.to_json() == encoded
+    assert str(card) == encoded
+    assert card.to_bytes() == encoded.encode()
+    assert "".join(card.iter_json(16)) == encoded
+    assert card.encoded_size == len(encoded)
+    assert card.compact_size == len(dumps(card.__dict__, separators=(",", ":")))
+    assert card.content_hash == AdaptiveCardMaterial.digest(card.__dict__)
+
+def test_nested_update_invalidates_every_cache():
+    card = build()
+    assert_consistent(card)
+
+    card.find_by_id("right").update(text="Changed", weight="Bolder")
+    assert_consistent(card)
+
+    card.find_by_id("details").update(style="emphasis")
+    assert_consistent(card)
+
+def test_structural_update_invalidates_every_cache():
+    card = build()
+    assert_consistent(card)
+
+    details = card.find_by_id("details")
+    details.update(items=[TextBlock("Only", id="only")])
+    assert_consistent(card)
+
+    card.find_by_id("only").update(text="Edited")
+    assert_consistent(card)
+    assert card.find_by_id("left") is None
+
+def test_using_and_when_invalidate_every_cache():
+    card = build()
+    assert_consistent(card)
+
+    card.find_by_id("left").using("${items}")
+    card.find_by_id("right").when("${show}")
+    assert_consistent(card)
+
+def test_repeated_child_invalidates_every_cache():
+    repeated = TextBlock("Repeated")
+    card = AdaptiveCard(body=[repeated, Container(items=[repeated]), repeated])
+    assert_consistent(card)
+
+    repeated.update(text="Changed in three places")
+    assert_consistent(card)
+
+def test_equal_content_is_equal():
+    card = build()
+    other = build()
+    assert card == other and hash(card) == hash(other)
+
+    card.find_by_id("left").update(text="Changed")
+    assert card != other
+
+    other.find_by_id("left").update(text="Changed")
+    assert card == other and hash(card) == hash(other)
+
+def test_id_index_follows_updates():
+    card = build()
+    left = card.find_by_id("left")
+
+    left.update(id="renamed")
+    assert card.find_by_id("left") is None
+    assert card.find_by_id("renamed") is left
+
+    card.find_by_id("details").update(items=[TextBlock("New", id="new")])
+    assert card.find_by_id("renamed") is None
+    assert card.find_by_id("new") is not None
+
+def test_placed_mappings_are_read_only():
+    fact = Fact("Status", "Open")
+    card = AdaptiveCard(body=[FactSet(facts=[fact])])
+    encoded = str(card)
+
+    with pytest.raises(TypeError):
+        fact.using("${items}")
+
+    with pytest.raises(TypeError):
+        fact.when("${show}")
+
+    assert str(card) == encoded
+    assert_consistent(card)
+
+def test_mappings_can_be_bound_before_placing():
+    card = AdaptiveCard(body=[FactSet(facts=[Fact("${key}", "${value}").using("${items}")])])
+    assert card.get("body")[0]["facts"][0]["$data"] == "${items}"
+    assert_consistent(card)
+
+def test_interned_mappings_are_read_only():
+    fact = Fact.intern("Status", "Open")
+    assert Fact.intern("Status", "Open") is fact
+
+    with pytest.raises(TypeError):
+        fact.using("${items}")
+
+def test_intern_pool_keeps_value_types_apart():
+    pool = InternPool()
+    assert pool.get(TextLayout, separator=1) is not pool.get(TextLayout, separator=True)
+    assert str(pool.get(TextLayout, separator=True)) == '{"separator": true}'
+    assert pool.get(Pixels, 1) is not pool.get(Pixels, 1.0)
+    assert pool.get(Pixels, 1) is pool.get(Pixels, 1)
+
+def test_variants_share_untouched_nodes():
+    card = build()
+    variant = card.evolve("/body/0", text="Variant")
+    assert card.find_by_id("title").get("text") == "Title"
+    assert variant.find_by_id("title").get("text") == "Variant"
+    assert_consistent(card)
+    assert_consistent(variant)
+
+    with pytest.raises(TypeError):
+        card.find_by_id("left").update(text="Changed")
+
+def test_discarded_variants_release_shared_nodes():
+    card = build()
+    left = card.find_by_id("left")
+
+    card.clone()
+    card.evolve("/body/0", text="Variant")
+    left.update(text="Changed")
+    assert_consistent(card)
+
+    variants = [card.evolve("/body/0", text=str(index)) for index in range(100)]
+    with pytest.raises(TypeError):
+        left.update(text="Blocked")
+
+    del variants
+    left.update(text="Released")
+    assert_consistent(card)
+
+def test_discarded_variants_do_not_accumulate_parents():
+    card = build()
+    for index in range(1000):
+        card.evolve("/body/0", text=str(index))
+
+    assert len(card.find_by_id("details")._AdaptiveCardMaterial__parents) < 16
+
+def test_repeated_placement_in_one_card_is_not_shared():
+    repeated = TextBlock("Repeated")
+    card = AdaptiveCard(body=[Container(items=[repeated]), Container(items=[repeated])])
+
+    repeated.update(text="Changed")
+    assert_consistent(card)
+
+def test_deeply_nested_cards_are_encoded_without_recursion():
+    node = TextBlock("Leaf", id="leaf")
+    for _ in range(400):
+        node = Container(items=[node])
+    card = AdaptiveCard(body=[node])
+
+    assert_consistent(card)
+    assert card == card.clone() and hash(card) == hash(card.clone())
+
+    card.find_by_id("leaf").update(text="Changed")
+    assert_consistent(card)
+
+def test_mapping_subclasses_without_slots_keep_their_data():
+    class Payload(MaterialMapping):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+
+    card = AdaptiveCard(actions=[ActionSubmit("OK", data=Payload(order=42))])
+    assert card.get("actions")[0]["data"] == {"order": 42}
+    assert_consistent(card)
+
+def test_from_json_keeps_exactly_the_stored_properties():
+    stored = {
+        "type": "AdaptiveCard",
+        "version": "1.6",
+        "body": [
+            {"type": "TextBlock", "text": "Plain"},
+            {"type": "Carousel", "pages": [{"type": "CarouselPage", "items": [{"type": "Image", "url": "https://example.com/a.png"}]}]},
+            {"type": "Table", "rows": [{"type": "TableRow", "cells": [{"type": "TableCell", "items": []}]}]},
+            {"type": "Input.Text", "id": "comment", "isVisible": True},
+            {"type": "ColumnSet", "columns": [{"type": "Column", "items": [{"type": "Input.Toggle", "id": "agree", "title": "I agree"}]}]}
+        ],
+        "actions": [
+            {"type": "Action.Submit", "title": "OK"},
+            {"type": "Action.ShowCard", "card": {"type": "AdaptiveCard", "body": []}}
+        ]
+    }
+
+    card = AdaptiveCard.from_json(dumps(stored))
+    assert card.__dict__ == stored
+    assert card.to_json() == dumps(stored)
+    assert_consistent(card)
@@ -0,0 +1,42 @@
+from adaptive_cards import *
+
+from json import loads
+
+
+PAYLOAD = {"type": "TextBlock", "separator": False, "spacing": "default", "nested": [{"type": "Container", "bleed": False}]}
+
+def build() -> dict:
+    return {
+        "type": "AdaptiveCard",
+        "version": "1.5",
+        "body": [{
+            "type": "Container",
+            "items": [{"type": "TextBlock", "text": "Title", "separator": False}],
+            "selectAction": {"type": "Action.Submit", "data": PAYLOAD}
+        }],
+        "actions": [{"type": "Action.Submit", "title": "OK", "data": PAYLOAD}]
+    }
+
+def test_minify_keeps_user_payloads():
+    for card in (build(), AdaptiveCard.from_json(build())):
+        minified = loads(minify(card))
+        assert minified["actions"][0]["data"] == PAYLOAD
+        assert minified["body"][0]["selectAction"]["data"] == PAYLOAD
+        assert "separator" not in minified["body"][0]["items"][0]
+
+def test_fit_keeps_user_payloads():
+    result = fit(build(), HostProfile.TEAMS)
+    card = loads(result.payloads[0])
+    assert card["actions"][0]["data"] == PAYLOAD
+    assert card["body"][0]["selectAction"]["data"] == PAYLOAD
+    assert "separator" not in card["body"][0]["items"][0]
+
+def test_deeply_nested_cards_are_minified_without_recursion():
+    node = {"type": "TextBlock", "text": "Leaf", "separator": False}
+    for _ in range(5000):
+        node = {"type": "Container", "items": [node], "bleed": False}
+    card = AdaptiveCard.from_json({"type": "AdaptiveCard", "version": "1.5", "body": [node]})
+
+    minified = minify(card)
+    assert '"bleed"' not in minified and '"separator"' not in minified
+    assert minified.count('"type":"Container"') == 5000
@@ -0,0 +1,55 @@
+from adaptive_cards import *
+
+import pytest
+
+
+def report(rows: int) -> AdaptiveCard:
+    return AdaptiveCard(version=1.5, body=[
+        Container(id="report", items=[
+            TextBlock("Report", id="title"),
+            Table(id="table", rows=[TableRow(cells=[TableCell(items=[TextBlock(f"Row {index} " + "x" * 40)])]) for index in range(rows)])
+        ])
+    ])
+
+def rows(pages: list) -> list:
+    return [row for page in pages for row in page.find_by_id("table").get("rows")]
+
+def test_default_selection_finds_a_nested_table():
+    card = report(400)
+    pages = paginate(card, 10000)
+
+    assert len(pages) > 1 and all(page.encoded_size <= 10000 for page in pages)
+    assert all(page.find_by_id("title") is not None for page in pages)
+    assert all(page.find_by_id("table").get("rows")[0] == card.find_by_id("table").get("rows")[0] for page in pages)
+    assert len(rows(pages)) == 400 + len(pages) - 1
+
+def test_small_elements_are_split_as_a_whole():
+    card = AdaptiveCard(version=1.5, body=[Container(id="list", items=[TextBlock(f"Item {index}") for index in range(200)])])
+    pages = paginate(card, 2000)
+
+    assert all(page.encoded_size <= 2000 for page in pages)
+    assert sum(len(page.find_by_id("list").get("items")) for page in pages) == 200
+
+def test_elements_can_be_chosen_by_id():
+    card = report(100)
+    pages = paginate(card, 6000, element="table", compact=True)
+
+    assert all(page.compact_size <= 6000 for page in pages)
+    assert len(rows(pages)) == 100 + len(pages) - 1
+
+def test_carousel_keeps_one_card():
+    card = report(100)
+    pages = paginate(card, 6000, element="table", carousel=True)
+
+    assert len(pages) == 1 and pages[0].get("version") == "1.6"
+    carousel = pages[0].walk(MaterialType.CAROUSEL)
+    assert len(next(carousel).get("pages")) > 1
+
+def test_items_larger_than_the_budget_raise():
+    card = AdaptiveCard(version=1.5, body=[Container(items=[TextBlock("x" * 5000), TextBlock("y")])])
+
+    with pytest.raises(ValueError):
+        paginate(card, 2000)
+
+    with pytest.raises(ValueError):
+        paginate(AdaptiveCard(body=[TextBlock("Only text")]), 2000)
@@ -0,0 +1,74 @@
+from adaptive_cards import *
+
+from json import dumps
+
+import pytest
+
+
+def build() -> AdaptiveCard:
+    return AdaptiveCard(version=1.5, body=[
+        TextBlock("Title", id="title"),
+        Container(id="details", items=[TextBlock("Left", id="left"), TextBlock("Right", id="right")])
+    ], actions=[ActionSubmit("OK", data={"count": 1})])
+
+def stored(text: str, *extra: dict) -> dict:
+    return {"type": "AdaptiveCard", "version": "1.5", "body": [{"type": "TextBlock", "text": text}, *extra]}
+
+def test_patch_turns_old_into_new():
+    old = build()
+    new = old.evolve("/body/1/items/0", text="Changed").evolve("/body/1/items/1", weight="Bolder")
+    new.update(actions=[ActionSubmit("OK", data={"count": 2}), ActionSubmit("Cancel")])
+
+    patched = apply_patch(old, diff(old, new))
+    assert patched == new and patched.__dict__ == new.__dict__
+    assert old.find_by_id("left").get("text") == "Left"
+
+def test_patch_of_stored_cards_is_exact():
+    old = AdaptiveCard.from_json(stored("Before"))
+    new = AdaptiveCard.from_json(stored("After", {"type": "Image", "url": "https://example.com/a.png"}))
+
+    patched = apply_patch(old, diff(old, new))
+    assert patched.__dict__ == new.__dict__
+    assert apply_patch(stored("Before"), diff(stored("Before"), new)) == new.__dict__
+
+def test_patch_keeps_downgraded_cards_valid():
+    old = downgrade(build(), "1.2")
+    patched = apply_patch(old, [{"op": "replace", "path": "/body/0/text", "value": "Patched"}])
+
+    assert patched.get("body")[0]["text"] == "Patched"
+    assert validate(patched, "1.2") == []
+    assert dumps(patched.get("actions")) == dumps(old.get("actions"))
+
+def test_unchanged_cards_have_an_empty_patch():
+    card = build()
+    assert diff(card, card.clone()) == []
+    assert diff(card, build()) == []
+
+def test_test_operations_compare_numbers_by_value():
+    card = {"type": "AdaptiveCard", "version": "1.5", "body": [], "minHeight": 1, "metadata": {"values": [1, 2.5]}}
+
+    apply_patch(card, [{"op": "test", "path": "/minHeight", "value": 1.0}])
+    apply_patch(card, [{"op": "test", "path": "/metadata", "value": {"values": [1.0, 2.5]}}])
+
+    with pytest.raises(ValueError):
+        apply_patch(card, [{"op": "test", "path": "/minHeight", "value": True}])
+
+    with pytest.raises(ValueError):
+        apply_patch(card, [{"op": "test", "path": "/metadata/values", "value": [1, 2.5, 3]}])
+
+def test_invalid_patches_are_rejected():
+    card = stored("Title")
+
+    with pytest.raises(ValueError):
+        apply_patch(card, [{"op": "move", "from": "/body", "path": "/body/0"}])
+
+    with pytest.raises(ValueError):
+        apply_patch(card, [{"op": "rename", "path": "/body"}])
+
+    with pytest.raises(ValueError):
+        apply_patch(card, [{"op": "add", "path": "/body/0"}])
+
+    with pytest.raises(KeyError):
+        apply_patch(card, [{"op": "remove", "path": "/body/3"}])
+
+    assert card == stored("Title")
@@ -0,0 +1,83 @@
+from adaptive_cards import *
+
+import pytest
+
+
+def build() -> AdaptiveCard:
+    return AdaptiveCard(version=1.5, body=[
+        TextBlock("Title", id="title"),
+        Container(id="details", items=[
+            TextBlock("Inside", id="inside"),
+            ColumnSet(id="columns", columns=[Column(id="left", items=[TextBlock("Nested", id="nested")])]),
+            Image("https://example.com/a.png", id="image")
+        ]),
+        InputToggle("agree", "I agree")
+    ], actions=[ActionSubmit("OK", id="ok"), ActionOpenUrl("Open", "https://example.com", id="open")])
+
+def ids(nodes: list) -> list:
+    return [node.id for node in nodes]
+
+def test_types_and_universal_selectors():
+    card = build()
+    assert ids(select(card, "TextBlock")) == ["title", "inside", "nested"]
+    assert len(select(card, "*")) == len(list(card.walk()))
+    assert ids(select(card, "Image, Action.Submit")) == ["image", "ok"]
+    assert select_first(card, "Column").id == "left"
+    assert select_first(card, "Table") is None
+
+def test_attribute_operators():
+    card = build()
+    assert ids(select(card, "[url]")) == ["image", "open"]
+    assert ids(select(card, "TextBlock[text=Inside]")) == ["inside"]
+    assert ids(select(card, "TextBlock[text!='Inside']")) == ["title", "nested"]
+    assert ids(select(card, "[id^=in]")) == ["inside"]
+    assert ids(select(card, '[id$="ed"]')) == ["nested"]
+    assert ids(select(card, "[url*=example]")) == ["image", "open"]
+
+def test_values_keep_their_json_type():
+    card = AdaptiveCard(version=1.5, body=[Container(id="plain"), Container(id="hidden", visible=False)])
+    assert ids(select(card, "[isVisible=false]")) == ["hidden"]
+    assert select(card, "[isVisible=0]") == []
+    assert ids(select(card, "Container:not([isVisible=false])")) == ["plain"]
+
+def test_combinators():
+    card = build()
+    assert ids(select(card, "Container TextBlock")) == ["inside", "nested"]
+    assert ids(select(card, "Container > TextBlock")) == ["inside"]
+    assert ids(select(card, "Container>ColumnSet > Column TextBlock")) == ["nested"]
+    assert ids(select(card, "AdaptiveCard > TextBlock")) == ["title"]
+    assert select(card, "Column > Container") == []
+
+def test_negation():
+    card = build()
+    assert ids(select(card, "TextBlock:not([id=inside])")) == ["title", "nested"]
+    assert ids(select(card, "Container *:not(TextBlock, Column)")) == ["columns", "image"]
+
+def test_matches_uses_the_given_ancestors():
+    card = build()
+    selector = compile_selector("Container > TextBlock")
+    inside = card.find_by_id("inside")
+
+    assert selector.matches(inside, [card, card.find_by_id("details")])
+    assert not selector.matches(inside)
+    assert compile_selector("TextBlock").matches(inside)
+    assert compile_selector("TextBlock") is compile_selector("TextBlock")
+
+def test_plain_dictionaries_can_be_queried():
+    card = build().__dict__
+    assert [node["id"] for node in select(card, "Container > TextBlock")] == ["inside"]
+
+@pytest.mark.parametrize("selector", [
+    "Unknown", "TextBlock[", "TextBlock[text=]", "TextBlock[text~=a]", "TextBlock)", "TextBlock#title",
+    ":not(Container TextBlock)", "TextBlock:not([id=a]", "Container >", ","
+])
+def test_invalid_selectors_raise(selector: str):
+    with pytest.raises(ValueError):
+        Selector(selector)
+
+def test_non_string_selectors_raise():
+    with pytest.raises(TypeError):
+        Selector(None)
+
+    with pytest.raises(TypeError):
+        select([], "TextBlock")
@@ -0,0 +1,99 @@
+from adaptive_cards import *
+
+from json import loads
+
+
+def card(*body: dict, **properties) -> dict:
+    return {"type": "AdaptiveCard", "version": "1.5", "body": list(body), **properties}
+
+def text(value: str, **properties) -> dict:
+    return {"type": "TextBlock", "text": value, **properties}
+
+def test_data_expands_one_element_per_item():
+    template = CardTemplate(AdaptiveCard(version=1.5, body=[
+        TextBlock("Team ${team}"),
+        Container(items=[TextBlock("${name}").using("${people}")])
+    ]))
+
+    rendered = loads(template.render({"team": "Core", "people": [{"name": "Ada"}, {"name": "Grace"}, {"name": "Linus"}]}))
+    assert rendered["body"][0]["text"] == "Team Core"
+    assert [item["text"] for item in rendered["body"][1]["items"]] == ["Ada", "Grace", "Linus"]
+    assert all("$data" not in item for item in rendered["body"][1]["items"])
+
+def test_index_and_root_are_available_inside_repeated_elements():
+    template = CardTemplate(card(text("${$index}: ${name} of ${$root.team}", **{"$data": "${people}"})))
+    rendered = loads(template.render({"team": "Core", "people": [{"name": "Ada"}, {"name": "Grace"}]}))
+    assert [item["text"] for item in rendered["body"]] == ["0: Ada of Core", "1: Grace of Core"]
+
+def test_data_objects_change_the_scope():
+    template = CardTemplate(card(text("${name}", **{"$data": "${owner}"})))
+    assert loads(template.render({"owner": {"name": "Ada"}}))["body"] == [text("Ada")]
+    assert loads(template.render({}))["body"] == []
+
+def test_when_drops_elements():
+    template = CardTemplate(card(
+        text("Always"),
+        text("Shown", **{"$when": "${show}"}),
+        text("${name}", **{"$data": "${items}", "$when": "${count > 2 && !archived}"})
+    ))
+
+    rendered = loads(template.render({"show": False, "items": [{"name": "a", "count": 3}, {"name": "b", "count": 1}, {"name": "c", "count": 5, "archived": True}]}))
+    assert [item["text"] for item in rendered["body"]] == ["Always", "a"]
+
+    rendered = loads(template.render({"show": True, "items": []}))
+    assert [item["text"] for item in rendered["body"]] == ["Always", "Shown"]
+
+def test_whole_value_bindings_keep_their_type():
+    template = CardTemplate(card(text("${title}"), metadata="${metadata}", minHeight="${height}"))
+    rendered = loads(template.render({"title": 42, "metadata": {"tags": ["a", "b"]}, "height": 3.5}))
+
+    assert rendered["body"][0]["text"] == 42
+    assert rendered["metadata"] == {"tags": ["a", "b"]}
+    assert rendered["minHeight"] == 3.5
+
+def test_bindings_inside_strings_are_formatted():
+    template = CardTemplate(card(text("Hello ${name}, you have ${count} ${if(count == 1, 'task', 'tasks')} and ${toUpper(role)} rights")))
+    rendered = loads(template.render({"name": "Ada", "count": 1, "role": "admin"}))
+    assert rendered["body"][0]["text"] == "Hello Ada, you have 1 task and ADMIN rights"
+
+def test_unsupported_and_unresolved_bindings_are_left_as_written():
+    template = CardTemplate(card(
+        text("${missing}"),
+        text("Total: ${formatNumber(total, 2)}"),
+        text("${name} owes ${sub(total, paid)}"),
+        text("Kept", **{"$when": "${formatNumber(total, 2)}"})
+    ))
+
+    rendered = loads(template.render({"name": "Ada", "total": 10, "paid": 3}))
+    assert [item["text"] for item in rendered["body"]] == ["${missing}", "Total: ${formatNumber(total, 2)}", "Ada owes ${sub(total, paid)}", "Kept"]
+    assert rendered["body"][3]["$when"] == "${formatNumber(total, 2)}"
+
+def test_static_templates_render_unchanged():
+    static = card(text("Plain"), text("No ${ bindings"))
+    assert loads(CardTemplate(static).render({})) == static
+
+def test_iter_render_streams_chunks():
+    template = CardTemplate(card(text("${name}", **{"$data": "${rows}"})))
+    data = {"rows": [{"name": f"Row {index}"} for index in range(200)]}
+    chunks = list(template.iter_render(data, chunk_size=256))
+
+    assert len(chunks) > 1 and all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert "".join(chunks) == template.render(data)
+
+    consumed = []
+    def rows():
+        for index in range(3):
+            consumed.append(index)
+            yield {"name": f"Row {index}"}
+
+    stream = template.iter_render({"rows": rows()}, chunk_size=1)
+    first = next(stream)
+    assert len(consumed) < 3
+
+    rendered = loads(first + "".join(stream))
+    assert consumed == [0, 1, 2] and len(rendered["body"]) == 3
+
+def test_templates_of_materials_share_their_etag():
+    built = AdaptiveCard(version=1.5, body=[TextBlock("${title}")])
+    assert CardTemplate(built).etag == built.etag
+    assert CardTemplate(built.__dict__).etag == built.etag
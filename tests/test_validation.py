@@ -0,0 +1,50 @@
+from adaptive_cards import *
+
+import pytest
+
+
+def card(version: str, *body: dict, **properties) -> dict:
+    return {"type": "AdaptiveCard", "version": version, "body": list(body), **properties}
+
+def pointers(errors: list) -> list:
+    return [error.pointer for error in errors]
+
+def test_valid_cards_have_no_errors():
+    built = AdaptiveCard(version=1.5, body=[
+        TextBlock("Title"),
+        Container(items=[ColumnSet(columns=[Column(items=[Image("https://example.com/a.png")])])]),
+        Table(rows=[TableRow(cells=[TableCell(items=[TextBlock("Cell")])])])
+    ], actions=[ActionSubmit("OK")])
+
+    assert validate(built) == []
+    assert CardValidator("1.6").is_valid(built)
+
+def test_structural_errors_are_reported():
+    assert pointers(validate(card("1.5", {"type": "Unknown"}))) == ["/body/0"]
+    assert pointers(validate(card("1.5", {"text": "No type"}))) == ["/body/0"]
+    assert pointers(validate(card("1.5", {"type": "TableCell", "items": []}))) == ["/body/0"]
+    assert pointers(validate(card("1.5", {"type": "TextBlock"}))) == ["/body/0"]
+    assert pointers(validate(card("1.5", {"type": "TextBlock", "text": "Text", "weight": "Heavy"}))) == ["/body/0/weight"]
+    assert pointers(validate({"type": "AdaptiveCard", "body": []})) == [""]
+    assert pointers(validate(card("latest"))) == ["/version"]
+
+def test_newer_types_and_properties_than_declared_are_reported():
+    assert pointers(validate(card("1.2", {"type": "Table", "rows": []}))) == ["/body/0"]
+    assert pointers(validate(card("1.2", {"type": "TextBlock", "text": "Text", "style": "heading"}))) == ["/body/0/style"]
+    assert validate(card("1.5", {"type": "Table", "rows": []})) == []
+
+def test_host_version_does_not_replace_the_declared_version():
+    assert pointers(validate(card("1.2", {"type": "Table", "rows": []}), version="1.5")) == ["/body/0"]
+    assert pointers(validate(card("1.5", {"type": "Table", "rows": []}), version="1.4")) == ["/version", "/body/0"]
+
+def test_excluded_types_are_reported():
+    media = card("1.5", {"type": "Media", "sources": [{"url": "https://example.com/a.mp4"}]})
+    assert validate(media, "1.5") == []
+    assert pointers(validate(media, "1.5", exclude_types=[MaterialType.MEDIA])) == ["/body/0"]
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        CardValidator("latest")
+
+    with pytest.raises(TypeError):
+        validate([])